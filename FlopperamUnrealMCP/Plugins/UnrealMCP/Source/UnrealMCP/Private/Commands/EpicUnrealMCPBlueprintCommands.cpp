@@ -63,6 +63,10 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleCommand(const FSt
     {
         return HandleSetMeshMaterialColor(Params);
     }
+    else if (CommandType == TEXT("create_physics_blueprint"))
+    {
+        return HandleCreatePhysicsBlueprint(Params);
+    }
     // Material management commands
     else if (CommandType == TEXT("get_available_materials"))
     {
@@ -269,8 +273,13 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleAddComponentToBlu
         // Add to root if no parent specified
         Blueprint->SimpleConstructionScript->AddNode(NewNode);
 
-        // Compile the blueprint
-        FKismetEditorUtilities::CompileBlueprint(Blueprint);
+        // Compile the blueprint (callers that compile once at the end pass compile=false)
+        bool bCompile = true;
+        Params->TryGetBoolField(TEXT("compile"), bCompile);
+        if (bCompile)
+        {
+            FKismetEditorUtilities::CompileBlueprint(Blueprint);
+        }
 
         TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
         ResultObj->SetStringField(TEXT("component_name"), ComponentName);
@@ -382,6 +391,138 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleCompileBlueprint(
     return ResultObj;
 }
 
+TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleCreatePhysicsBlueprint(const TSharedPtr<FJsonObject>& Params)
+{
+    // Get required parameters
+    FString BlueprintName;
+    if (!Params->TryGetStringField(TEXT("name"), BlueprintName))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'name' parameter"));
+    }
+
+    FString ComponentName = TEXT("Mesh");
+    Params->TryGetStringField(TEXT("component_name"), ComponentName);
+
+    FString MeshPath = TEXT("/Engine/BasicShapes/Cube.Cube");
+    Params->TryGetStringField(TEXT("static_mesh"), MeshPath);
+
+    auto IsError = [](const TSharedPtr<FJsonObject>& Result)
+    {
+        bool bSuccess = true;
+        return Result->TryGetBoolField(TEXT("success"), bSuccess) && !bSuccess;
+    };
+
+    // Same steps as create_blueprint, add_component_to_blueprint, set_static_mesh_properties
+    // and set_physics_properties, run in one command with a single compile at the end
+    TSharedPtr<FJsonObject> CreateParams = MakeShared<FJsonObject>();
+    CreateParams->SetStringField(TEXT("name"), BlueprintName);
+    CreateParams->SetStringField(TEXT("parent_class"), TEXT("Actor"));
+    TSharedPtr<FJsonObject> StepResult = HandleCreateBlueprint(CreateParams);
+
+    // A blueprint left by an earlier call is reused, with the mesh, scale and physics of this call
+    // applied to it, as the separate commands would; only a genuine create failure stops here
+    FString BlueprintPath;
+    UStaticMeshComponent* ExistingMesh = nullptr;
+    bool bReused = false;
+    if (IsError(StepResult))
+    {
+        UBlueprint* Existing = FEpicUnrealMCPCommonUtils::FindBlueprint(BlueprintName);
+        if (!Existing)
+        {
+            return StepResult;
+        }
+        bReused = true;
+        BlueprintPath = Existing->GetPathName();
+        for (USCS_Node* Node : Existing->SimpleConstructionScript->GetAllNodes())
+        {
+            if (Node && Node->GetVariableName().ToString() == ComponentName)
+            {
+                ExistingMesh = Cast<UStaticMeshComponent>(Node->ComponentTemplate);
+                if (!ExistingMesh)
+                {
+                    return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Component '%s' of existing blueprint %s is not a static mesh component"), *ComponentName, *BlueprintName));
+                }
+                break;
+            }
+        }
+    }
+    else
+    {
+        BlueprintPath = StepResult->GetStringField(TEXT("path"));
+    }
+
+    if (ExistingMesh)
+    {
+        ExistingMesh->Modify();
+        ExistingMesh->SetRelativeScale3D(Params->HasField(TEXT("scale"))
+            ? FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("scale"))
+            : FVector::OneVector);
+    }
+    else
+    {
+        TSharedPtr<FJsonObject> ComponentParams = MakeShared<FJsonObject>();
+        ComponentParams->SetStringField(TEXT("blueprint_name"), BlueprintName);
+        ComponentParams->SetStringField(TEXT("component_type"), TEXT("StaticMeshComponent"));
+        ComponentParams->SetStringField(TEXT("component_name"), ComponentName);
+        ComponentParams->SetBoolField(TEXT("compile"), false);
+        if (Params->HasField(TEXT("scale")))
+        {
+            ComponentParams->SetField(TEXT("scale"), Params->TryGetField(TEXT("scale")));
+        }
+        StepResult = HandleAddComponentToBlueprint(ComponentParams);
+        if (IsError(StepResult))
+        {
+            return StepResult;
+        }
+    }
+
+    TSharedPtr<FJsonObject> MeshParams = MakeShared<FJsonObject>();
+    MeshParams->SetStringField(TEXT("blueprint_name"), BlueprintName);
+    MeshParams->SetStringField(TEXT("component_name"), ComponentName);
+    MeshParams->SetStringField(TEXT("static_mesh"), MeshPath);
+    StepResult = HandleSetStaticMeshProperties(MeshParams);
+    if (IsError(StepResult))
+    {
+        return StepResult;
+    }
+
+    TSharedPtr<FJsonObject> PhysicsParams = MakeShared<FJsonObject>();
+    PhysicsParams->SetStringField(TEXT("blueprint_name"), BlueprintName);
+    PhysicsParams->SetStringField(TEXT("component_name"), ComponentName);
+    for (const TCHAR* Field : { TEXT("simulate_physics"), TEXT("gravity_enabled"), TEXT("mass"), TEXT("linear_damping"), TEXT("angular_damping") })
+    {
+        if (Params->HasField(Field))
+        {
+            PhysicsParams->SetField(Field, Params->TryGetField(Field));
+        }
+    }
+    StepResult = HandleSetPhysicsProperties(PhysicsParams);
+    if (IsError(StepResult))
+    {
+        return StepResult;
+    }
+
+    // Callers that still have to apply materials compile afterwards themselves
+    bool bDeferCompile = false;
+    Params->TryGetBoolField(TEXT("defer_compile"), bDeferCompile);
+    if (!bDeferCompile)
+    {
+        UBlueprint* Blueprint = FEpicUnrealMCPCommonUtils::FindBlueprint(BlueprintName);
+        if (Blueprint)
+        {
+            FKismetEditorUtilities::CompileBlueprint(Blueprint);
+        }
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetStringField(TEXT("name"), BlueprintName);
+    ResultObj->SetStringField(TEXT("path"), BlueprintPath);
+    ResultObj->SetStringField(TEXT("component"), ComponentName);
+    ResultObj->SetBoolField(TEXT("compiled"), !bDeferCompile);
+    ResultObj->SetBoolField(TEXT("reused"), bReused);
+    return ResultObj;
+}
+
 TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSpawnBlueprintActor(const TSharedPtr<FJsonObject>& Params)
 {
     UE_LOG(LogTemp, Warning, TEXT("HandleSpawnBlueprintActor: Starting blueprint actor spawn"));
@@ -416,6 +557,7 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSpawnBlueprintAct
     // Get transform parameters
     FVector Location(0.0f, 0.0f, 0.0f);
     FRotator Rotation(0.0f, 0.0f, 0.0f);
+    FVector Scale(1.0f, 1.0f, 1.0f);
 
     if (Params->HasField(TEXT("location")))
     {
@@ -427,6 +569,11 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSpawnBlueprintAct
         Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(Params, TEXT("rotation"));
         UE_LOG(LogTemp, Warning, TEXT("HandleSpawnBlueprintActor: Rotation set to (%f, %f, %f)"), Rotation.Pitch, Rotation.Yaw, Rotation.Roll);
     }
+    // Optional actor scale, applied at spawn instead of with a follow-up set_actor_transform
+    if (Params->HasField(TEXT("scale")))
+    {
+        Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("scale"));
+    }
 
     UE_LOG(LogTemp, Warning, TEXT("HandleSpawnBlueprintActor: Getting editor world"));
 
@@ -443,6 +590,7 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSpawnBlueprintAct
     FTransform SpawnTransform;
     SpawnTransform.SetLocation(Location);
     SpawnTransform.SetRotation(FQuat(Rotation));
+    SpawnTransform.SetScale3D(Scale);
 
     // Add a small delay to allow the engine to process the newly compiled class
     FPlatformProcess::Sleep(0.2f);
@@ -611,10 +759,25 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSetMeshMaterialCo
         MaterialSlot = Params->GetIntegerField(TEXT("material_slot"));
     }
 
-    // Get parameter name
+    // Get parameter name(s) - 'parameter_names' sets several parameters on the same instance
     FString ParameterName = TEXT("BaseColor");
     Params->TryGetStringField(TEXT("parameter_name"), ParameterName);
 
+    TArray<FString> ParameterNames;
+    const TArray<TSharedPtr<FJsonValue>>* ParameterNamesJson;
+    if (Params->TryGetArrayField(TEXT("parameter_names"), ParameterNamesJson))
+    {
+        for (const TSharedPtr<FJsonValue>& Value : *ParameterNamesJson)
+        {
+            ParameterNames.Add(Value->AsString());
+        }
+    }
+    if (ParameterNames.Num() == 0)
+    {
+        ParameterNames.Add(ParameterName);
+    }
+    ParameterName = ParameterNames[0];
+
     // Get or create material
     UMaterialInterface* Material = nullptr;
     
@@ -650,8 +813,14 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSetMeshMaterialCo
         return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to create dynamic material instance"));
     }
 
-    // Set the color parameter
-    DynMaterial->SetVectorParameterValue(*ParameterName, Color);
+    // Set the color parameter(s), recording which ones the source material actually exposes
+    TSharedPtr<FJsonObject> ParametersFound = MakeShared<FJsonObject>();
+    for (const FString& Name : ParameterNames)
+    {
+        FLinearColor ExistingValue;
+        ParametersFound->SetBoolField(Name, Material->GetVectorParameterValue(FMaterialParameterInfo(*Name), ExistingValue));
+        DynMaterial->SetVectorParameterValue(*Name, Color);
+    }
 
     // Apply the material to the component
     PrimComponent->SetMaterial(MaterialSlot, DynMaterial);
@@ -667,6 +836,14 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSetMeshMaterialCo
     ResultObj->SetStringField(TEXT("component"), ComponentName);
     ResultObj->SetNumberField(TEXT("material_slot"), MaterialSlot);
     ResultObj->SetStringField(TEXT("parameter_name"), ParameterName);
+
+    TArray<TSharedPtr<FJsonValue>> ParameterNamesResult;
+    for (const FString& Name : ParameterNames)
+    {
+        ParameterNamesResult.Add(MakeShared<FJsonValueString>(Name));
+    }
+    ResultObj->SetArrayField(TEXT("parameter_names"), ParameterNamesResult);
+    ResultObj->SetObjectField(TEXT("parameters"), ParametersFound);
     
     TArray<TSharedPtr<FJsonValue>> ColorResultArray;
     ColorResultArray.Add(MakeShared<FJsonValueNumber>(Color.R));
@@ -0,0 +1,408 @@
+#include "MCPMsgPack.h"
+
+namespace
+{
+    // Guard against malicious or corrupt payloads nesting without bound
+    constexpr int32 MaxNestingDepth = 64;
+
+    bool ReadBigEndian(const uint8* Data, int32 Length, int32& Offset, int32 NumBytes, uint64& OutValue)
+    {
+        if (Offset + NumBytes > Length)
+        {
+            return false;
+        }
+        OutValue = 0;
+        for (int32 i = 0; i < NumBytes; ++i)
+        {
+            OutValue = (OutValue << 8) | Data[Offset + i];
+        }
+        Offset += NumBytes;
+        return true;
+    }
+}
+
+bool FMCPMsgPack::IsMsgPackPayload(const uint8* Data, int32 Length)
+{
+    if (Length <= 0)
+    {
+        return false;
+    }
+    const uint8 Marker = Data[0];
+    // fixmap, map16, map32
+    return (Marker >= 0x80 && Marker <= 0x8f) || Marker == 0xde || Marker == 0xdf;
+}
+
+bool FMCPMsgPack::Decode(const uint8* Data, int32 Length, TSharedPtr<FJsonObject>& OutObject)
+{
+    int32 Offset = 0;
+    TSharedPtr<FJsonValue> Value = ReadValue(Data, Length, Offset, 0);
+    if (!Value.IsValid() || Value->Type != EJson::Object || Offset != Length)
+    {
+        return false;
+    }
+    OutObject = Value->AsObject();
+    return OutObject.IsValid();
+}
+
+void FMCPMsgPack::Encode(const TSharedPtr<FJsonObject>& Object, TArray<uint8>& OutData)
+{
+    WriteMap(Object, OutData);
+}
+
+TSharedPtr<FJsonValue> FMCPMsgPack::ReadValue(const uint8* Data, int32 Length, int32& Offset, int32 Depth)
+{
+    if (Offset >= Length || Depth > MaxNestingDepth)
+    {
+        return nullptr;
+    }
+
+    const uint8 Marker = Data[Offset++];
+    uint64 Raw = 0;
+
+    // Positive / negative fixint
+    if (Marker <= 0x7f)
+    {
+        return MakeShared<FJsonValueNumber>(Marker);
+    }
+    if (Marker >= 0xe0)
+    {
+        return MakeShared<FJsonValueNumber>((int8)Marker);
+    }
+
+    // fixmap
+    if (Marker >= 0x80 && Marker <= 0x8f)
+    {
+        TSharedPtr<FJsonObject> Map = ReadMap(Data, Length, Offset, Marker & 0x0f, Depth);
+        return Map.IsValid() ? MakeShared<FJsonValueObject>(Map) : nullptr;
+    }
+
+    // fixarray
+    uint32 ArrayCount = 0;
+    bool bIsArray = false;
+    if (Marker >= 0x90 && Marker <= 0x9f)
+    {
+        ArrayCount = Marker & 0x0f;
+        bIsArray = true;
+    }
+
+    // fixstr
+    uint32 StringSize = 0;
+    bool bIsString = false;
+    if (Marker >= 0xa0 && Marker <= 0xbf)
+    {
+        StringSize = Marker & 0x1f;
+        bIsString = true;
+    }
+
+    switch (Marker)
+    {
+    case 0xc0:
+        return MakeShared<FJsonValueNull>();
+    case 0xc2:
+        return MakeShared<FJsonValueBoolean>(false);
+    case 0xc3:
+        return MakeShared<FJsonValueBoolean>(true);
+
+    // bin is treated like str - the protocol only carries text
+    case 0xc4: case 0xd9:
+        if (!ReadBigEndian(Data, Length, Offset, 1, Raw)) return nullptr;
+        StringSize = (uint32)Raw;
+        bIsString = true;
+        break;
+    case 0xc5: case 0xda:
+        if (!ReadBigEndian(Data, Length, Offset, 2, Raw)) return nullptr;
+        StringSize = (uint32)Raw;
+        bIsString = true;
+        break;
+    case 0xc6: case 0xdb:
+        if (!ReadBigEndian(Data, Length, Offset, 4, Raw)) return nullptr;
+        StringSize = (uint32)Raw;
+        bIsString = true;
+        break;
+
+    case 0xca:
+    {
+        if (!ReadBigEndian(Data, Length, Offset, 4, Raw)) return nullptr;
+        const uint32 Bits = (uint32)Raw;
+        float Value;
+        FMemory::Memcpy(&Value, &Bits, sizeof(Value));
+        return MakeShared<FJsonValueNumber>(Value);
+    }
+    case 0xcb:
+    {
+        if (!ReadBigEndian(Data, Length, Offset, 8, Raw)) return nullptr;
+        double Value;
+        FMemory::Memcpy(&Value, &Raw, sizeof(Value));
+        return MakeShared<FJsonValueNumber>(Value);
+    }
+
+    case 0xcc:
+        if (!ReadBigEndian(Data, Length, Offset, 1, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((double)Raw);
+    case 0xcd:
+        if (!ReadBigEndian(Data, Length, Offset, 2, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((double)Raw);
+    case 0xce:
+        if (!ReadBigEndian(Data, Length, Offset, 4, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((double)Raw);
+    case 0xcf:
+        if (!ReadBigEndian(Data, Length, Offset, 8, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((double)Raw);
+    case 0xd0:
+        if (!ReadBigEndian(Data, Length, Offset, 1, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((int8)Raw);
+    case 0xd1:
+        if (!ReadBigEndian(Data, Length, Offset, 2, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((int16)Raw);
+    case 0xd2:
+        if (!ReadBigEndian(Data, Length, Offset, 4, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((int32)Raw);
+    case 0xd3:
+        if (!ReadBigEndian(Data, Length, Offset, 8, Raw)) return nullptr;
+        return MakeShared<FJsonValueNumber>((double)(int64)Raw);
+
+    case 0xdc:
+        if (!ReadBigEndian(Data, Length, Offset, 2, Raw)) return nullptr;
+        ArrayCount = (uint32)Raw;
+        bIsArray = true;
+        break;
+    case 0xdd:
+        if (!ReadBigEndian(Data, Length, Offset, 4, Raw)) return nullptr;
+        ArrayCount = (uint32)Raw;
+        bIsArray = true;
+        break;
+
+    case 0xde:
+    case 0xdf:
+    {
+        if (!ReadBigEndian(Data, Length, Offset, Marker == 0xde ? 2 : 4, Raw)) return nullptr;
+        TSharedPtr<FJsonObject> Map = ReadMap(Data, Length, Offset, (uint32)Raw, Depth);
+        return Map.IsValid() ? MakeShared<FJsonValueObject>(Map) : nullptr;
+    }
+
+    default:
+        break;
+    }
+
+    if (bIsString)
+    {
+        FString String;
+        if (!ReadString(Data, Length, Offset, StringSize, String))
+        {
+            return nullptr;
+        }
+        return MakeShared<FJsonValueString>(String);
+    }
+
+    if (bIsArray)
+    {
+        // Every element takes at least one byte
+        if (ArrayCount > (uint32)(Length - Offset))
+        {
+            return nullptr;
+        }
+        TArray<TSharedPtr<FJsonValue>> Array;
+        Array.Reserve(ArrayCount);
+        for (uint32 i = 0; i < ArrayCount; ++i)
+        {
+            TSharedPtr<FJsonValue> Element = ReadValue(Data, Length, Offset, Depth + 1);
+            if (!Element.IsValid())
+            {
+                return nullptr;
+            }
+            Array.Add(Element);
+        }
+        return MakeShared<FJsonValueArray>(Array);
+    }
+
+    // Extension types and reserved markers
+    return nullptr;
+}
+
+TSharedPtr<FJsonObject> FMCPMsgPack::ReadMap(const uint8* Data, int32 Length, int32& Offset, uint32 Count, int32 Depth)
+{
+    // Every key/value pair takes at least two bytes
+    if (Count > (uint32)(Length - Offset) / 2)
+    {
+        return nullptr;
+    }
+
+    TSharedPtr<FJsonObject> Object = MakeShared<FJsonObject>();
+    for (uint32 i = 0; i < Count; ++i)
+    {
+        TSharedPtr<FJsonValue> Key = ReadValue(Data, Length, Offset, Depth + 1);
+        if (!Key.IsValid() || Key->Type != EJson::String)
+        {
+            return nullptr;
+        }
+        TSharedPtr<FJsonValue> Value = ReadValue(Data, Length, Offset, Depth + 1);
+        if (!Value.IsValid())
+        {
+            return nullptr;
+        }
+        Object->SetField(Key->AsString(), Value);
+    }
+    return Object;
+}
+
+bool FMCPMsgPack::ReadString(const uint8* Data, int32 Length, int32& Offset, uint32 Size, FString& OutString)
+{
+    if (Size > (uint32)(Length - Offset))
+    {
+        return false;
+    }
+    FUTF8ToTCHAR Converter(reinterpret_cast<const ANSICHAR*>(Data + Offset), Size);
+    OutString = FString(Converter.Length(), Converter.Get());
+    Offset += Size;
+    return true;
+}
+
+void FMCPMsgPack::WriteValue(const TSharedPtr<FJsonValue>& Value, TArray<uint8>& OutData)
+{
+    if (!Value.IsValid())
+    {
+        OutData.Add(0xc0);
+        return;
+    }
+
+    switch (Value->Type)
+    {
+    case EJson::Boolean:
+        OutData.Add(Value->AsBool() ? 0xc3 : 0xc2);
+        break;
+    case EJson::Number:
+        WriteNumber(Value->AsNumber(), OutData);
+        break;
+    case EJson::String:
+        WriteString(Value->AsString(), OutData);
+        break;
+    case EJson::Array:
+    {
+        const TArray<TSharedPtr<FJsonValue>>& Array = Value->AsArray();
+        const uint32 Count = Array.Num();
+        if (Count <= 15)
+        {
+            OutData.Add(0x90 | Count);
+        }
+        else if (Count <= 0xffff)
+        {
+            OutData.Add(0xdc);
+            WriteBigEndian(Count, 2, OutData);
+        }
+        else
+        {
+            OutData.Add(0xdd);
+            WriteBigEndian(Count, 4, OutData);
+        }
+        for (const TSharedPtr<FJsonValue>& Element : Array)
+        {
+            WriteValue(Element, OutData);
+        }
+        break;
+    }
+    case EJson::Object:
+        WriteMap(Value->AsObject(), OutData);
+        break;
+    default:
+        OutData.Add(0xc0);
+        break;
+    }
+}
+
+void FMCPMsgPack::WriteMap(const TSharedPtr<FJsonObject>& Object, TArray<uint8>& OutData)
+{
+    if (!Object.IsValid())
+    {
+        OutData.Add(0xc0);
+        return;
+    }
+
+    const uint32 Count = Object->Values.Num();
+    if (Count <= 15)
+    {
+        OutData.Add(0x80 | Count);
+    }
+    else if (Count <= 0xffff)
+    {
+        OutData.Add(0xde);
+        WriteBigEndian(Count, 2, OutData);
+    }
+    else
+    {
+        OutData.Add(0xdf);
+        WriteBigEndian(Count, 4, OutData);
+    }
+
+    for (const TPair<FString, TSharedPtr<FJsonValue>>& Field : Object->Values)
+    {
+        WriteString(Field.Key, OutData);
+        WriteValue(Field.Value, OutData);
+    }
+}
+
+void FMCPMsgPack::WriteString(const FString& String, TArray<uint8>& OutData)
+{
+    FTCHARToUTF8 Converter(*String);
+    const uint32 Size = Converter.Length();
+    if (Size <= 31)
+    {
+        OutData.Add(0xa0 | Size);
+    }
+    else if (Size <= 0xff)
+    {
+        OutData.Add(0xd9);
+        WriteBigEndian(Size, 1, OutData);
+    }
+    else if (Size <= 0xffff)
+    {
+        OutData.Add(0xda);
+        WriteBigEndian(Size, 2, OutData);
+    }
+    else
+    {
+        OutData.Add(0xdb);
+        WriteBigEndian(Size, 4, OutData);
+    }
+    OutData.Append(reinterpret_cast<const uint8*>(Converter.Get()), Size);
+}
+
+void FMCPMsgPack::WriteNumber(double Number, TArray<uint8>& OutData)
+{
+    // Integral values use the compact integer encodings
+    if (FMath::IsFinite(Number) && FMath::FloorToDouble(Number) == Number && FMath::Abs(Number) < 9007199254740992.0)
+    {
+        const int64 Integer = (int64)Number;
+        if (Integer >= 0 && Integer <= 0x7f)
+        {
+            OutData.Add((uint8)Integer);
+        }
+        else if (Integer < 0 && Integer >= -32)
+        {
+            OutData.Add((uint8)(int8)Integer);
+        }
+        else if (Integer >= MIN_int32 && Integer <= MAX_int32)
+        {
+            OutData.Add(0xd2);
+            WriteBigEndian((uint32)(int32)Integer, 4, OutData);
+        }
+        else
+        {
+            OutData.Add(0xd3);
+            WriteBigEndian((uint64)Integer, 8, OutData);
+        }
+        return;
+    }
+
+    uint64 Bits;
+    FMemory::Memcpy(&Bits, &Number, sizeof(Bits));
+    OutData.Add(0xcb);
+    WriteBigEndian(Bits, 8, OutData);
+}
+
+void FMCPMsgPack::WriteBigEndian(uint64 Value, int32 NumBytes, TArray<uint8>& OutData)
+{
+    for (int32 i = NumBytes - 1; i >= 0; --i)
+    {
+        OutData.Add((uint8)((Value >> (i * 8)) & 0xff));
+    }
+}
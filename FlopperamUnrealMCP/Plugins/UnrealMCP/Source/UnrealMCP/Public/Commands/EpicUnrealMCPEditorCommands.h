@@ -3,6 +3,9 @@
 #include "CoreMinimal.h"
 #include "Json.h"
 
+class UWorld;
+class UStaticMesh;
+
 /**
  * Handler class for Editor-related MCP commands
  * Handles viewport control, actor manipulation, and level management
@@ -20,9 +23,19 @@ private:
     TSharedPtr<FJsonObject> HandleGetActorsInLevel(const TSharedPtr<FJsonObject>& Params);
     TSharedPtr<FJsonObject> HandleFindActorsByName(const TSharedPtr<FJsonObject>& Params);
     TSharedPtr<FJsonObject> HandleSpawnActor(const TSharedPtr<FJsonObject>& Params);
+    TSharedPtr<FJsonObject> HandleSpawnActorsBatch(const TSharedPtr<FJsonObject>& Params);
+    TSharedPtr<FJsonObject> HandleBatchSpawnInstances(const TSharedPtr<FJsonObject>& Params);
     TSharedPtr<FJsonObject> HandleDeleteActor(const TSharedPtr<FJsonObject>& Params);
     TSharedPtr<FJsonObject> HandleSetActorTransform(const TSharedPtr<FJsonObject>& Params);
 
     // Blueprint actor spawning
     TSharedPtr<FJsonObject> HandleSpawnBlueprintActor(const TSharedPtr<FJsonObject>& Params);
+
+    // Viewport control
+    TSharedPtr<FJsonObject> HandleSetViewportRealtime(const TSharedPtr<FJsonObject>& Params);
+
+    // Shared spawn logic for single and batched spawns (name must already be unique).
+    // MeshCache, when given, keeps static meshes loaded by earlier spawns of the same batch
+    TSharedPtr<FJsonObject> SpawnActorFromParams(UWorld* World, const TSharedPtr<FJsonObject>& Params, const FString& ActorName,
+                                                 TMap<FString, UStaticMesh*>* MeshCache = nullptr);
 }; 
\ No newline at end of file
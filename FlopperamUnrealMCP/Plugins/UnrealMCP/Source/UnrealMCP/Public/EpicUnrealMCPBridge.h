@@ -40,6 +40,7 @@ public:
 
 	// Command execution
 	FString ExecuteCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
+	TSharedPtr<FJsonObject> ExecuteCommandJson(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
 
 private:
 	// Server state
@@ -0,0 +1,33 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Json.h"
+
+/**
+ * Minimal MessagePack codec for the MCP wire protocol.
+ * Converts between MessagePack payloads and the FJsonObject trees used by the command handlers,
+ * so handlers stay format-agnostic. Extension types are not supported.
+ */
+class UNREALMCP_API FMCPMsgPack
+{
+public:
+	// True if the payload looks like a MessagePack map (JSON payloads start with '{')
+	static bool IsMsgPackPayload(const uint8* Data, int32 Length);
+
+	// Decode a MessagePack map into a JSON object
+	static bool Decode(const uint8* Data, int32 Length, TSharedPtr<FJsonObject>& OutObject);
+
+	// Encode a JSON object as a MessagePack map
+	static void Encode(const TSharedPtr<FJsonObject>& Object, TArray<uint8>& OutData);
+
+private:
+	static TSharedPtr<FJsonValue> ReadValue(const uint8* Data, int32 Length, int32& Offset, int32 Depth);
+	static TSharedPtr<FJsonObject> ReadMap(const uint8* Data, int32 Length, int32& Offset, uint32 Count, int32 Depth);
+	static bool ReadString(const uint8* Data, int32 Length, int32& Offset, uint32 Size, FString& OutString);
+
+	static void WriteValue(const TSharedPtr<FJsonValue>& Value, TArray<uint8>& OutData);
+	static void WriteMap(const TSharedPtr<FJsonObject>& Object, TArray<uint8>& OutData);
+	static void WriteString(const FString& String, TArray<uint8>& OutData);
+	static void WriteNumber(double Number, TArray<uint8>& OutData);
+	static void WriteBigEndian(uint64 Value, int32 NumBytes, TArray<uint8>& OutData);
+};
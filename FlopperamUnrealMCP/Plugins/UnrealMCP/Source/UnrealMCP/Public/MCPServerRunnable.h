@@ -3,6 +3,7 @@
 #include "CoreMinimal.h"
 #include "HAL/Runnable.h"
 #include "Sockets.h"
+#include "Dom/JsonObject.h"
 #include "Interfaces/IPv4/IPv4Address.h"
 
 class UEpicUnrealMCPBridge;
@@ -26,6 +27,18 @@ protected:
 	void HandleClientConnection(TSharedPtr<FSocket> ClientSocket);
 	void ProcessMessage(TSharedPtr<FSocket> Client, const FString& Message);
 
+	// Length-prefixed framing: 4-byte big-endian payload size followed by a UTF-8 JSON or MessagePack payload
+	bool ReceiveMessage(TSharedPtr<FSocket> Socket, TArray<uint8>& OutPayload);
+	// Frame holds FrameHeaderSize reserved bytes followed by the payload; the header is filled in place
+	bool SendMessage(TSharedPtr<FSocket> Socket, TArray<uint8>& Frame);
+	bool ReceiveExact(TSharedPtr<FSocket> Socket, uint8* Data, int32 Length);
+	bool SendAll(TSharedPtr<FSocket> Socket, const uint8* Data, int32 Length);
+	static TSharedPtr<FJsonObject> MakeErrorResponse(const FString& ErrorMessage);
+
+	// Upper bound on a single framed message
+	static constexpr int32 MaxMessageSize = 64 * 1024 * 1024;
+	static constexpr int32 FrameHeaderSize = 4;
+
 private:
 	UEpicUnrealMCPBridge* Bridge;
 	TSharedPtr<FSocket> ListenerSocket;
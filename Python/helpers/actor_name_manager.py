@@ -5,10 +5,14 @@ Centralized system for managing unique actor names across all MCP functions.
 Prevents duplicate name errors by automatically generating unique names and tracking actors.
 """
 
+import base64
 import logging
+import math
+import os
+import struct
 import time
 import uuid
-from typing import Dict, Any, Set, Optional
+from typing import Dict, Any, List, Set, Optional, Tuple, Union
 
 # Configure logging
 logger = logging.getLogger("ActorNameManager")
@@ -66,7 +70,7 @@ class ActorNameManager:
         unique_suffix = str(uuid.uuid4())[:8]
         final_name = f"{base_name}_{self._session_id}_{self._actor_counters[counter_key]}_{unique_suffix}"
         
-        logger.info(f"Generated unique name: {base_name} -> {final_name}")
+        logger.info("Generated unique name: %s -> %s", base_name, final_name)
         return final_name
     
     def _actor_exists(self, name: str, unreal_connection=None) -> bool:
@@ -95,7 +99,7 @@ class ActorNameManager:
                                 self._known_actors.add(name)
                                 return True
             except Exception as e:
-                logger.debug(f"Error checking actor existence for '{name}': {e}")
+                logger.debug("Error checking actor existence for '%s': %s", name, e)
         
         return False
     
@@ -150,7 +154,7 @@ def safe_spawn_actor(unreal_connection, params: Dict[str, Any], auto_unique_name
         
         # Log name change if it occurred
         if unique_name != original_name:
-            logger.debug(f"Actor name changed: '{original_name}' -> '{unique_name}'")
+            logger.debug("Actor name changed: '%s' -> '%s'", original_name, unique_name)
     
     try:
         # Attempt to spawn the actor
@@ -167,7 +171,7 @@ def safe_spawn_actor(unreal_connection, params: Dict[str, Any], auto_unique_name
                     response["result"]["original_name"] = original_name
         elif response and response.get("status") == "error" and "already exists" in response.get("error", ""):
             # Actor was created by another process/thread, mark as success
-            logger.info(f"Actor '{params['name']}' was created elsewhere, marking as success")
+            logger.info("Actor '%s' was created elsewhere, marking as success", params["name"])
             _global_actor_name_manager.mark_actor_created(params["name"])
             return {
                 "status": "success",
@@ -186,6 +190,301 @@ def safe_spawn_actor(unreal_connection, params: Dict[str, Any], auto_unique_name
         logger.error(f"Error in safe_spawn_actor: {e}")
         return {"success": False, "status": "error", "error": str(e)}
 
+_VECTOR_FIELDS = ("location", "rotation", "scale")
+_ORIGIN = (0.0, 0.0, 0.0)
+_UNIT_SCALE = (1.0, 1.0, 1.0)
+# Largest finite float32, the type instance transforms are packed as
+_FLOAT32_MAX = 3.4028234663852886e38
+
+def _validate_actor_params(params: Dict[str, Any]) -> Optional[str]:
+    """Return an error message if a spawn spec is malformed, otherwise None."""
+    if not isinstance(params, dict):
+        return "Actor spec must be an object"
+    if not isinstance(params.get("name", ""), str):
+        return "Actor name must be a string"
+    for field in _VECTOR_FIELDS:
+        value = params.get(field)
+        if value is not None and (not isinstance(value, (list, tuple)) or len(value) != 3
+                                  or not all(isinstance(v, (int, float)) for v in value)):
+            return f"Invalid '{field}': expected 3 numbers"
+    return None
+
+def _instance_transform(params: Dict[str, Any]) -> Optional[List[float]]:
+    """Location, rotation and scale of a valid spawn spec as nine Python floats (unset or None fields
+    take their defaults), or None if a value does not fit in a float32."""
+    transform = []
+    for field, default in (("location", _ORIGIN), ("rotation", _ORIGIN), ("scale", _UNIT_SCALE)):
+        transform.extend(float(v) for v in params.get(field) or default)
+    if any(_FLOAT32_MAX < abs(v) < math.inf for v in transform):
+        return None
+    return transform
+
+def _spec_columns(specs: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose spawn specs into one list per field (None where a spec leaves the field unset)."""
+    fields = dict.fromkeys(field for spec in specs for field in spec)
+    return {field: [spec.get(field) for spec in specs] for field in fields}
+
+def _spawn_chunks_individually(unreal_connection, chunks: List[List[Dict[str, Any]]],
+                               defaults: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Spawn batch chunks with one spawn_actor command per actor, for plugin builds without
+    spawn_actors_batch; returns one spawn_actors_batch-shaped response per chunk.
+    
+    The commands of all chunks go out in a single pipelined run rather than one run per chunk.
+    """
+    commands = [("spawn_actor", {**defaults, **params} if defaults else params)
+                for chunk in chunks for params in chunk]
+    try:
+        responses = unreal_connection.send_commands(commands)
+    except Exception as e:
+        logger.error(f"Error spawning batch chunks individually: {e}")
+        return [{"status": "error", "error": str(e)}] * len(chunks)
+    entries = []
+    for response in responses:
+        if response and response.get("status") == "success":
+            entries.append(response.get("result", {}))
+        else:
+            entries.append({"success": False,
+                            "error": response.get("error", "Unknown error") if response else "No response from Unreal"})
+    chunk_responses = []
+    start = 0
+    for chunk in chunks:
+        chunk_responses.append({"status": "success", "result": {"actors": entries[start:start + len(chunk)]}})
+        start += len(chunk)
+    return chunk_responses
+
+def _spawn_batch_entries(unreal_connection, actors: List[Dict[str, Any]], auto_unique_name: bool = True,
+                         chunk_size: int = 500, defaults: Optional[Dict[str, Any]] = None
+                         ) -> List[Union[Dict[str, Any], str]]:
+    """
+    Core of safe_spawn_actors_batch: one item per input actor, either Unreal's result entry
+    (annotated with final_name/original_name) or an error message, without wrapping either
+    in a response dict.
+    """
+    # Validate the whole payload once up front; malformed specs are reported without being sent
+    results: List[Union[Dict[str, Any], str, None]] = [None] * len(actors)
+    pending = []
+    for index, params in enumerate(actors):
+        error = _validate_actor_params(params)
+        if error:
+            results[index] = error
+        else:
+            pending.append(index)
+    
+    original_names = [actors[index].get("name", "Actor") for index in pending]
+    if auto_unique_name:
+        for index, original_name in zip(pending, original_names):
+            params = actors[index]
+            params["name"] = _global_actor_name_manager.generate_unique_name(original_name)
+            # Reserve the name so later actors in the same batch don't reuse it
+            _global_actor_name_manager.mark_actor_created(params["name"])
+    
+    chunk_starts = range(0, len(pending), chunk_size)
+    chunks = [[actors[index] for index in pending[start:start + chunk_size]] for start in chunk_starts]
+    commands = []
+    for chunk in chunks:
+        columns = _spec_columns(chunk)
+        batch_params = {"columns": columns, "unique_names": auto_unique_name}
+        # Builders name their parts "<prefix>_<part>_<index>", so most of each name is shared;
+        # send the common prefix once and let Unreal put it back in front of every name
+        names = columns.get("name")
+        if names and None not in names:
+            name_prefix = os.path.commonprefix(names)
+            if name_prefix:
+                prefix_length = len(name_prefix)
+                columns["name"] = [name[prefix_length:] for name in names]
+                batch_params["name_prefix"] = name_prefix
+        # Fields with the same value for every actor in the chunk (typically a builder's type, mesh
+        # or scale) go out once in the defaults instead of once per actor. The name column always
+        # stays, since Unreal counts the actors from the columns.
+        chunk_defaults = dict(defaults) if defaults else {}
+        if len(chunk) > 1 and "name" in columns:
+            for field in [field for field in columns if field != "name"]:
+                values = columns[field]
+                first = values[0]
+                if first is not None and all(value == first for value in values):
+                    chunk_defaults[field] = first
+                    del columns[field]
+        if chunk_defaults:
+            batch_params["defaults"] = chunk_defaults
+        commands.append(("spawn_actors_batch", batch_params))
+    
+    # Chunks are pipelined: Unreal starts on the next chunk while Python handles the previous reply
+    try:
+        responses = unreal_connection.send_commands(commands) if commands else []
+    except Exception as e:
+        logger.error(f"Error in safe_spawn_actors_batch: {e}")
+        responses = [{"status": "error", "error": str(e)}] * len(commands)
+    
+    unsupported = [position for position, response in enumerate(responses)
+                   if response and str(response.get("error", "")).startswith("Unknown command")]
+    if unsupported:
+        fallback = _spawn_chunks_individually(unreal_connection, [chunks[position] for position in unsupported], defaults)
+        for position, response in zip(unsupported, fallback):
+            responses[position] = response
+    
+    for start, chunk, response in zip(chunk_starts, chunks, responses):
+        chunk_indices = pending[start:start + chunk_size]
+        if not response or response.get("status") != "success":
+            error = response.get("error", "Unknown error") if response else "No response from Unreal"
+            for index in chunk_indices:
+                results[index] = error
+            continue
+        
+        entries = response.get("result", {}).get("actors", [])
+        for offset, (index, params) in enumerate(zip(chunk_indices, chunk)):
+            entry = entries[offset] if offset < len(entries) else None
+            if isinstance(entry, dict) and entry.get("success") is not False:
+                final_name = entry.get("name", params["name"])
+                _global_actor_name_manager.mark_actor_created(final_name)
+                entry["final_name"] = final_name
+                entry["original_name"] = original_names[start + offset]
+                results[index] = entry
+            else:
+                results[index] = entry.get("error", "Unknown error") if isinstance(entry, dict) else "Missing result"
+    
+    return results
+
+def safe_spawn_actors_batch(unreal_connection, actors: List[Dict[str, Any]], auto_unique_name: bool = True,
+                            chunk_size: int = 500, defaults: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Spawn many actors with the spawn_actors_batch command, pipelining the chunks over one connection.
+    
+    Names are made unique against the local cache only; collisions with actors that
+    already exist in the level are resolved by Unreal (unique_names=True), so no
+    per-actor existence queries are needed. Each chunk is sent column-wise (one list per
+    field), so field names are not repeated for every actor, and fields that are the same
+    for the whole chunk are sent once as defaults.
+    
+    Args:
+        unreal_connection: The Unreal connection to use
+        actors: List of spawn_actor parameter dicts
+        auto_unique_name: Whether to automatically generate unique names (default True)
+        chunk_size: Maximum number of actors per batch command
+        defaults: Parameters shared by every actor (e.g. type, scale, static_mesh); sent once
+            per chunk and merged into each spec by Unreal, with per-actor values taking precedence
+    
+    Returns:
+        One response per input actor, in order, shaped like safe_spawn_actor responses.
+        Malformed specs get an error response without being sent to Unreal.
+    """
+    if not unreal_connection:
+        return [{"success": False, "status": "error", "error": "No Unreal connection available"} for _ in actors]
+    
+    return [
+        {"status": "success", "result": item} if isinstance(item, dict)
+        else {"success": False, "status": "error", "error": item}
+        for item in _spawn_batch_entries(unreal_connection, actors, auto_unique_name, chunk_size, defaults)
+    ]
+
+class SpawnBuffer:
+    """
+    Collects spawn_actor parameter dicts so a multi-part build goes out as spawn_actors_batch commands.
+    
+    Builders that call safe_spawn_actor one actor at a time can take a buffer in place of the
+    connection: add() returns a success response immediately, and its result dict is filled in
+    with Unreal's real result by flush().
+    """
+    
+    def __init__(self, unreal_connection):
+        self.unreal = unreal_connection
+        self.items: List[Dict[str, Any]] = []
+        self._placeholders: List[Dict[str, Any]] = []
+    
+    def add(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue one actor; no I/O. Returns a safe_spawn_actor-shaped success response."""
+        placeholder = {"name": params.get("name", "Actor")}
+        self.items.append(params)
+        self._placeholders.append(placeholder)
+        return {"status": "success", "result": placeholder}
+    
+    def flush(self, **batch_kwargs) -> List[Dict[str, Any]]:
+        """
+        Spawn everything queued so far and fill in the placeholder results.
+        
+        Returns:
+            The placeholder results of actors that failed to spawn (each with an "error" key)
+        """
+        failed = []
+        if self.unreal:
+            # Unreal's entries go straight into the placeholders, with no response dict per actor
+            items = _spawn_batch_entries(self.unreal, self.items, **batch_kwargs)
+        else:
+            items = ["No Unreal connection available"] * len(self.items)
+        for placeholder, item in zip(self._placeholders, items):
+            if isinstance(item, dict):
+                placeholder.update(item)
+            else:
+                placeholder["error"] = item
+                failed.append(placeholder)
+        self.items.clear()
+        self._placeholders.clear()
+        return failed
+    
+    def flush_instanced(self, name_prefix: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Spawn everything queued so far, with all static mesh actors that share a mesh collapsed into
+        one actor holding a hierarchical instanced static mesh component (batch_spawn_instances).
+        
+        Placeholders of instanced parts get "instanced_in" (the holding actor's name) rather than
+        an actor of their own; queued actors of other types, or with a transform too large for float32,
+        are spawned individually as in flush().
+        
+        Returns:
+            The instanced-mesh actors (safe_spawn_actor-shaped responses) and the placeholder
+            results of parts that failed to spawn (each with an "error" key)
+        """
+        groups: Dict[str, Tuple[List[float], List[Dict[str, Any]]]] = {}
+        other_items, other_placeholders = [], []
+        for params, placeholder in zip(self.items, self._placeholders):
+            mesh = params.get("static_mesh")
+            transform = None
+            if params.get("type") == "StaticMeshActor" and isinstance(mesh, str) and not _validate_actor_params(params):
+                transform = _instance_transform(params)
+            if transform is not None:
+                rows, placeholders = groups.setdefault(mesh, ([], []))
+                rows.extend(transform)
+                placeholders.append(placeholder)
+            else:
+                other_items.append(params)
+                other_placeholders.append(placeholder)
+        self.items, self._placeholders = other_items, other_placeholders
+        failed = self.flush() if other_items else []
+        
+        commands = []
+        for mesh, (rows, _) in groups.items():
+            mesh_name = mesh.rsplit("/", 1)[-1].split(".", 1)[0]
+            holder_name = _global_actor_name_manager.generate_unique_name(f"{name_prefix}_{mesh_name}_Instances")
+            _global_actor_name_manager.mark_actor_created(holder_name)
+            # Nine little-endian float32 values per instance (location, rotation, scale), base64 encoded
+            # so the buffer survives both wire formats; about a third of the size of the same numbers as JSON
+            packed = base64.b64encode(struct.pack(f"<{len(rows)}f", *rows)).decode("ascii")
+            commands.append(("batch_spawn_instances",
+                             {"name": holder_name, "static_mesh": mesh, "transforms_packed": packed, "unique_names": True}))
+        
+        try:
+            if not self.unreal:
+                raise ConnectionError("No Unreal connection available")
+            responses = self.unreal.send_commands(commands) if commands else []
+        except Exception as e:
+            logger.error(f"Error in flush_instanced: {e}")
+            responses = [{"status": "error", "error": str(e)}] * len(commands)
+        
+        holders = []
+        for (_, holder_params), (_, placeholders), response in zip(commands, groups.values(), responses):
+            if response and response.get("status") == "success":
+                result = response.get("result", {})
+                holder_name = result.get("name", holder_params["name"])
+                _global_actor_name_manager.mark_actor_created(holder_name)
+                holders.append({"status": "success", "result": result})
+                for placeholder in placeholders:
+                    placeholder["instanced_in"] = holder_name
+            else:
+                error = response.get("error", "Unknown error") if response else "No response from Unreal"
+                for placeholder in placeholders:
+                    placeholder["error"] = error
+                failed.extend(placeholders)
+        return holders, failed
+
 def safe_delete_actor(unreal_connection, actor_name: str) -> Dict[str, Any]:
     """
     Safely delete an actor and update the name tracking.
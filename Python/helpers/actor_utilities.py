@@ -2,7 +2,7 @@
 Actor utility functions for Unreal MCP Server.
 Contains helper functions for spawning and managing actors.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +24,8 @@ def spawn_blueprint_actor(
     actor_name: str,
     location: List[float] = [0, 0, 0],
     rotation: List[float] = [0, 0, 0],
-    auto_unique_name: bool = True
+    auto_unique_name: bool = True,
+    scale: Optional[List[float]] = None
 ) -> Dict[str, Any]:
     """
     Spawn an actor from a Blueprint using the provided Unreal connection.
@@ -36,6 +37,7 @@ def spawn_blueprint_actor(
         location: [x, y, z] position to spawn at
         rotation: [roll, pitch, yaw] rotation to apply
         auto_unique_name: Whether to automatically generate unique names (default True)
+        scale: Optional actor scale [x, y, z], applied as part of the spawn
         
     Returns:
         Dict containing success status and result data
@@ -50,7 +52,7 @@ def spawn_blueprint_actor(
         if auto_unique_name:
             unique_name = get_unique_actor_name(actor_name, unreal_connection)
             if unique_name != actor_name:
-                logger.debug(f"Blueprint actor name changed: '{actor_name}' -> '{unique_name}'")
+                logger.debug("Blueprint actor name changed: '%s' -> '%s'", actor_name, unique_name)
                 actor_name = unique_name
         
         params = {
@@ -59,6 +61,8 @@ def spawn_blueprint_actor(
             "location": location,
             "rotation": rotation
         }
+        if scale is not None:
+            params["scale"] = scale
         
         response = unreal_connection.send_command("spawn_blueprint_actor", params)
         
@@ -7,60 +7,148 @@ dynamic parameters, safe spawning, and performance metrics.
 
 import math
 import logging
+from collections import namedtuple
 from typing import List, Dict, Any, Tuple
-from .actor_name_manager import safe_spawn_actor
+import numpy as np
+from .actor_name_manager import SpawnBuffer
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger("BridgeAqueductCreation")
 
+# Segment counts and dimensions that drive actor totals, shared by the dry-run estimates and the builders
+SuspensionCounts = namedtuple("SuspensionCounts", "cable_segments deck_x deck_y suspenders")
+AqueductGeometry = namedtuple(
+    "AqueductGeometry",
+    "arch_spacing total_length tier_height arch_segments arch_starts pier_offsets deck_length deck_width"
+)
 
-def calculate_parabolic_cable_points(
+
+def _counts_suspension(span_length: float, deck_width: float, module_size: float) -> SuspensionCounts:
+    """Segment counts for a suspension bridge (per cable, per deck axis, suspenders per side)."""
+    return SuspensionCounts(
+        cable_segments=max(1, int(span_length / module_size)),
+        deck_x=max(1, int(span_length / module_size)),
+        deck_y=max(1, int(deck_width / module_size)),
+        suspenders=max(1, int(span_length / (module_size * 3)))  # Every 3 modules
+    )
+
+
+def _aqueduct_geometry(
+    arches: int,
+    arch_radius: float,
+    pier_width: float,
+    deck_width: float,
+    module_size: float
+) -> AqueductGeometry:
+    """Dimensions and segment counts of an aqueduct, computed once for the dry run and the builder."""
+    arch_spacing = 2 * arch_radius + pier_width
+    total_length = arches * arch_spacing + pier_width
+    return AqueductGeometry(
+        arch_spacing=arch_spacing,
+        total_length=total_length,
+        tier_height=2 * arch_radius + pier_width,  # Height of each tier
+        # Arch segments based on semicircle circumference
+        arch_segments=max(4, int(math.pi * arch_radius / module_size)),
+        # Offset of each arch's springing point and each pier along the span
+        arch_starts=np.arange(arches) * arch_spacing + pier_width/2,
+        pier_offsets=(np.arange(arches + 1) * arch_spacing).tolist(),
+        deck_length=max(1, int(total_length / module_size)),
+        deck_width=max(1, int(deck_width / module_size))
+    )
+
+
+def _deck_positions_kernel(rows: int, cols: int, along_start: float, across_start: float,
+                           module_size: float) -> np.ndarray:
+    """Centers of a rows x cols deck grid as (along, across) pairs, row-major; written so Numba can compile it."""
+    positions = np.empty((rows * cols, 2))
+    for i in range(rows):
+        along = along_start + (i + 0.5) * module_size
+        for j in range(cols):
+            positions[i * cols + j, 0] = along
+            positions[i * cols + j, 1] = across_start + (j + 0.5) * module_size
+    return positions
+
+
+# Compiled when Numba is installed; otherwise compute_deck_positions broadcasts with NumPy
+_deck_positions_jit = njit(cache=True)(_deck_positions_kernel) if njit is not None else None
+
+
+def compute_deck_positions(rows: int, cols: int, along_start: float, across_start: float,
+                           module_size: float) -> np.ndarray:
+    """
+    Centers of a deck grid of module_size tiles: a (rows*cols, 2) array of (along, across)
+    coordinates, row-major, starting from the given world-space edges of the deck.
+    """
+    if _deck_positions_jit is not None:
+        return _deck_positions_jit(rows, cols, along_start, across_start, module_size)
+    positions = np.empty((rows, cols, 2))
+    positions[:, :, 0] = (along_start + (np.arange(rows) + 0.5) * module_size)[:, None]
+    positions[:, :, 1] = across_start + (np.arange(cols) + 0.5) * module_size
+    return positions.reshape(rows * cols, 2)
+
+
+def _flush_parts(spawn_buffer: SpawnBuffer, queued: List[Tuple[Dict[str, Any], str]],
+                 all_actors: List[Dict[str, Any]], counts: Dict[str, int]) -> None:
+    """Spawn the queued parts in one batch, then record the ones that landed and count them by kind."""
+    failed = {id(placeholder) for placeholder in spawn_buffer.flush()}
+    for resp, kind in queued:
+        if id(resp["result"]) not in failed:
+            all_actors.append(resp)
+            counts[kind] += 1
+
+
+def _parabolic_cable_arrays(
     span_length: float,
     sag_ratio: float,
     tower_height: float,
     module_size: float,
     start_location: List[float]
-) -> List[Tuple[List[float], float]]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calculate points along a parabolic cable for a suspension bridge.
-    Returns list of (location, angle) tuples for cable segments.
+    Vectorized cable geometry: an (N+1, 3) array of world points along the parabola and
+    the tangent angle (degrees) of the segment starting at each point (0 for the last point).
     """
-    points = []
-    
     # Parabola equation: y = ax^2 + c
     # At x=0 (center): y = -sag
     # At x=±span/2: y = 0 (tower top)
     sag = span_length * sag_ratio
     a = 4 * sag / (span_length ** 2)
     
-    # Sample points along the span
-    num_segments = max(1, int(span_length / module_size))
+    # Sample points along the span, X from -span/2 to +span/2
+    num_segments = _counts_suspension(span_length, 0, module_size).cable_segments
+    xs = -span_length/2 + (np.arange(num_segments + 1) * span_length / num_segments)
     
-    for i in range(num_segments + 1):
-        # X position from -span/2 to +span/2
-        x = -span_length/2 + (i * span_length / num_segments)
-        
-        # Parabolic height relative to tower top
-        y_relative = a * x * x - sag
-        
-        # World position
-        world_x = start_location[0] + x
-        world_y = start_location[1]
-        world_z = start_location[2] + tower_height + y_relative
-        
-        # Calculate angle for this segment (tangent to parabola)
-        if i < num_segments:
-            next_x = -span_length/2 + ((i + 1) * span_length / num_segments)
-            next_y_relative = a * next_x * next_x - sag
-            
-            dx = next_x - x
-            dy = next_y_relative - y_relative
-            angle = math.degrees(math.atan2(dy, dx))
-        else:
-            angle = 0  # Last point
-            
-        points.append(([world_x, world_y, world_z], angle))
+    # Parabolic height relative to tower top
+    ys = a * xs * xs - sag
     
-    return points
+    points = np.empty((num_segments + 1, 3))
+    points[:, 0] = start_location[0] + xs
+    points[:, 1] = start_location[1]
+    points[:, 2] = start_location[2] + tower_height + ys
+    
+    # Angle of each segment (tangent to parabola)
+    angles = np.zeros(num_segments + 1)
+    angles[:-1] = np.degrees(np.arctan2(np.diff(ys), np.diff(xs)))
+    return points, angles
+
+
+def calculate_parabolic_cable_points(
+    span_length: float,
+    sag_ratio: float,
+    tower_height: float,
+    module_size: float,
+    start_location: List[float]
+) -> List[Tuple[List[float], float]]:
+    """
+    Calculate points along a parabolic cable for a suspension bridge.
+    Returns list of (location, angle) tuples for cable segments.
+    """
+    points, angles = _parabolic_cable_arrays(span_length, sag_ratio, tower_height, module_size, start_location)
+    return list(zip(points.tolist(), angles.tolist()))
 
 
 def build_suspension_bridge_structure(
@@ -80,13 +168,16 @@ def build_suspension_bridge_structure(
     all_actors: List[Dict[str, Any]]
 ) -> Dict[str, int]:
     """Build all components of a suspension bridge."""
-    logger.info(f"Starting bridge construction: {name_prefix}, span={span_length}, width={deck_width}")
+    logger.info("Starting bridge construction: %s, span=%s, width=%s", name_prefix, span_length, deck_width)
     counts = {
         "towers": 0,
         "deck_segments": 0,
         "cable_segments": 0,
         "suspenders": 0
     }
+    # Every part is queued with its kind and the whole structure is spawned as one batch at the end
+    spawn_buffer = SpawnBuffer(unreal)
+    queued: List[Tuple[Dict[str, Any], str]] = []
     
     # Adjust for orientation
     if orientation == "y":
@@ -122,10 +213,7 @@ def build_suspension_bridge_structure(
             "scale": [5.0, 5.0, 4.0],
             "static_mesh": tower_mesh
         }
-        resp = safe_spawn_actor(unreal, base_params)
-        if resp and resp.get("status") == "success":
-            all_actors.append(resp)
-            counts["towers"] += 1
+        queued.append((spawn_buffer.add(base_params), "towers"))
             
         # Main tower shaft (very tall) - positioned above the base
         main_shaft_params = {
@@ -135,10 +223,7 @@ def build_suspension_bridge_structure(
             "scale": [3.0, 3.0, tower_height/100],
             "static_mesh": tower_mesh
         }
-        resp = safe_spawn_actor(unreal, main_shaft_params)
-        if resp and resp.get("status") == "success":
-            all_actors.append(resp)
-            counts["towers"] += 1
+        queued.append((spawn_buffer.add(main_shaft_params), "towers"))
             
         # Tower top cap where cables attach
         top_location = tower_location.copy()
@@ -151,10 +236,7 @@ def build_suspension_bridge_structure(
             "scale": [3.5, 3.5, 1.0],
             "static_mesh": tower_mesh
         }
-        resp = safe_spawn_actor(unreal, top_params)
-        if resp and resp.get("status") == "success":
-            all_actors.append(resp)
-            counts["towers"] += 1
+        queued.append((spawn_buffer.add(top_params), "towers"))
             
         # Add cable attachment points (small blocks at tower top)
         for side_offset in cable_offsets:
@@ -171,70 +253,60 @@ def build_suspension_bridge_structure(
                 "scale": [0.5, 0.5, 0.5],
                 "static_mesh": tower_mesh
             }
-            resp = safe_spawn_actor(unreal, attachment_params)
-            if resp and resp.get("status") == "success":
-                all_actors.append(resp)
-                counts["towers"] += 1
+            queued.append((spawn_buffer.add(attachment_params), "towers"))
     
     # Build main cables - adjust for new tower positioning (400 units above ground + tower_height)
     effective_tower_height = 400 + tower_height
-    cable_points = calculate_parabolic_cable_points(
+    cable_points, cable_angles = _parabolic_cable_arrays(
         span_length, cable_sag_ratio, effective_tower_height, module_size, location_adjusted
     )
     
+    # Segment midpoints and lengths for all segments at once (the cable has no sideways extent)
+    mids = ((cable_points[:-1] + cable_points[1:]) / 2).tolist()
+    span_deltas = np.diff(cable_points[:, 0])
+    height_deltas = np.diff(cable_points[:, 2])
+    length_scales = (np.sqrt(span_deltas * span_deltas + height_deltas * height_deltas) / 100).tolist()
+    segment_angles = cable_angles[:-1].tolist()
+    
     for cable_idx, offset in enumerate(cable_offsets):
-        for i in range(len(cable_points) - 1):
-            point, angle = cable_points[i]
-            next_point, _ = cable_points[i + 1]
-            
-            # Calculate segment length and midpoint
+        for i, ((mid_along, mid_side, mid_z), angle, length_scale) in enumerate(zip(mids, segment_angles, length_scales)):
             if span_direction == 0:
-                dx = next_point[0] - point[0]
-                dy = 0
-                cable_location = [
-                    (point[0] + next_point[0]) / 2,
-                    point[1] + offset,
-                    (point[2] + next_point[2]) / 2
-                ]
+                cable_location = [mid_along, mid_side + offset, mid_z]
                 rotation = [angle, 0, 0]
             else:
-                dx = 0
-                dy = next_point[0] - point[0]  # Span direction along Y-axis
-                cable_location = [
-                    location_adjusted[0] + offset,  # Perpendicular to span (X-axis)
-                    (point[0] + next_point[0]) / 2,  # Along span (Y-axis) - using X from cable points
-                    (point[2] + next_point[2]) / 2
-                ]
+                # Span runs along the Y-axis, using X from the cable points
+                cable_location = [location_adjusted[0] + offset, mid_along, mid_z]
                 rotation = [0, angle, 0]
-                
-            dz = next_point[2] - point[2]
-            segment_length = math.sqrt(dx*dx + dy*dy + dz*dz)
             
             cable_params = {
                 "name": f"{name_prefix}_Cable_{cable_idx}_{i}",
                 "type": "StaticMeshActor",
                 "location": cable_location,
                 "rotation": rotation,
-                "scale": [0.3, 0.3, segment_length/100],
+                "scale": [0.3, 0.3, length_scale],
                 "static_mesh": cable_mesh
             }
-            resp = safe_spawn_actor(unreal, cable_params)
-            if resp and resp.get("status") == "success":
-                all_actors.append(resp)
-                counts["cable_segments"] += 1
+            queued.append((spawn_buffer.add(cable_params), "cable_segments"))
     
     # Build deck
-    deck_segments_x = max(1, int(span_length / module_size))
-    deck_segments_y = max(1, int(deck_width / module_size))
+    segment_counts = _counts_suspension(span_length, deck_width, module_size)
+    deck_segments_x = segment_counts.deck_x
+    deck_segments_y = segment_counts.deck_y
+    
+    deck_positions = compute_deck_positions(
+        deck_segments_x, deck_segments_y,
+        location_adjusted[span_direction] - span_length/2,
+        location_adjusted[1 - span_direction] - deck_width/2,
+        module_size
+    ).tolist()
     
     for i in range(deck_segments_x):
         for j in range(deck_segments_y):
+            along, across = deck_positions[i * deck_segments_y + j]
             if span_direction == 0:
-                deck_x = location_adjusted[0] - span_length/2 + (i + 0.5) * module_size
-                deck_y = location_adjusted[1] - deck_width/2 + (j + 0.5) * module_size
+                deck_x, deck_y = along, across
             else:
-                deck_x = location_adjusted[0] - deck_width/2 + (j + 0.5) * module_size
-                deck_y = location_adjusted[1] - span_length/2 + (i + 0.5) * module_size
+                deck_x, deck_y = across, along
                 
             deck_params = {
                 "name": f"{name_prefix}_Deck_{i}_{j}",
@@ -243,23 +315,19 @@ def build_suspension_bridge_structure(
                 "scale": [module_size/100, module_size/100, 0.5],
                 "static_mesh": deck_mesh
             }
-            resp = safe_spawn_actor(unreal, deck_params)
-            if resp and resp.get("status") == "success":
-                all_actors.append(resp)
-                counts["deck_segments"] += 1
+            queued.append((spawn_buffer.add(deck_params), "deck_segments"))
     
     # Build vertical suspenders
     suspender_spacing = module_size * 3  # Every 3 modules
-    num_suspenders = max(1, int(span_length / suspender_spacing))
+    num_suspenders = segment_counts.suspenders
     
-    for i in range(num_suspenders):
-        x_pos = -span_length/2 + (i + 0.5) * suspender_spacing
-        
-        # Find cable height at this position
-        cable_height_relative = cable_sag_ratio * span_length * (4 * x_pos * x_pos / (span_length * span_length) - 1)
-        cable_z = location_adjusted[2] + effective_tower_height + cable_height_relative
-        deck_z = location_adjusted[2]
-        
+    # Cable height above each suspender, for all suspenders at once
+    x_positions = -span_length/2 + (np.arange(num_suspenders) + 0.5) * suspender_spacing
+    cable_heights_relative = cable_sag_ratio * span_length * (4 * x_positions * x_positions / (span_length * span_length) - 1)
+    cable_zs = location_adjusted[2] + effective_tower_height + cable_heights_relative
+    deck_z = location_adjusted[2]
+    
+    for i, (x_pos, cable_z) in enumerate(zip(x_positions.tolist(), cable_zs.tolist())):
         suspender_height = cable_z - deck_z
         
         for offset in cable_offsets:
@@ -283,14 +351,29 @@ def build_suspension_bridge_structure(
                 "scale": [0.1, 0.1, suspender_height/100],
                 "static_mesh": suspender_mesh
             }
-            resp = safe_spawn_actor(unreal, suspender_params)
-            if resp and resp.get("status") == "success":
-                all_actors.append(resp)
-                counts["suspenders"] += 1
+            queued.append((spawn_buffer.add(suspender_params), "suspenders"))
     
+    _flush_parts(spawn_buffer, queued, all_actors, counts)
     return counts
 
 
+def _arch_profile(arch_radius: float, num_segments: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Semicircle shared by every arch: X and Z offsets (relative to the arch center) of its
+    N+1 points, and the tangent angle (degrees) of the segment starting at each point
+    (90 for the last point).
+    """
+    # Angle from 0 to π (semicircle)
+    thetas = np.arange(num_segments + 1) * math.pi / num_segments
+    cos_t = np.cos(thetas)
+    sin_t = np.sin(thetas)
+    
+    # Calculate tangent angle for segment orientation
+    tangent_angles = np.full(num_segments + 1, 90.0)
+    tangent_angles[:-1] = np.degrees(np.arctan2(np.diff(sin_t), np.diff(cos_t)))
+    return arch_radius * cos_t, arch_radius * sin_t, tangent_angles
+
+
 def calculate_arch_points(
     arch_radius: float,
     module_size: float,
@@ -301,44 +384,22 @@ def calculate_arch_points(
     orientation: str
 ) -> List[Tuple[List[float], float]]:
     """Calculate points along a semicircular arch."""
-    points = []
-    
-    # Number of segments based on module size
-    circumference = math.pi * arch_radius
-    num_segments = max(4, int(circumference / module_size))
+    geometry = _aqueduct_geometry(arch_index + 1, arch_radius, pier_width, 0, module_size)
+    x_rel, z_rel, tangent_angles = _arch_profile(arch_radius, geometry.arch_segments)
     
     # Arch spans from one pier to the next
-    arch_span_x = arch_index * (2 * arch_radius + pier_width) + pier_width/2
+    arch_span_x = geometry.arch_starts[arch_index]
     
-    for i in range(num_segments + 1):
-        # Angle from 0 to π (semicircle)
-        angle = i * math.pi / num_segments
-        
-        # Position relative to arch center
-        x_rel = arch_radius * math.cos(angle)
-        z_rel = arch_radius * math.sin(angle)
-        
-        if orientation == "x":
-            world_x = location[0] + arch_span_x + arch_radius + x_rel
-            world_y = location[1]
-        else:
-            world_x = location[0]
-            world_y = location[1] + arch_span_x + arch_radius + x_rel
-            
-        world_z = location[2] + tier_height + z_rel
-        
-        # Calculate tangent angle for segment orientation
-        if i < num_segments:
-            next_angle = (i + 1) * math.pi / num_segments
-            dx = math.cos(next_angle) - math.cos(angle)
-            dz = math.sin(next_angle) - math.sin(angle)
-            tangent_angle = math.degrees(math.atan2(dz, dx))
-        else:
-            tangent_angle = 90  # Last point
-            
-        points.append(([world_x, world_y, world_z], tangent_angle))
+    points = np.empty((len(x_rel), 3))
+    if orientation == "x":
+        points[:, 0] = location[0] + arch_span_x + arch_radius + x_rel
+        points[:, 1] = location[1]
+    else:
+        points[:, 0] = location[0]
+        points[:, 1] = location[1] + arch_span_x + arch_radius + x_rel
+    points[:, 2] = location[2] + tier_height + z_rel
     
-    return points
+    return list(zip(points.tolist(), tangent_angles.tolist()))
 
 
 def build_aqueduct_structure(
@@ -363,19 +424,29 @@ def build_aqueduct_structure(
         "piers": 0,
         "deck_segments": 0
     }
+    # Every part is queued with its kind and the whole structure is spawned as one batch at the end
+    spawn_buffer = SpawnBuffer(unreal)
+    queued: List[Tuple[Dict[str, Any], str]] = []
     
     # Calculate dimensions
-    arch_spacing = 2 * arch_radius + pier_width
-    total_length = arches * arch_spacing + pier_width
-    tier_height = 2 * arch_radius + pier_width  # Height of each tier
+    geometry = _aqueduct_geometry(arches, arch_radius, pier_width, deck_width, module_size)
+    tier_height = geometry.tier_height
+    
+    # Arch geometry along the span, shared by all tiers
+    arch_xs, arch_zs, arch_angles = _arch_profile(arch_radius, geometry.arch_segments)
+    arch_zs = location[2] + arch_zs
+    along_origin = location[0] if orientation == "x" else location[1]
+    arch_alongs = along_origin + geometry.arch_starts[:, None] + arch_radius + arch_xs
+    mid_alongs = ((arch_alongs[:, :-1] + arch_alongs[:, 1:]) / 2).tolist()
+    along_deltas = np.diff(arch_alongs, axis=1)
+    segment_angles = arch_angles[:-1].tolist()
     
     # Build tiers from bottom to top
     for tier in range(tiers):
         current_tier_height = tier * tier_height
         
         # Build piers for this tier
-        for pier_idx in range(arches + 1):
-            pier_x = pier_idx * arch_spacing
+        for pier_idx, pier_x in enumerate(geometry.pier_offsets):
             
             if orientation == "x":
                 pier_location = [
@@ -404,69 +475,60 @@ def build_aqueduct_structure(
                 ],
                 "static_mesh": pier_mesh
             }
-            resp = safe_spawn_actor(unreal, pier_params)
-            if resp and resp.get("status") == "success":
-                all_actors.append(resp)
-                counts["piers"] += 1
+            queued.append((spawn_buffer.add(pier_params), "piers"))
+        
+        # Build arches for this tier: every arch shares one profile, so segment positions for
+        # all arches come from one broadcast of the arch offsets against the profile
+        mid_zs = ((arch_zs[:-1] + arch_zs[1:]) / 2 + current_tier_height).tolist()
+        height_deltas = np.diff(arch_zs + current_tier_height)
+        length_scales = (np.sqrt(along_deltas * along_deltas + height_deltas * height_deltas) / 100).tolist()
+        arch_thickness = pier_width/200 * pier_scale_factor
         
-        # Build arches for this tier
         for arch_idx in range(arches):
-            arch_points = calculate_arch_points(
-                arch_radius, module_size, pier_width, arch_idx,
-                current_tier_height, location, orientation
-            )
-            
-            # Create arch segments
-            for i in range(len(arch_points) - 1):
-                point, angle = arch_points[i]
-                next_point, _ = arch_points[i + 1]
-                
-                # Calculate segment midpoint and length
-                mid_x = (point[0] + next_point[0]) / 2
-                mid_y = (point[1] + next_point[1]) / 2
-                mid_z = (point[2] + next_point[2]) / 2
-                
-                dx = next_point[0] - point[0]
-                dy = next_point[1] - point[1]
-                dz = next_point[2] - point[2]
-                segment_length = math.sqrt(dx*dx + dy*dy + dz*dz)
-                
-                # Rotation based on orientation
+            for i, (mid_along, mid_z, angle, length_scale) in enumerate(
+                    zip(mid_alongs[arch_idx], mid_zs, segment_angles, length_scales[arch_idx])):
+                # Position and rotation based on orientation
                 if orientation == "x":
+                    mid_location = [mid_along, location[1], mid_z]
                     rotation = [angle, 0, 90]  # Cylinder along arch
                 else:
+                    mid_location = [location[0], mid_along, mid_z]
                     rotation = [0, angle, 90]
                     
                 arch_params = {
                     "name": f"{name_prefix}_Arch_T{tier}_A{arch_idx}_S{i}",
                     "type": "StaticMeshActor",
-                    "location": [mid_x, mid_y, mid_z],
+                    "location": mid_location,
                     "rotation": rotation,
                     "scale": [
-                        pier_width/200 * pier_scale_factor,  # Arch thickness
-                        pier_width/200 * pier_scale_factor,
-                        segment_length/100
+                        arch_thickness,  # Arch thickness
+                        arch_thickness,
+                        length_scale
                     ],
                     "static_mesh": arch_mesh
                 }
-                resp = safe_spawn_actor(unreal, arch_params)
-                if resp and resp.get("status") == "success":
-                    all_actors.append(resp)
-                    counts["arch_segments"] += 1
+                queued.append((spawn_buffer.add(arch_params), "arch_segments"))
     
     # Build water deck on top tier
     deck_height = location[2] + tiers * tier_height
-    deck_segments_length = max(1, int(total_length / module_size))
-    deck_segments_width = max(1, int(deck_width / module_size))
+    deck_segments_length = geometry.deck_length
+    deck_segments_width = geometry.deck_width
+    
+    along_axis = 0 if orientation == "x" else 1
+    deck_positions = compute_deck_positions(
+        deck_segments_length, deck_segments_width,
+        location[along_axis],
+        location[1 - along_axis] - deck_width/2,
+        module_size
+    ).tolist()
     
     for i in range(deck_segments_length):
         for j in range(deck_segments_width):
+            along, across = deck_positions[i * deck_segments_width + j]
             if orientation == "x":
-                deck_x = location[0] + (i + 0.5) * module_size
-                deck_y = location[1] - deck_width/2 + (j + 0.5) * module_size
+                deck_x, deck_y = along, across
             else:
-                deck_x = location[0] - deck_width/2 + (j + 0.5) * module_size
-                deck_y = location[1] + (i + 0.5) * module_size
+                deck_x, deck_y = across, along
                 
             deck_params = {
                 "name": f"{name_prefix}_Deck_{i}_{j}",
@@ -475,10 +537,7 @@ def build_aqueduct_structure(
                 "scale": [module_size/100, module_size/100, 0.5],
                 "static_mesh": deck_mesh
             }
-            resp = safe_spawn_actor(unreal, deck_params)
-            if resp and resp.get("status") == "success":
-                all_actors.append(resp)
-                counts["deck_segments"] += 1
+            queued.append((spawn_buffer.add(deck_params), "deck_segments"))
                 
     # Add side walls to water channel
     for side in [0, 1]:
@@ -497,10 +556,8 @@ def build_aqueduct_structure(
                 "scale": [module_size/100, 0.2, 2.0],
                 "static_mesh": deck_mesh
             }
-            resp = safe_spawn_actor(unreal, wall_params)
-            if resp and resp.get("status") == "success":
-                all_actors.append(resp)
-                # Count as deck segments for simplicity
-                counts["deck_segments"] += 1
+            # Count as deck segments for simplicity
+            queued.append((spawn_buffer.add(wall_params), "deck_segments"))
     
+    _flush_parts(spawn_buffer, queued, all_actors, counts)
     return counts
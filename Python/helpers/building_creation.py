@@ -45,7 +45,8 @@ def _create_town_building(building_type: str, location: List[float], max_size: f
                 height=height,
                 location=building_loc,
                 name_prefix=f"{name_prefix}_{building_id}",
-                house_style=random.choice(styles)
+                house_style=random.choice(styles),
+                verbose=True  # create_town collects every actor
             )
             
         elif building_type == "mansion":
@@ -55,7 +56,8 @@ def _create_town_building(building_type: str, location: List[float], max_size: f
                 height=random.randint(500, 700),
                 location=building_loc,
                 name_prefix=f"{name_prefix}_Mansion_{building_id}",
-                house_style="mansion"
+                house_style="mansion",
+                verbose=True
             )
             
         elif building_type == "tower":
@@ -68,7 +70,8 @@ def _create_town_building(building_type: str, location: List[float], max_size: f
                 base_size=base_size,
                 location=building_loc,
                 name_prefix=f"{name_prefix}_Tower_{building_id}",
-                tower_style=random.choice(styles)
+                tower_style=random.choice(styles),
+                verbose=True
             )
             
         elif building_type == "skyscraper":
@@ -170,7 +173,8 @@ def _create_town_building(building_type: str, location: List[float], max_size: f
                 height=random.randint(400, 600),
                 location=building_loc,
                 name_prefix=f"{name_prefix}_Commercial_{building_id}",
-                house_style="modern"
+                house_style="modern",
+                verbose=True
             )
         
         return result
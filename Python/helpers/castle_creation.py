@@ -4,27 +4,43 @@ Contains logic for building complex castle fortresses with walls, towers, and vi
 """
 
 import math
-from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Mapping
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Import safe spawning functions
 try:
-    from .actor_name_manager import safe_spawn_actor
+    from .actor_name_manager import safe_spawn_actor, SpawnBuffer
 except ImportError:
     logger.warning("Could not import actor_name_manager, using fallback spawning")
     def safe_spawn_actor(unreal_connection, params, auto_unique_name=True):
         return unreal_connection.send_command("spawn_actor", params)
+    SpawnBuffer = None
 
 def _safe_spawn_castle_actor(unreal, params):
-    """Helper function to safely spawn castle actors and track results."""
+    """Helper function to safely spawn castle actors and track results.
+    
+    `unreal` may be a SpawnBuffer, in which case the actor is queued for one batch spawn.
+    """
+    if SpawnBuffer is not None and isinstance(unreal, SpawnBuffer):
+        return unreal.add(params)
     resp = safe_spawn_actor(unreal, params, auto_unique_name=True)
     return resp
 
 
-def get_castle_size_params(castle_size: str) -> Dict[str, int]:
-    """Get size parameters for different castle sizes."""
+# (angle, x offset, y offset) of the windows 350 units out around each corner tower, one per side
+TOWER_WINDOW_OFFSETS = tuple(
+    (angle, 350 * math.cos(angle * math.pi / 180), 350 * math.sin(angle * math.pi / 180))
+    for angle in (0, 90, 180, 270)
+)
+
+
+@lru_cache(maxsize=16)
+def get_castle_size_params(castle_size: str) -> Mapping[str, int]:
+    """Get size parameters for different castle sizes (cached, read-only)."""
     size_params = {
         "small": {
             "outer_width": 6000, "outer_depth": 6000, 
@@ -47,14 +63,20 @@ def get_castle_size_params(castle_size: str) -> Dict[str, int]:
             "wall_height": 1600, "tower_count": 24, "tower_height": 2800
         }
     }
-    return size_params.get(castle_size, size_params["large"])
+    return MappingProxyType(size_params.get(castle_size, size_params["large"]))
+
 
+def calculate_scaled_dimensions(params: Mapping[str, int], scale_factor: float = 2.0) -> Mapping[str, int]:
+    """Calculate scaled dimensions based on size parameters and scale factor (cached, read-only)."""
+    return _scaled_dimensions(tuple(params.items()), scale_factor)
 
-def calculate_scaled_dimensions(params: Dict[str, int], scale_factor: float = 2.0) -> Dict[str, int]:
-    """Calculate scaled dimensions based on size parameters and scale factor."""
+
+@lru_cache(maxsize=16)
+def _scaled_dimensions(param_items: Tuple[Tuple[str, int], ...], scale_factor: float) -> Mapping[str, int]:
+    params = dict(param_items)
     complexity_multiplier = max(1, int(round(scale_factor)))
     
-    return {
+    return MappingProxyType({
         "outer_width": int(params["outer_width"] * scale_factor),
         "outer_depth": int(params["outer_depth"] * scale_factor),
         "inner_width": int(params["inner_width"] * scale_factor),
@@ -67,7 +89,7 @@ def calculate_scaled_dimensions(params: Dict[str, int], scale_factor: float = 2.
         "barbican_offset": int(400 * scale_factor),
         "drawbridge_offset": int(600 * scale_factor),
         "wall_thickness": int(300 * max(1.0, scale_factor * 0.75))
-    }
+    })
 
 
 def build_outer_bailey_walls(unreal, name_prefix: str, location: List[float], 
@@ -375,9 +397,9 @@ def build_corner_towers(unreal, name_prefix: str, location: List[float],
         # Multiple levels of tower windows (5 levels instead of 3)
         for window_level in range(5):
             window_height = location[2] + 300 + window_level * 300
-            for angle in [0, 90, 180, 270]:
-                window_x = corner[0] + 350 * math.cos(angle * math.pi / 180)
-                window_y = corner[1] + 350 * math.sin(angle * math.pi / 180)
+            for angle, offset_x, offset_y in TOWER_WINDOW_OFFSETS:
+                window_x = corner[0] + offset_x
+                window_y = corner[1] + offset_y
                 window_name = f"{name_prefix}_TowerWindow_{i}_{window_level}_{angle}"
                 window_result = _safe_spawn_castle_actor(unreal, {
                     "name": window_name,
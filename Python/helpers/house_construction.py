@@ -9,13 +9,7 @@ import logging
 
 logger = logging.getLogger("UnrealMCP_Advanced")
 
-# Import safe spawning functions
-try:
-    from .actor_name_manager import safe_spawn_actor
-except ImportError:
-    logger.warning("Could not import actor_name_manager, using fallback spawning")
-    def safe_spawn_actor(unreal_connection, params, auto_unique_name=True):
-        return unreal_connection.send_command("spawn_actor", params)
+from .actor_name_manager import SpawnBuffer
 
 def build_house(
     unreal_connection,
@@ -29,6 +23,8 @@ def build_house(
 ) -> Dict[str, Any]:
     """Build a realistic house with architectural details and multiple rooms."""
     try:
+        # Every part is queued and the whole house goes to Unreal in one spawn_actors_batch command
+        spawn_buffer = SpawnBuffer(unreal_connection)
         results = []
         wall_thickness = 20.0  # Thinner walls for realism
         floor_thickness = 30.0
@@ -47,9 +43,7 @@ def build_house(
             "scale": [(width + 200)/100.0, (depth + 200)/100.0, floor_thickness/100.0],
             "static_mesh": mesh
         }
-        foundation_resp = safe_spawn_actor(unreal_connection, foundation_params)
-        if foundation_resp and foundation_resp.get("status") == "success":
-            results.append(foundation_resp)
+        results.append(spawn_buffer.add(foundation_params))
         
         # Create floor as single piece
         floor_params = {
@@ -59,20 +53,23 @@ def build_house(
             "scale": [width/100.0, depth/100.0, floor_thickness/100.0],
             "static_mesh": mesh
         }
-        floor_resp = safe_spawn_actor(unreal_connection, floor_params)
-        if floor_resp and floor_resp.get("status") == "success":
-            results.append(floor_resp)
+        results.append(spawn_buffer.add(floor_params))
         
         base_z = location[2] + floor_thickness
         
         # Build walls
-        _build_house_walls(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, results)
+        _build_house_walls(spawn_buffer, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, results)
         
         # Build roof
-        _build_house_roof(unreal_connection, name_prefix, location, width, depth, height, base_z, mesh, house_style, results)
+        _build_house_roof(spawn_buffer, name_prefix, location, width, depth, height, base_z, mesh, house_style, results)
         
         # Add style-specific features
-        _add_house_features(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, house_style, results)
+        _add_house_features(spawn_buffer, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, house_style, results)
+        
+        failed = spawn_buffer.flush()
+        if failed:
+            # Only the parts that were actually spawned are reported
+            results = [resp for resp in results if "error" not in resp["result"]]
         
         return {
             "success": True,
@@ -87,126 +84,127 @@ def build_house(
         logger.error(f"build_house error: {e}")
         return {"success": False, "message": str(e)}
 
-def _build_house_walls(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, results):
+def _build_house_walls(spawn_buffer, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, results):
     """Build the main walls of the house with door and window openings."""
     door_width = 120.0
     door_height = 240.0
     
+    # Positions and scales shared by several walls, computed once
+    x, y = location[0], location[1]
+    front_y = y - depth/2
+    back_y = y + depth/2
+    mid_z = base_z + height/2
+    thickness_scale = wall_thickness/100.0
+    height_scale = height/100.0
+    third = width/3
+    third_scale = third/100.0
+    front_offset = width/4
+    door_offset = door_width/4
+    
     # Front wall (with door opening)
     # Front wall - left side of door
     front_left_width = (width/2 - door_width/2)
+    front_side_scale = [front_left_width/100.0, thickness_scale, height_scale]
     front_left_params = {
         "name": f"{name_prefix}_FrontWall_Left",
         "type": "StaticMeshActor",
-        "location": [location[0] - width/4 - door_width/4, location[1] - depth/2, base_z + height/2],
-        "scale": [front_left_width/100.0, wall_thickness/100.0, height/100.0],
+        "location": [x - front_offset - door_offset, front_y, mid_z],
+        "scale": front_side_scale,
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, front_left_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(front_left_params))
     
     # Front wall - right side of door
     front_right_params = {
         "name": f"{name_prefix}_FrontWall_Right",
         "type": "StaticMeshActor",
-        "location": [location[0] + width/4 + door_width/4, location[1] - depth/2, base_z + height/2],
-        "scale": [front_left_width/100.0, wall_thickness/100.0, height/100.0],
+        "location": [x + front_offset + door_offset, front_y, mid_z],
+        "scale": list(front_side_scale),
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, front_right_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(front_right_params))
     
     # Front wall - above door
+    above_door_height = height - door_height
     front_top_params = {
         "name": f"{name_prefix}_FrontWall_Top",
         "type": "StaticMeshActor",
-        "location": [location[0], location[1] - depth/2, base_z + door_height + (height - door_height)/2],
-        "scale": [door_width/100.0, wall_thickness/100.0, (height - door_height)/100.0],
+        "location": [x, front_y, base_z + door_height + above_door_height/2],
+        "scale": [door_width/100.0, thickness_scale, above_door_height/100.0],
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, front_top_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(front_top_params))
     
     # Back wall with window openings
     window_width = 150.0
     window_height = 150.0
-    window_y = base_z + height/2
+    window_y = mid_z
+    window_bottom = window_y - window_height/2
+    window_top = window_y + window_height/2
+    below_window_height = window_bottom - base_z
+    above_window_height = base_z + height - window_y - window_height/2
     
     # Back wall - left section
     back_left_params = {
         "name": f"{name_prefix}_BackWall_Left",
         "type": "StaticMeshActor",
-        "location": [location[0] - width/3, location[1] + depth/2, base_z + height/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, height/100.0],
+        "location": [x - third, back_y, mid_z],
+        "scale": [third_scale, thickness_scale, height_scale],
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, back_left_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(back_left_params))
     
     # Back wall - center section (with window cutouts)
     back_center_bottom_params = {
         "name": f"{name_prefix}_BackWall_Center_Bottom",
         "type": "StaticMeshActor",
-        "location": [location[0], location[1] + depth/2, base_z + (window_y - window_height/2 - base_z)/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, (window_y - window_height/2 - base_z)/100.0],
+        "location": [x, back_y, base_z + below_window_height/2],
+        "scale": [third_scale, thickness_scale, below_window_height/100.0],
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, back_center_bottom_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(back_center_bottom_params))
     
     back_center_top_params = {
         "name": f"{name_prefix}_BackWall_Center_Top",
         "type": "StaticMeshActor",
-        "location": [location[0], location[1] + depth/2, window_y + window_height/2 + (base_z + height - window_y - window_height/2)/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, (base_z + height - window_y - window_height/2)/100.0],
+        "location": [x, back_y, window_top + above_window_height/2],
+        "scale": [third_scale, thickness_scale, above_window_height/100.0],
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, back_center_top_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(back_center_top_params))
     
     # Back wall - right section
     back_right_params = {
         "name": f"{name_prefix}_BackWall_Right",
         "type": "StaticMeshActor",
-        "location": [location[0] + width/3, location[1] + depth/2, base_z + height/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, height/100.0],
+        "location": [x + third, back_y, mid_z],
+        "scale": [third_scale, thickness_scale, height_scale],
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, back_right_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(back_right_params))
     
     # Left wall
+    side_scale = [thickness_scale, depth/100.0, height_scale]
     left_wall_params = {
         "name": f"{name_prefix}_LeftWall",
         "type": "StaticMeshActor",
-        "location": [location[0] - width/2, location[1], base_z + height/2],
-        "scale": [wall_thickness/100.0, depth/100.0, height/100.0],
+        "location": [x - width/2, y, mid_z],
+        "scale": side_scale,
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, left_wall_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(left_wall_params))
     
     # Right wall  
     right_wall_params = {
         "name": f"{name_prefix}_RightWall",
         "type": "StaticMeshActor",
-        "location": [location[0] + width/2, location[1], base_z + height/2],
-        "scale": [wall_thickness/100.0, depth/100.0, height/100.0],
+        "location": [x + width/2, y, mid_z],
+        "scale": list(side_scale),
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, right_wall_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(right_wall_params))
 
-def _build_house_roof(unreal_connection, name_prefix, location, width, depth, height, base_z, mesh, house_style, results):
+def _build_house_roof(spawn_buffer, name_prefix, location, width, depth, height, base_z, mesh, house_style, results):
     """Build the roof of the house."""
     roof_thickness = 30.0
     roof_overhang = 100.0
@@ -224,9 +222,7 @@ def _build_house_roof(unreal_connection, name_prefix, location, width, depth, he
         "scale": [(width + roof_overhang*2)/100.0, (depth + roof_overhang*2)/100.0, roof_thickness/100.0],
         "static_mesh": mesh
     }
-    resp = safe_spawn_actor(unreal_connection, flat_roof_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
+    results.append(spawn_buffer.add(flat_roof_params))
     
     # Add chimney for cottage style
     if house_style == "cottage":
@@ -241,11 +237,9 @@ def _build_house_roof(unreal_connection, name_prefix, location, width, depth, he
             "scale": [1.0, 1.0, 2.5],
             "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
         }
-        resp = safe_spawn_actor(unreal_connection, chimney_params)
-        if resp and resp.get("status") == "success":
-            results.append(resp)
+        results.append(spawn_buffer.add(chimney_params))
 
-def _add_house_features(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, house_style, results):
+def _add_house_features(spawn_buffer, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, house_style, results):
     """Add style-specific features to the house."""
 
     
@@ -259,9 +253,7 @@ def _add_house_features(unreal_connection, name_prefix, location, width, depth,
             "scale": [2.5, 0.1, 2.5],
             "static_mesh": mesh
         }
-        resp = safe_spawn_actor(unreal_connection, garage_params)
-        if resp and resp.get("status") == "success":
-            results.append(resp)
+        results.append(spawn_buffer.add(garage_params))
 
 def _get_house_features(house_style: str) -> List[str]:
     """Get the list of features for a house style."""
@@ -3,15 +3,33 @@ Advanced Tower Creation Helpers
 
 This module provides helper functions for creating massive, cool-shaped, and colored towers
 with various architectural styles and color schemes.
+
+None of the server's tools call these builders yet - create_tower lays out its own blocks -
+so only CORNER_OFFSETS is used from here.
 """
 
+import atexit
+import json
 import math
+import os
 import random
+import zlib
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("TowerCreation")
 
+# Unit (cos, sin) for the four corner directions at 0, 90, 180 and 270 degrees
+CORNER_OFFSETS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
 def get_tower_color_palette(palette_name: str = "rainbow") -> List[List[float]]:
     """
     Get a predefined color palette for tower creation.
@@ -77,7 +95,8 @@ def get_tower_color_palette(palette_name: str = "rainbow") -> List[List[float]]:
     
     return palettes.get(palette_name, palettes["rainbow"])
 
-def assign_tower_piece_color(level: int, piece_index: int, total_levels: int, color_palette: List[List[float]], color_pattern: str = "gradient") -> List[float]:
+def assign_tower_piece_color(level: int, piece_index: int, total_levels: int, color_palette: List[List[float]], color_pattern: str = "gradient",
+                             rng: Optional[np.random.Generator] = None) -> List[float]:
     """
     Assign a color to a tower piece based on level, position, and pattern.
     
@@ -87,6 +106,7 @@ def assign_tower_piece_color(level: int, piece_index: int, total_levels: int, co
         total_levels: Total number of levels in the tower
         color_palette: List of available colors
         color_pattern: Pattern for color assignment ("gradient", "random", "alternating", "spiral")
+        rng: The tower's Generator, used by the "random" pattern (the random module is used without one)
         
     Returns:
         RGBA color values [R, G, B, A]
@@ -111,66 +131,113 @@ def assign_tower_piece_color(level: int, piece_index: int, total_levels: int, co
         return color_palette[color_index]
         
     elif color_pattern == "random":
-        # Random color from palette (consistent per level+piece)
-        random.seed(level * 1000 + piece_index)
-        return random.choice(color_palette)
+        # Random color from palette, drawn from the tower's rng so a seeded tower repeats its colors
+        if rng is None:
+            return random.choice(color_palette)
+        return color_palette[rng.integers(len(color_palette))]
         
     else:  # Default to gradient
         ratio = level / max(1, total_levels - 1)
         color_index = int(ratio * (len(color_palette) - 1))
         return color_palette[color_index]
 
+@lru_cache(maxsize=64)
+def _unit_ring(num_blocks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    cos and sin of num_blocks evenly spaced angles, shared by every ring with that many blocks.
+    The arrays are read-only since they are cached.
+    """
+    angles = (2 * math.pi * np.arange(num_blocks)) / num_blocks
+    cos_t = np.cos(angles)
+    sin_t = np.sin(angles)
+    cos_t.flags.writeable = False
+    sin_t.flags.writeable = False
+    return cos_t, sin_t
+
+@lru_cache(maxsize=32)
+def _spiral_level_params(height: int, base_size: int, block_size: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Precompute the per-level spiral parameters for a whole tower in one pass.
+
+    Returns arrays indexed by level: height above the tower base, twist angle,
+    ring radius and number of blocks in the ring. The arrays are read-only since they are cached.
+    """
+    lv = np.arange(height)
+    dz = lv * block_size
+    twist = (lv / height) * math.pi * 4  # 4 full rotations over tower height
+    radius = (base_size / 2 - lv * 0.05) * block_size  # Gradually reduce radius
+    counts = np.maximum(6, (base_size * 8 * (1 - lv / height * 0.5)).astype(int))
+    for arr in (dz, twist, radius, counts):
+        arr.flags.writeable = False
+    return dz, twist, radius, counts
+
 def create_spiral_tower_pieces(level: int, height: int, base_size: int, block_size: float, 
                              location: List[float], name_prefix: str, 
-                             color_palette: List[List[float]], color_pattern: str) -> List[Dict[str, Any]]:
+                             color_palette: List[List[float]], color_pattern: str,
+                             rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
     """
     Generate piece data for a single level of a spiral tower.
     Returns data structure instead of spawning directly for batch processing.
+    
+    Pass the same rng (e.g. np.random.default_rng(seed)) for every level of a tower
+    to make the jitter reproducible.
     """
     pieces = []
     
-    # Calculate spiral parameters
-    level_height = location[2] + level * block_size
-    twist_angle = (level / height) * math.pi * 4  # 4 full rotations over tower height
-    radius_reduction = level * 0.05  # Gradually reduce radius
-    current_radius = (base_size / 2) * block_size - radius_reduction * block_size
+    # Per-level parameters are computed once per tower and shared across levels
+    dz, twist, radius, counts = _spiral_level_params(height, base_size, block_size)
+    level_height = float(location[2] + dz[level])
+    current_radius = float(radius[level])
     
     if current_radius <= 0:
         return pieces
         
     # Number of blocks per level decreases with height
-    num_blocks = max(6, int((base_size * 8) * (1 - level / height * 0.5)))
+    num_blocks = int(counts[level])
+    
+    angles = 2 * np.pi * np.arange(num_blocks) / num_blocks + twist[level]
+    xs = location[0] + current_radius * np.cos(angles)
+    ys = location[1] + current_radius * np.sin(angles)
+    scale = [block_size / 100.0, block_size / 100.0, block_size / 100.0]
+    
+    # Add some randomness to create organic look (x and y offsets in one draw)
+    if rng is None:
+        rng = np.random.default_rng()
+    jitter = rng.uniform(-block_size * 0.1, block_size * 0.1, size=(num_blocks, 2))
+    xs = xs + jitter[:, 0]
+    ys = ys + jitter[:, 1]
+    # Random colors for the whole level in one draw as well
+    color_picks = rng.integers(len(color_palette), size=num_blocks) if color_pattern == "random" and color_palette else None
     
     for i in range(num_blocks):
-        angle = (2 * math.pi * i) / num_blocks + twist_angle
-        x = location[0] + current_radius * math.cos(angle)
-        y = location[1] + current_radius * math.sin(angle)
-        
-        # Add some randomness to create organic look
-        x += random.uniform(-block_size * 0.1, block_size * 0.1)
-        y += random.uniform(-block_size * 0.1, block_size * 0.1)
+        x = float(xs[i])
+        y = float(ys[i])
         
         # Get color for this piece
-        color = assign_tower_piece_color(level, i, height, color_palette, color_pattern)
+        if color_picks is not None:
+            color = color_palette[color_picks[i]]
+        else:
+            color = assign_tower_piece_color(level, i, height, color_palette, color_pattern)
         
         pieces.append({
             "name": f"{name_prefix}_spiral_{level}_{i}",
             "location": [x, y, level_height],
             "color": color,
-            "scale": [block_size / 100.0, block_size / 100.0, block_size / 100.0]
+            "scale": list(scale)
         })
     
     return pieces
 
 def create_spiral_tower_level(unreal, level: int, height: int, base_size: int, block_size: float, 
                             location: List[float], name_prefix: str, mesh: str, 
-                            color_palette: List[List[float]], color_pattern: str) -> List[Dict[str, Any]]:
+                            color_palette: List[List[float]], color_pattern: str,
+                            rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
     """
-    DEPRECATED: Use create_spiral_tower_pieces for batch processing.
+    DEPRECATED: Use create_spiral_tower for batch processing.
     Create a single level of a spiral tower with twisted geometry.
     """
     logger.warning("create_spiral_tower_level is deprecated. Use batch processing instead.")
-    pieces = create_spiral_tower_pieces(level, height, base_size, block_size, location, name_prefix, color_palette, color_pattern)
+    pieces = create_spiral_tower_pieces(level, height, base_size, block_size, location, name_prefix, color_palette, color_pattern, rng)
     
     if not pieces:
         return []
@@ -178,9 +245,31 @@ def create_spiral_tower_level(unreal, level: int, height: int, base_size: int, b
     result = create_tower_blueprints_and_batch_spawn(unreal, pieces, mesh, name_prefix)
     return result.get("actors", [])
 
+def create_spiral_tower(unreal, height: int, base_size: int, block_size: float,
+                        location: List[float], name_prefix: str, mesh: str,
+                        color_palette: List[List[float]], color_pattern: str,
+                        seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Create a whole spiral tower: every level's pieces are generated first and spawned in one batch.
+    
+    The jitter and "random" colors of all levels come from one Generator seeded with seed,
+    so the same seed rebuilds the same tower.
+    """
+    rng = np.random.default_rng(seed)
+    pieces = []
+    for level in range(height):
+        pieces.extend(create_spiral_tower_pieces(level, height, base_size, block_size, location, name_prefix,
+                                                 color_palette, color_pattern, rng))
+    
+    if not pieces:
+        return {"success": True, "actors": [], "blueprints_created": 0, "total_pieces": 0}
+    
+    return create_tower_blueprints_and_batch_spawn(unreal, pieces, mesh, name_prefix)
+
 def create_twisted_tower_level(unreal, level: int, height: int, base_size: int, block_size: float,
                              location: List[float], name_prefix: str, mesh: str,
-                             color_palette: List[List[float]], color_pattern: str) -> List[Dict[str, Any]]:
+                             color_palette: List[List[float]], color_pattern: str,
+                             rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
     """
     Create a single level of a twisted square tower.
     """
@@ -191,40 +280,36 @@ def create_twisted_tower_level(unreal, level: int, height: int, base_size: int,
     size_reduction = level * 0.02  # Gradual tapering
     current_size = max(2, base_size - size_reduction)
     
-    # Create twisted square perimeter
+    # Create twisted square perimeter: position of every block on the square's edges,
+    # then one rotation of the whole perimeter by the level's twist
     half_size = current_size / 2
     perimeter_blocks = int(current_size * 4)
-    
-    for i in range(perimeter_blocks):
-        # Calculate position on square perimeter
-        side = i // int(current_size)
-        pos_on_side = i % int(current_size)
-        
-        if side == 0:  # Bottom edge
-            local_x = pos_on_side - half_size + 0.5
-            local_y = -half_size
-        elif side == 1:  # Right edge
-            local_x = half_size
-            local_y = pos_on_side - half_size + 0.5
-        elif side == 2:  # Top edge
-            local_x = half_size - pos_on_side - 0.5
-            local_y = half_size
-        else:  # Left edge
-            local_x = -half_size
-            local_y = half_size - pos_on_side - 0.5
-        
-        # Apply twist transformation
-        cos_twist = math.cos(twist_angle)
-        sin_twist = math.sin(twist_angle)
-        twisted_x = local_x * cos_twist - local_y * sin_twist
-        twisted_y = local_x * sin_twist + local_y * cos_twist
-        
-        # Convert to world coordinates
-        x = location[0] + twisted_x * block_size
-        y = location[1] + twisted_y * block_size
-        
+    side_blocks = int(current_size)
+    
+    i = np.arange(perimeter_blocks)
+    side = i // side_blocks
+    pos_on_side = i % side_blocks
+    # Bottom, right and top edges; anything past the top edge is on the left edge
+    local_x = np.select(
+        [side == 0, side == 1, side == 2],
+        [pos_on_side - half_size + 0.5, np.full(perimeter_blocks, half_size), half_size - pos_on_side - 0.5],
+        -half_size
+    )
+    local_y = np.select(
+        [side == 0, side == 1, side == 2],
+        [np.full(perimeter_blocks, -half_size), pos_on_side - half_size + 0.5, np.full(perimeter_blocks, half_size)],
+        half_size - pos_on_side - 0.5
+    )
+    
+    # Apply twist transformation and convert to world coordinates
+    cos_twist = math.cos(twist_angle)
+    sin_twist = math.sin(twist_angle)
+    xs = (location[0] + (local_x * cos_twist - local_y * sin_twist) * block_size).tolist()
+    ys = (location[1] + (local_x * sin_twist + local_y * cos_twist) * block_size).tolist()
+    
+    for i, (x, y) in enumerate(zip(xs, ys)):
         # Get color for this piece
-        color = assign_tower_piece_color(level, i, height, color_palette, color_pattern)
+        color = assign_tower_piece_color(level, i, height, color_palette, color_pattern, rng)
         
         # Create colored physics block
         actor_name = f"{name_prefix}_twisted_{level}_{i}"
@@ -237,7 +322,8 @@ def create_twisted_tower_level(unreal, level: int, height: int, base_size: int,
 
 def create_multi_tiered_level(unreal, level: int, height: int, base_size: int, block_size: float,
                             location: List[float], name_prefix: str, mesh: str,
-                            color_palette: List[List[float]], color_pattern: str) -> List[Dict[str, Any]]:
+                            color_palette: List[List[float]], color_pattern: str,
+                            rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
     """
     Create a multi-tiered level with multiple concentric rings.
     """
@@ -256,14 +342,15 @@ def create_multi_tiered_level(unreal, level: int, height: int, base_size: int, b
         circumference = 2 * math.pi * tier_radius
         num_blocks = max(4, int(circumference / block_size))
         
-        for i in range(num_blocks):
-            angle = (2 * math.pi * i) / num_blocks
-            x = location[0] + tier_radius * math.cos(angle)
-            y = location[1] + tier_radius * math.sin(angle)
-            z = level_height + tier * block_size * 0.3  # Slight height offset per tier
-            
+        # Tier rings repeat on every level, so their trig is looked up rather than recomputed
+        cos_t, sin_t = _unit_ring(num_blocks)
+        xs = (location[0] + tier_radius * cos_t).tolist()
+        ys = (location[1] + tier_radius * sin_t).tolist()
+        z = level_height + tier * block_size * 0.3  # Slight height offset per tier
+        
+        for i, (x, y) in enumerate(zip(xs, ys)):
             # Get color for this piece (different for each tier)
-            color = assign_tower_piece_color(level * 10 + tier, i, height * 10, color_palette, color_pattern)
+            color = assign_tower_piece_color(level * 10 + tier, i, height * 10, color_palette, color_pattern, rng)
             
             # Create colored physics block
             actor_name = f"{name_prefix}_tiered_{level}_{tier}_{i}"
@@ -274,19 +361,88 @@ def create_multi_tiered_level(unreal, level: int, height: int, base_size: int, b
     
     return spawned
 
-# Global cache for reusable colored blueprints
-_tower_blueprint_cache = {}
+# Blueprint cache persisted across sessions: {(mesh, color_key): bp_name}
+TOWER_BP_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "unreal_tower_bp.json")
 
-def clear_tower_blueprint_cache():
-    """Clear the blueprint cache. Useful when starting fresh or after errors."""
+def _cache_key_to_str(cache_key: Tuple[str, Tuple[float, ...]]) -> str:
+    mesh, color_key = cache_key
+    return f"{mesh}|{','.join(str(c) for c in color_key)}"
+
+def _cache_key_from_str(key: str) -> Tuple[str, Tuple[float, ...]]:
+    mesh, color = key.rsplit("|", 1)
+    return mesh, tuple(float(c) for c in color.split(","))
+
+def _tower_blueprint_suffix(cache_key: Tuple[str, Tuple[float, ...]]) -> str:
+    """
+    Name suffix identifying the blueprint for a (mesh, color_key) pair.
+    The full crc32 keeps names distinct (and stable across processes, unlike hash()).
+    """
+    return f"_Color_{zlib.crc32(_cache_key_to_str(cache_key).encode('utf-8')):08x}_BP"
+
+def _load_tower_blueprint_cache() -> Dict[Tuple[str, Tuple[float, ...]], str]:
+    """Load the persisted blueprint cache, ignoring a missing or corrupt file."""
+    try:
+        with open(TOWER_BP_CACHE_FILE, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        cache = {_cache_key_from_str(k): v for k, v in data.items()}
+        # Names from older caches were not unique per key, so such entries are dropped
+        return {k: v for k, v in cache.items() if v.endswith(_tower_blueprint_suffix(k))}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable tower blueprint cache {TOWER_BP_CACHE_FILE}: {e}")
+        return {}
+
+def _flush_tower_blueprint_cache():
+    """Write the blueprint cache to disk if it changed during this session."""
+    global _tower_blueprint_cache_dirty
+    if not _tower_blueprint_cache_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(TOWER_BP_CACHE_FILE), exist_ok=True)
+        tmp_path = TOWER_BP_CACHE_FILE + ".tmp"
+        data = {_cache_key_to_str(k): v for k, v in _tower_blueprint_cache.items()}
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8"))
+        os.replace(tmp_path, TOWER_BP_CACHE_FILE)
+        _tower_blueprint_cache_dirty = False
+    except Exception as e:
+        logger.warning(f"Failed to save tower blueprint cache: {e}")
+
+# Global cache for reusable colored blueprints, read from disk on first use
+_tower_blueprint_cache = None
+_tower_blueprint_cache_dirty = False
+# Blueprints confirmed to exist in the editor during this session
+_validated_tower_blueprints = set()
+
+def _get_tower_blueprint_cache() -> Dict[Tuple[str, Tuple[float, ...]], str]:
+    """Load the persisted blueprint cache the first time it is needed and save it at exit."""
     global _tower_blueprint_cache
-    _tower_blueprint_cache.clear()
+    if _tower_blueprint_cache is None:
+        _tower_blueprint_cache = _load_tower_blueprint_cache()
+        atexit.register(_flush_tower_blueprint_cache)
+    return _tower_blueprint_cache
+
+def _cache_tower_blueprint(cache_key: Tuple[str, Tuple[float, ...]], bp_name: str):
+    global _tower_blueprint_cache_dirty
+    _get_tower_blueprint_cache()[cache_key] = bp_name
+    _validated_tower_blueprints.add(bp_name)
+    _tower_blueprint_cache_dirty = True
+
+def clear_tower_blueprint_cache():
+    """Clear the blueprint cache (including the on-disk copy). Useful when starting fresh or after errors."""
+    global _tower_blueprint_cache_dirty
+    _get_tower_blueprint_cache().clear()
+    _validated_tower_blueprints.clear()
+    _tower_blueprint_cache_dirty = True
+    _flush_tower_blueprint_cache()
     logger.info("Cleared tower blueprint cache")
 
 def get_or_create_colored_blueprint(unreal, mesh: str, color: List[float], base_name: str = "TowerPiece") -> str:
     """
     Get or create a reusable colored blueprint for tower pieces.
-    Uses a global cache to avoid creating duplicate blueprints for the same color.
+    Uses a cache persisted to disk to avoid creating duplicate blueprints for the same color.
     
     Args:
         unreal: Unreal connection object
@@ -298,24 +454,46 @@ def get_or_create_colored_blueprint(unreal, mesh: str, color: List[float], base_
         Blueprint name that can be reused for spawning
     """
     # Create a cache key based on mesh and color (rounded to avoid float precision issues)
-    color_key = tuple(round(c, 2) for c in color)  # Round to 2 decimals for better matching
+    color_key = tuple(round(float(c), 2) for c in color)  # Round to 2 decimals for better matching; floats keep the key's text stable
     cache_key = (mesh, color_key)
+    blueprint_cache = _get_tower_blueprint_cache()
     
     # Return cached blueprint if it exists
-    if cache_key in _tower_blueprint_cache:
-        bp_name = _tower_blueprint_cache[cache_key]
-        logger.info(f"CACHE HIT: Using cached blueprint {bp_name} for color {color} -> {color_key}")
-        return bp_name
+    if cache_key in blueprint_cache:
+        bp_name = blueprint_cache[cache_key]
+        if bp_name in _validated_tower_blueprints:
+            logger.info(f"CACHE HIT: Using cached blueprint {bp_name} for color {color} -> {color_key}")
+            return bp_name
+        
+        # Entry came from a previous session - make sure the asset is still there
+        check_result = unreal.send_command("get_blueprint_material_info", {
+            "blueprint_name": bp_name,
+            "component_name": "Mesh"
+        })
+        if check_result and check_result.get("status") == "success":
+            _validated_tower_blueprints.add(bp_name)
+            logger.info(f"CACHE HIT: Using persisted blueprint {bp_name} for color {color} -> {color_key}")
+            return bp_name
+        
+        logger.info(f"Persisted blueprint {bp_name} no longer exists, recreating it")
+        del blueprint_cache[cache_key]
     
-    logger.info(f"CACHE MISS: Creating new blueprint for color {color} -> {color_key}. Cache has {len(_tower_blueprint_cache)} entries.")
+    logger.info(f"CACHE MISS: Creating new blueprint for color {color} -> {color_key}. Cache has {len(blueprint_cache)} entries.")
     
     # Generate a stable, unique blueprint name for this color/mesh combination
-    color_hash = abs(hash(cache_key)) % 10000
-    bp_name = f"{base_name}_Color_{color_hash}_BP"
-    
-    # Check if this blueprint already exists from a previous session
-    # If so, just use it and cache it - no need to create a new one
-    create_result = unreal.send_command("create_blueprint", {"name": bp_name, "parent_class": "Actor"})
+    bp_name = f"{base_name}{_tower_blueprint_suffix(cache_key)}"
+    
+    # Create the blueprint with its mesh and physics in one command; compiling waits for the color.
+    # If this blueprint already exists from a previous session, just use it and cache it
+    create_result = unreal.send_command("create_physics_blueprint", {
+        "name": bp_name,
+        "component_name": "Mesh",
+        "static_mesh": mesh,
+        "simulate_physics": True,
+        "gravity_enabled": True,
+        "mass": 1.0,
+        "defer_compile": True
+    })
     
     blueprint_exists = False
     if create_result and create_result.get("status") == "success":
@@ -327,65 +505,37 @@ def get_or_create_colored_blueprint(unreal, mesh: str, color: List[float], base_
         blueprint_exists = True
     else:
         # Some other error occurred
-        logger.error(f"Failed to create blueprint {bp_name}: {create_result.get('error', 'Unknown error')}")
+        error = create_result.get('error', 'Unknown error') if create_result else 'No response from Unreal'
+        logger.error(f"Failed to create blueprint {bp_name}: {error}")
         return None
     
     # If blueprint already existed, just cache and return it
     if blueprint_exists:
-        _tower_blueprint_cache[cache_key] = bp_name
+        _cache_tower_blueprint(cache_key, bp_name)
         logger.info(f"CACHED EXISTING: Reusing existing blueprint {bp_name} for color {color} -> {color_key}")
         return bp_name
     
-    # Set up the newly created blueprint
+    # Finish setting up the newly created blueprint
     try:
-        # Add mesh component
-        add_result = unreal.send_command("add_component_to_blueprint", {
-            "blueprint_name": bp_name,
-            "component_type": "StaticMeshComponent", 
-            "component_name": "Mesh"
-        })
-        if not add_result or not add_result.get("status") == "success":
-            logger.warning(f"Failed to add component to {bp_name}")
-            return None
-        
-        # Set mesh properties
-        mesh_result = unreal.send_command("set_static_mesh_properties", {
-            "blueprint_name": bp_name,
-            "component_name": "Mesh",
-            "static_mesh": mesh
-        })
-        if not mesh_result or not mesh_result.get("status") == "success":
-            logger.warning(f"Failed to set mesh properties for {bp_name}")
-        
-        # Set physics properties
-        physics_result = unreal.send_command("set_physics_properties", {
-            "blueprint_name": bp_name,
-            "component_name": "Mesh",
-            "simulate_physics": True,
-            "gravity_enabled": True,
-            "mass": 1.0
-        })
-        if not physics_result or not physics_result.get("status") == "success":
-            logger.warning(f"Failed to set physics properties for {bp_name}")
-        
-        # Apply color
-        color_result = unreal.send_command("set_mesh_material_color", {
-            "blueprint_name": bp_name,
-            "component_name": "Mesh",
-            "color": color,
-            "material_slot": 0
-        })
+        # Apply color and compile, pipelined - Unreal runs them in order
+        color_result, compile_result = unreal.send_commands([
+            ("set_mesh_material_color", {
+                "blueprint_name": bp_name,
+                "component_name": "Mesh",
+                "color": color,
+                "material_slot": 0
+            }),
+            ("compile_blueprint", {"blueprint_name": bp_name})
+        ])
         if not color_result or not color_result.get("status") == "success":
             logger.warning(f"Failed to set color for {bp_name}")
         
-        # Compile blueprint
-        compile_result = unreal.send_command("compile_blueprint", {"blueprint_name": bp_name})
         if not compile_result or not compile_result.get("status") == "success":
             logger.warning(f"Failed to compile blueprint {bp_name}")
         
         # Cache the blueprint for reuse
-        _tower_blueprint_cache[cache_key] = bp_name
-        logger.info(f"CACHED NEW: Created and cached new blueprint {bp_name} for color {color} -> {color_key}. Cache now has {len(_tower_blueprint_cache)} entries.")
+        _cache_tower_blueprint(cache_key, bp_name)
+        logger.info(f"CACHED NEW: Created and cached new blueprint {bp_name} for color {color} -> {color_key}. Cache now has {len(blueprint_cache)} entries.")
         
         return bp_name
         
@@ -415,8 +565,9 @@ def create_tower_blueprints_and_batch_spawn(
         Dict with success status and spawned actors list
     """
     try:
-        from helpers.actor_utilities import spawn_blueprint_actor
+        from helpers.actor_name_manager import get_global_actor_name_manager
         
+        name_manager = get_global_actor_name_manager()
         logger.info(f"Creating tower with {len(tower_pieces)} pieces")
         spawned_actors = []
         
@@ -430,81 +581,43 @@ def create_tower_blueprints_and_batch_spawn(
         
         logger.info(f"Tower uses {len(color_groups)} unique colors")
         
-        # Create one blueprint per unique color and spawn all pieces of that color
+        # Resolve one blueprint per unique color first, so that all pieces then go out as a single
+        # pipelined run of spawn_blueprint_actor commands with the scale applied at spawn. Unreal
+        # serves one connection and runs commands in order, so keeping that one pipeline full is
+        # what overlaps the round trips. Names are made unique against the local cache only and
+        # reserved up front, as in safe_spawn_actors_batch.
+        commands = []
+        command_pieces = []
         for color_key, pieces in color_groups.items():
             color = list(color_key)  # Convert back to list
-            logger.info(f"Processing {len(pieces)} pieces with color {color}")
-            
-            # Create blueprint for this color
-            color_hash = abs(hash(color_key)) % 10000
-            bp_name = f"{name_prefix}_Color_{color_hash}_BP"
             
-            # Try to create blueprint (or reuse if exists)
-            create_result = unreal.send_command("create_blueprint", {"name": bp_name, "parent_class": "Actor"})
-            
-            blueprint_exists = False
-            if create_result and create_result.get("status") == "success":
-                logger.info(f"Created new blueprint {bp_name} for color {color}")
-                
-                # Set up the blueprint
-                # Add mesh component
-                unreal.send_command("add_component_to_blueprint", {
-                    "blueprint_name": bp_name,
-                    "component_type": "StaticMeshComponent", 
-                    "component_name": "Mesh"
-                })
-                
-                # Set mesh properties
-                unreal.send_command("set_static_mesh_properties", {
-                    "blueprint_name": bp_name,
-                    "component_name": "Mesh",
-                    "static_mesh": mesh
-                })
-                
-                # Set physics properties
-                unreal.send_command("set_physics_properties", {
-                    "blueprint_name": bp_name,
-                    "component_name": "Mesh",
-                    "simulate_physics": True,
-                    "gravity_enabled": True,
-                    "mass": 1.0
-                })
-                
-                # Apply color
-                unreal.send_command("set_mesh_material_color", {
-                    "blueprint_name": bp_name,
-                    "component_name": "Mesh",
-                    "color": color,
-                    "material_slot": 0
-                })
-                
-                # Compile blueprint
-                unreal.send_command("compile_blueprint", {"blueprint_name": bp_name})
-                
-            elif create_result and "already exists" in create_result.get("error", "").lower():
-                logger.info(f"Blueprint {bp_name} already exists, reusing it")
-                blueprint_exists = True
-            else:
-                logger.error(f"Failed to create blueprint {bp_name}: {create_result.get('error', 'Unknown error')}")
+            # Get (or create) the blueprint for this color - cached across sessions
+            bp_name = get_or_create_colored_blueprint(unreal, mesh, color, name_prefix)
+            if not bp_name:
+                logger.error(f"Failed to get blueprint for color {color}")
                 continue
             
-            # Now spawn all pieces of this color using the same blueprint
-            pieces_spawned = 0
             for piece in pieces:
-                spawn_result = spawn_blueprint_actor(unreal, bp_name, piece["name"], piece["location"])
-                if spawn_result.get("status") == "success":
-                    # Set correct scale
-                    spawned_name = spawn_result.get("result", {}).get("name", piece["name"])
-                    unreal.send_command("set_actor_transform", {
-                        "name": spawned_name,
-                        "scale": piece["scale"]
-                    })
-                    spawned_actors.append(spawn_result)
-                    pieces_spawned += 1
-                else:
-                    logger.warning(f"Failed to spawn piece {piece['name']}")
-            
-            logger.info(f"Spawned {pieces_spawned}/{len(pieces)} pieces for color {color}")
+                actor_name = name_manager.generate_unique_name(piece["name"])
+                name_manager.mark_actor_created(actor_name)
+                commands.append(("spawn_blueprint_actor", {
+                    "blueprint_name": bp_name,
+                    "actor_name": actor_name,
+                    "location": piece["location"],
+                    "rotation": [0, 0, 0],
+                    "scale": piece["scale"]
+                }))
+                command_pieces.append(piece)
+        
+        spawn_results = unreal.send_commands(commands) if commands else []
+        for piece, (_, params), spawn_result in zip(command_pieces, commands, spawn_results):
+            if spawn_result and spawn_result.get("status") == "success":
+                if isinstance(spawn_result.get("result"), dict):
+                    spawn_result["result"]["final_name"] = params["actor_name"]
+                    spawn_result["result"]["original_name"] = piece["name"]
+                spawned_actors.append(spawn_result)
+            else:
+                logger.warning(f"Failed to spawn piece {piece['name']}")
         
         logger.info(f"Tower creation complete! Created {len(color_groups)} blueprints and spawned {len(spawned_actors)} actors")
         
@@ -571,13 +684,13 @@ def create_decorative_tower_elements(unreal, location: List[float], base_size: i
                 spawned.append(result)
         
         # Add corner banners/flags every few levels
+        flag_radius = (base_size * 0.6) * 100
         for level in range(0, height, max(1, height // 8)):
             level_height = location[2] + level * 100
             
-            for corner in range(4):
-                angle = corner * math.pi / 2
-                flag_x = location[0] + (base_size * 0.6) * 100 * math.cos(angle)
-                flag_y = location[1] + (base_size * 0.6) * 100 * math.sin(angle)
+            for corner, (dx, dy) in enumerate(CORNER_OFFSETS):
+                flag_x = location[0] + flag_radius * dx
+                flag_y = location[1] + flag_radius * dy
                 
                 # Create flag pole
                 actor_name = f"{name_prefix}_flag_{level}_{corner}"
@@ -0,0 +1,236 @@
+"""
+Tests for the Unreal connection layer: when a command may be sent again after a connection
+failure, and how replies that arrive together are split up.
+
+Unreal's side of the connection is one end of a socket.socketpair(), so no editor is needed.
+"""
+
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+import unreal_mcp_server_advanced as server
+
+
+def _frame(obj):
+    payload = json.dumps(obj).encode("utf-8")
+    return struct.pack(">I", len(payload)) + payload
+
+
+def _read_frame(sock):
+    """Read one length-prefixed command from the client side, or None once it is closed."""
+    header = sock.recv(4, socket.MSG_WAITALL)
+    if len(header) < 4:
+        return None
+    (length,) = struct.unpack(">I", header)
+    return json.loads(sock.recv(length, socket.MSG_WAITALL))
+
+
+def _echo(command_type):
+    return _frame({"status": "success", "result": {"echo": command_type}})
+
+
+class FakeUnreal:
+    """Answers every command with an echo of its type and records what it received.
+    
+    With hang_up_after set, it instead reads that many commands, stops reading, answers only the
+    first one and closes the connection, leaving the others in flight: the client's next write fails.
+    """
+
+    def __init__(self, sock, hang_up_after=None):
+        self.sock = sock
+        self.hang_up_after = hang_up_after
+        self.received = []
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        with self.sock:
+            while True:
+                command = _read_frame(self.sock)
+                if command is None:
+                    return
+                self.received.append(command["type"])
+                if self.hang_up_after is None:
+                    self.sock.sendall(_echo(command["type"]))
+                elif len(self.received) == self.hang_up_after:
+                    self.sock.shutdown(socket.SHUT_RD)
+                    self.sock.sendall(_echo(self.received[0]))
+                    return
+
+    def join(self):
+        self.thread.join(timeout=5)
+        return self.received
+
+
+class PartialSocket:
+    """A socket that writes only the first `limit` bytes of a send, then fails, as if the
+    connection dropped partway through a frame."""
+
+    def __init__(self, sock, limit):
+        self._sock = sock
+        self._limit = limit
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+    def sendmsg(self, buffers):
+        return self._sock.send(b"".join(buffers)[:self._limit])
+
+    def send(self, data):
+        return self._sock.send(data[:self._limit])
+
+    def sendall(self, data):
+        raise ConnectionResetError("connection reset mid-frame")
+
+
+def _dead_socket():
+    """A client socket whose peer has already gone, so its first write fails."""
+    client, peer = socket.socketpair()
+    peer.close()
+    return client
+
+
+def _connection(*sockets):
+    """An UnrealConnection on the first of the given client sockets; each reconnect takes the next
+    one, and every reconnect attempt is counted in conn.connects."""
+    conn = server.UnrealConnection()
+    conn.bulk_msgpack = False
+    conn.connects = 0
+    pending = list(sockets)
+
+    def connect():
+        conn.connects += 1
+        if not pending:
+            return False
+        conn.socket = pending.pop(0)
+        conn.socket.settimeout(5)
+        conn.connected = True
+        return True
+
+    conn.connect = connect
+    connect()
+    conn.connects = 0
+    return conn
+
+
+def test_exchange_retries_a_command_that_was_never_sent():
+    client, peer = socket.socketpair()
+    unreal = FakeUnreal(peer)
+    conn = _connection(_dead_socket(), client)
+
+    reply = json.loads(bytes(conn._exchange("ping", None, False)))
+
+    assert reply["result"]["echo"] == "ping"
+    assert conn.connects == 1
+    conn.disconnect()
+    assert unreal.join() == ["ping"]
+
+
+def test_exchange_does_not_retry_after_part_of_the_frame_was_sent():
+    client, peer = socket.socketpair()
+    conn = _connection(PartialSocket(client, 3))
+
+    with pytest.raises(ConnectionError) as excinfo:
+        conn._exchange("spawn_actor", {"name": "Cube"}, False)
+
+    assert not isinstance(excinfo.value, server._FrameNotSent)
+    assert conn.connects == 0
+    assert len(peer.recv(64)) == 3
+    client.close()
+    peer.close()
+
+
+def test_send_command_reports_a_partially_sent_command_as_an_error():
+    client, peer = socket.socketpair()
+    conn = _connection(PartialSocket(client, 3))
+    conn._is_alive = lambda: conn.connected
+
+    response = conn.send_command("spawn_actor", {"name": "Cube"})
+
+    assert response["status"] == "error"
+    assert conn.connects == 0
+    peer.close()
+
+
+def test_send_commands_resumes_when_nothing_was_sent():
+    client, peer = socket.socketpair()
+    unreal = FakeUnreal(peer)
+    conn = _connection(_dead_socket(), client)
+    conn._is_alive = lambda: conn.connected
+    commands = [(f"command_{i}", {}) for i in range(6)]
+
+    responses = conn.send_commands(commands)
+
+    assert [r["result"]["echo"] for r in responses] == [command for command, _ in commands]
+    assert conn.connects == 1
+    conn.disconnect()
+    assert unreal.join() == [command for command, _ in commands]
+
+
+def test_send_commands_never_replays_commands_in_flight():
+    client, peer = socket.socketpair()
+    unreal = FakeUnreal(peer, hang_up_after=server.PIPELINE_DEPTH)
+    conn = _connection(client)
+    commands = [(f"command_{i}", {}) for i in range(server.PIPELINE_DEPTH + 2)]
+
+    responses = conn.send_commands(commands)
+
+    assert responses[0]["result"]["echo"] == "command_0"
+    # The commands that were in flight may have run, so they are reported and not sent again
+    assert all(r["status"] == "error" and "in flight" in r["error"] for r in responses[1:])
+    assert len(responses) == len(commands)
+    assert conn.connects == 0
+    assert unreal.join() == [command for command, _ in commands[:server.PIPELINE_DEPTH]]
+
+
+def test_receive_returns_buffered_replies_without_reading():
+    client, peer = socket.socketpair()
+    conn = _connection(client)
+    peer.sendall(_frame({"n": 1}) + _frame({"n": 2}) + _frame({"n": 3}))
+
+    assert json.loads(bytes(conn.receive_full_response(client))) == {"n": 1}
+    assert conn._recv_pending != (0, 0)
+    assert not conn._is_alive()
+    # Nothing more will arrive: the next two replies must come from what was already read
+    peer.close()
+    assert json.loads(bytes(conn.receive_full_response(client))) == {"n": 2}
+    assert json.loads(bytes(conn.receive_full_response(client))) == {"n": 3}
+    assert conn._recv_pending == (0, 0)
+    with pytest.raises(ConnectionError):
+        conn.receive_full_response(client)
+    client.close()
+
+
+@pytest.mark.parametrize("buffered", [3, 10])
+def test_receive_completes_a_partly_buffered_reply(buffered):
+    client, peer = socket.socketpair()
+    conn = _connection(client)
+    second_reply = {"n": 2, "padding": "x" * 300}
+    second = _frame(second_reply)
+    # The first read also takes the start of the next reply: part of its header, or the header
+    # and a few payload bytes
+    peer.sendall(_frame({"n": 1}) + second[:buffered])
+
+    assert json.loads(bytes(conn.receive_full_response(client))) == {"n": 1}
+    peer.sendall(second[buffered:])
+    assert json.loads(bytes(conn.receive_full_response(client))) == second_reply
+    assert conn._recv_pending == (0, 0)
+    client.close()
+    peer.close()
+
+
+def test_receive_grows_the_buffer_and_keeps_leftovers():
+    client, peer = socket.socketpair()
+    conn = _connection(client)
+    conn._recv_buf = bytearray(16)
+    large = {"padding": "y" * 1000}
+    peer.sendall(_frame(large) + _frame({"n": 2}))
+
+    assert json.loads(bytes(conn.receive_full_response(client))) == large
+    assert json.loads(bytes(conn.receive_full_response(client))) == {"n": 2}
+    client.close()
+    peer.close()
@@ -5,14 +5,41 @@ A streamlined MCP server focused on advanced composition tools for Unreal Engine
 Contains only the advanced tools from the expanded MCP tool system to keep tool count manageable.
 """
 
+import asyncio
+import contextvars
+import functools
+import itertools
 import logging
+import os
 import socket
 import json
 import math
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Optional, List
+import random
+import struct
+import threading
+import time
+import uuid
+from collections import namedtuple
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple, Union
+import numpy as np
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from helpers.infrastructure_creation import (
     _create_street_grid, _create_street_lights, _create_town_vehicles, _create_town_decorations,
     _create_traffic_lights, _create_street_signage, _create_sidewalks_crosswalks, _create_urban_furniture,
@@ -34,15 +61,17 @@ from helpers.mansion_creation import (
 )
 from helpers.actor_utilities import spawn_blueprint_actor, get_blueprint_material_info
 from helpers.actor_name_manager import (
-    safe_spawn_actor, safe_delete_actor
+    safe_spawn_actors_batch, safe_delete_actor, SpawnBuffer
 )
 from helpers.bridge_aqueduct_creation import (
-    build_suspension_bridge_structure, build_aqueduct_structure
+    build_suspension_bridge_structure, build_aqueduct_structure, _counts_suspension, _aqueduct_geometry
 )
+from helpers.tower_creation import CORNER_OFFSETS
 
 # Configure logging with more detailed format
+# (set UNREAL_MCP_LOG_LEVEL=DEBUG to log every command and response payload)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get("UNREAL_MCP_LOG_LEVEL", "WARNING").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
     handlers=[
         logging.FileHandler('unreal_mcp_advanced.log'),
@@ -53,14 +82,135 @@ logger = logging.getLogger("UnrealMCP_Advanced")
 # Configuration
 UNREAL_HOST = "127.0.0.1"
 UNREAL_PORT = 55557
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+RECV_BUFFER_SIZE = 1024 * 1024
+# A missing editor should fail fast; the response timeout bounds how long one command may hold the connection
+CONNECT_TIMEOUT = 2.0
+RESPONSE_TIMEOUT = float(os.environ.get("UNREAL_MCP_TIMEOUT", "10"))
+# Commands send_commands keeps in flight, so Unreal starts the next one while a reply is in transit
+PIPELINE_DEPTH = max(1, int(os.environ.get("UNREAL_MCP_PIPELINE_DEPTH", "4")))
+# Plugin builds from before length-prefixed framing expect bare JSON messages
+LEGACY_PROTOCOL = os.environ.get("UNREAL_MCP_LEGACY_PROTOCOL", "").lower() in ("1", "true", "yes")
+# Wire format (needs the msgpack package for anything but JSON; the plugin replies in kind):
+#   "auto"    - MessagePack for BULK_COMMANDS once the plugin has answered a MessagePack ping, JSON otherwise
+#   "msgpack" - MessagePack for every command
+#   "json"    - JSON only
+WIRE_FORMAT = os.environ.get("UNREAL_MCP_WIRE_FORMAT", "auto").lower()
+# Commands whose payloads are large enough for binary encoding to pay off
+BULK_COMMANDS = frozenset({"spawn_actors_batch", "batch_spawn_instances"})
+# Structures that would spawn more actors than this are refused before anything is sent to Unreal
+MAX_ACTORS = int(os.environ.get("UNREAL_MCP_MAX_ACTORS", "50000"))
+
+def _numpy_default(obj: Any) -> Any:
+    """Convert numpy values an encoder cannot serialize natively (any numpy value for msgpack and
+    the stdlib json module; non-contiguous arrays and other dtypes for orjson)."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+def _encode_command(command_obj: Dict[str, Any], use_msgpack: bool = False) -> bytes:
+    """Serialize a command payload, preferring orjson (handles numpy arrays natively)."""
+    if use_msgpack:
+        return msgpack.packb(command_obj, use_bin_type=True, default=_numpy_default)
+    if orjson is not None:
+        return orjson.dumps(command_obj, default=_numpy_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    # Compact separators match orjson's output size
+    return json.dumps(command_obj, separators=(",", ":"), default=_numpy_default).encode('utf-8')
+
+class _ParsedReply(bytes):
+    """A bare JSON reply that was already parsed while finding where it ends (see _receive_unframed)."""
+
+def _decode_response(data: Union[bytes, memoryview]) -> Any:
+    """Parse a response payload, preferring orjson (accepts bytes and memoryviews directly).
+    
+    JSON replies always start with '{'; anything else is a MessagePack map.
+    """
+    if isinstance(data, _ParsedReply):
+        return data.parsed
+    if msgpack is not None and data[:1] != b'{':
+        return msgpack.unpackb(data, raw=False)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+class _FrameNotSent(ConnectionError):
+    """The connection failed before any byte of a frame was written, so Unreal never saw that command."""
+
+def _send_frame(sock: socket.socket, parts: Tuple[bytes, ...]) -> None:
+    """Send a length prefix and its payload with one gather write, without joining them first.
+    
+    sendmsg can return after a partial write, in which case the rest goes out with sendall.
+    Platforms without sendmsg (Windows) send the joined frame. A connection error on the first
+    write raises _FrameNotSent; once part of the frame is out, errors are raised as they are.
+    """
+    if len(parts) > 1 and not hasattr(sock, "sendmsg"):
+        parts = (b"".join(parts),)
+    try:
+        sent = sock.sendmsg(parts) if len(parts) > 1 else sock.send(parts[0])
+    except ConnectionError as e:
+        raise _FrameNotSent(str(e)) from e
+    for part in parts:
+        if sent >= len(part):
+            sent -= len(part)
+            continue
+        sock.sendall(memoryview(part)[sent:])
+        sent = 0
+
+def _enable_quickack(sock: socket.socket) -> None:
+    """Ask Linux to ACK immediately instead of delaying up to 40 ms.
+    
+    With TCP_NODELAY set, the remaining stall in a request/response exchange is the peer
+    waiting on a delayed ACK. The kernel clears TCP_QUICKACK on its own, so it is re-armed
+    after every receive, including each read of a reply that arrives in several pieces.
+    No-op on platforms without the option.
+    """
+    if hasattr(socket, "TCP_QUICKACK"):
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError:
+            pass
+
+def _tune_keepalive(sock: socket.socket) -> None:
+    """Probe an idle pooled connection after 30 s instead of the OS default (2 hours on Linux).
+    
+    The socket is kept open between tool calls, so a crashed or closed editor should be
+    noticed by the kernel well before the next command. No-op where the options are missing.
+    """
+    for option, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, option):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+            except OSError:
+                pass
 
 class UnrealConnection:
     """Connection to an Unreal Engine instance."""
     
-    def __init__(self):
-        """Initialize the connection."""
+    def __init__(self, keepalive: bool = True, framed: bool = not LEGACY_PROTOCOL):
+        """Initialize the connection.
+        
+        Args:
+            keepalive: Reuse the socket across commands instead of reconnecting for each one
+            framed: Use length-prefixed messages; False talks bare JSON to older plugin builds
+        """
         self.socket = None
         self.connected = False
+        self.keepalive = keepalive
+        self.framed = framed
+        # MessagePack needs framing - bare payloads are only delimited by parsing JSON
+        self.use_msgpack = framed and WIRE_FORMAT == "msgpack"
+        if self.use_msgpack and msgpack is None:
+            logger.warning("UNREAL_MCP_WIRE_FORMAT=msgpack but the msgpack package is not installed, using JSON")
+            self.use_msgpack = False
+        # Bulk commands switch to MessagePack in "auto" mode; None until the plugin has been probed
+        self.bulk_msgpack = framed and WIRE_FORMAT == "auto" and msgpack is not None
+        self._peer_msgpack: Optional[bool] = None
+        # Receive buffer reused across responses; only reallocated when a response outgrows it
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
+        # (start, end) of bytes already received past the last reply, e.g. the start of the next pipelined one
+        self._recv_pending = (0, 0)
+        # Serializes send/receive pairs - tools may be invoked concurrently
+        self._lock = threading.Lock()
     
     def connect(self) -> bool:
         """Connect to the Unreal Engine instance."""
@@ -72,18 +222,24 @@ class UnrealConnection:
                 except:
                     pass
                 self.socket = None
+            self._recv_pending = (0, 0)
             
             logger.info(f"Connecting to Unreal at {UNREAL_HOST}:{UNREAL_PORT}...")
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(30)
+            self.socket.settimeout(CONNECT_TIMEOUT)
             
             # Set socket options for better stability
             self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            _tune_keepalive(self.socket)
+            # Large buffers for multi-MB responses and batch payloads (capped by net.core.rmem_max/wmem_max on Linux)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
             
             self.socket.connect((UNREAL_HOST, UNREAL_PORT))
+            _enable_quickack(self.socket)
+            # Set once for the data phase rather than on every receive
+            self.socket.settimeout(RESPONSE_TIMEOUT)
             self.connected = True
             logger.info("Connected to Unreal Engine")
             return True
@@ -102,134 +258,405 @@ class UnrealConnection:
                 pass
         self.socket = None
         self.connected = False
+        self._recv_pending = (0, 0)
 
-    def receive_full_response(self, sock, buffer_size=4096) -> bytes:
-        """Receive a complete response from Unreal, handling chunked data."""
-        chunks = []
-        sock.settimeout(30)
+    def receive_full_response(self, sock) -> Union[bytes, memoryview]:
+        """Receive one length-prefixed response from Unreal.
+        
+        Each message is a 4-byte big-endian payload length followed by a JSON or MessagePack payload,
+        so the payload is read exactly once and parsed once. Framed payloads are returned as a view
+        into the connection's receive buffer, which is only valid until the next receive.
+        """
         try:
-            while True:
-                chunk = sock.recv(buffer_size)
-                if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                chunks.append(chunk)
-                
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
-                
-                # Try to parse as JSON to check if complete
-                try:
-                    json.loads(decoded_data)
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
-                    # Not complete JSON yet, continue reading
-                    logger.debug(f"Received partial response, waiting for more data...")
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    continue
+            # Reads are optimistic: each recv_into takes as much as the buffer holds, so a small reply
+            # usually arrives with its header in one call. Bytes past the end of this reply belong to
+            # the next pipelined one and are kept for the next receive.
+            buf = self._recv_buf
+            start, end = self._recv_pending
+            self._recv_pending = (0, 0)
+            if self.framed and end - start >= 4 and buf[start] != 0x7b:
+                (length,) = struct.unpack_from(">I", buf, start)
+                frame_end = start + 4 + length
+                if frame_end <= end:
+                    # Already buffered by an earlier read - no syscalls, and nothing is moved
+                    if end > frame_end:
+                        self._recv_pending = (frame_end, end)
+                    logger.debug("Received complete response (%d bytes)", length)
+                    return memoryview(buf)[start + 4:frame_end]
+            if start:
+                # Only the start of a reply is buffered; move it to the front and read the rest
+                buf[:end - start] = buf[start:end]
+                end -= start
+            
+            while end < 1:
+                received = sock.recv_into(memoryview(buf)[end:])
+                if not received:
+                    raise ConnectionError("Connection closed before receiving data")
+                end += received
+            # A frame length can never start with '{' (that would be a >2 GB message),
+            # so this is a bare JSON reply from an older plugin build
+            if not self.framed or buf[0] == 0x7b:
+                return self._receive_unframed(sock, bytes(buf[:end]))
+            
+            while end < 4:
+                received = sock.recv_into(memoryview(buf)[end:])
+                if not received:
+                    raise ConnectionError("Connection closed before receiving data")
+                end += received
+            
+            (length,) = struct.unpack_from(">I", buf)
+            frame_end = 4 + length
+            if frame_end > len(buf):
+                # A fresh buffer rather than an in-place resize, which fails while a previous view is alive
+                grown = bytearray(frame_end)
+                grown[:end] = buf[:end]
+                buf = self._recv_buf = grown
+            while end < frame_end:
+                received = sock.recv_into(memoryview(buf)[end:])
+                if not received:
+                    raise ConnectionError(f"Connection closed mid-response ({end - 4}/{length} bytes)")
+                end += received
+                # Keep ACKing promptly while a large reply streams in, so Unreal's send window keeps growing
+                _enable_quickack(sock)
+            if end > frame_end:
+                self._recv_pending = (frame_end, end)
+            
+            _enable_quickack(sock)
+            logger.debug("Received complete response (%d bytes)", length)
+            return memoryview(buf)[4:frame_end]
         except socket.timeout:
             logger.warning("Socket timeout during receive")
-            if chunks:
-                data = b''.join(chunks)
-                try:
-                    json.loads(data.decode('utf-8'))
-                    logger.info(f"Using partial response after timeout ({len(data)} bytes)")
-                    return data
-                except:
-                    pass
-            raise Exception("Timeout receiving Unreal response")
+            raise TimeoutError("Timeout receiving Unreal response")
         except Exception as e:
             logger.error(f"Error during receive: {str(e)}")
             raise
     
-    def send_command(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
-        """Send a command to Unreal Engine and get the response."""
-        # Always reconnect for each command
-        if self.socket:
+    def _receive_unframed(self, sock, initial: bytes) -> bytes:
+        """Receive a bare JSON response (legacy protocol) by parsing until the document is complete.
+        
+        Chunks are received straight into the connection's receive buffer. The successful parse is
+        kept with the returned bytes, so _decode_response doesn't parse the response a second time.
+        """
+        buf = self._recv_buf
+        length = len(initial)
+        buf[:length] = initial
+        while True:
+            # Only attempt a parse when the buffer could end a JSON document
+            if buf[length - 1] in b'}]':
+                try:
+                    parsed = _decode_response(memoryview(buf)[:length])
+                except ValueError:
+                    pass
+                else:
+                    _enable_quickack(sock)
+                    logger.debug("Received complete legacy response (%d bytes)", length)
+                    reply = _ParsedReply(memoryview(buf)[:length])
+                    reply.parsed = parsed
+                    return reply
+            if length == len(buf):
+                # Grow into a fresh buffer rather than resizing in place, which fails while a view is alive
+                grown = bytearray(2 * length)
+                grown[:length] = buf
+                buf = self._recv_buf = grown
+            received = sock.recv_into(memoryview(buf)[length:])
+            if not received:
+                raise ConnectionError("Connection closed before receiving a complete response")
+            length += received
+    
+    def _is_alive(self) -> bool:
+        """Cheaply check that the pooled socket can be reused, without a round trip."""
+        if not (self.connected and self.socket):
+            return False
+        if self._recv_pending[1]:
+            logger.info("Unexpected data pending on Unreal connection, reconnecting")
+            return False
+        try:
+            # Pending errors (e.g. a reset) are reported through SO_ERROR
+            error = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if error:
+                logger.info(f"Unreal connection error pending ({os.strerror(error)}), reconnecting")
+                return False
+            # A readable socket between commands means the peer closed it (or sent stray data).
+            # Python polls timeout sockets before recv, so MSG_DONTWAIT alone would still block.
+            self.socket.setblocking(False)
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            self.connected = False
+                pending = self.socket.recv(1, socket.MSG_PEEK)
+            finally:
+                self.socket.settimeout(RESPONSE_TIMEOUT)
+            if pending:
+                logger.info("Unexpected data pending on Unreal connection, reconnecting")
+            else:
+                logger.info("Unreal connection closed by peer, reconnecting")
+        except BlockingIOError:
+            return True
+        except OSError as e:
+            logger.info(f"Unreal connection check failed ({e}), reconnecting")
+        return False
+    
+    def _ensure_connected(self) -> bool:
+        """Reuse the current socket if it is still alive, otherwise reconnect."""
+        if self._is_alive():
+            return True
+        self.disconnect()
+        return self.connect()
+    
+    def _wire_msgpack(self, command: str) -> bool:
+        """Whether to send this command as MessagePack.
         
-        if not self.connect():
-            logger.error("Failed to connect to Unreal Engine for command")
-            return None
+        Must be called with the lock held, a live connection and nothing in flight.
+        """
+        if self.use_msgpack:
+            return True
+        if not self.bulk_msgpack or command not in BULK_COMMANDS:
+            return False
+        if self._peer_msgpack is None:
+            # Plugin builds without MessagePack support answer the ping with a JSON error or drop the
+            # connection; the result sticks for this connection object
+            try:
+                self._peer_msgpack = self._exchange("ping", None, True)[:1] != b'{'
+            except Exception as e:
+                logger.info(f"MessagePack probe failed ({e}), using JSON")
+                self._peer_msgpack = False
+                self.disconnect()
+                self.connect()
+            logger.info(f"Bulk commands use {'MessagePack' if self._peer_msgpack else 'JSON'}")
+        return self._peer_msgpack
+    
+    def _frame(self, command: str, params: Optional[Dict[str, Any]], use_msgpack: bool) -> Tuple[bytes, ...]:
+        """Encode one command as the buffers to send (see _send_frame): its length prefix, unless
+        talking to a legacy plugin, and the payload."""
+        command_obj = {
+            "type": command,
+            "params": params or {}
+        }
+        
+        command_bytes = _encode_command(command_obj, use_msgpack)
+        logger.debug("Sending command %s (%d bytes)", command, len(command_bytes))
+        if self.framed:
+            return struct.pack(">I", len(command_bytes)), command_bytes
+        return (command_bytes,)
+    
+    def _exchange(self, command: str, params: Optional[Dict[str, Any]], use_msgpack: bool) -> Union[bytes, memoryview]:
+        """Send one command and return the undecoded response payload.
         
+        Must be called with the lock held and a live connection.
+        """
+        frame = self._frame(command, params, use_msgpack)
         try:
-            command_obj = {
-                "type": command,
-                "params": params or {}
+            _send_frame(self.socket, frame)
+        except _FrameNotSent as e:
+            # The pooled socket was dropped by Unreal and the command never left - reconnect and
+            # retry once. Failures after that point are not retried: Unreal may already have run
+            # the command, and replaying a spawn would duplicate it
+            logger.warning(f"Connection lost before sending command ({e}), retrying once")
+            self.disconnect()
+            if not self.connect():
+                raise
+            _send_frame(self.socket, frame)
+        return self.receive_full_response(self.socket)
+    
+    def _check_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Log Unreal errors and normalize them to {"status": "error", "error": ...}."""
+        logger.debug("Response from Unreal: status=%s", response.get("status"))
+        
+        # Handle error responses
+        if response.get("status") == "error":
+            error_message = response.get("error") or response.get("message", "Unknown Unreal error")
+            logger.error(f"Unreal error (status=error): {error_message}")
+            if "error" not in response:
+                response["error"] = error_message
+        elif response.get("success") is False:
+            error_message = response.get("error") or response.get("message", "Unknown Unreal error")
+            logger.error(f"Unreal error (success=false): {error_message}")
+            response = {
+                "status": "error",
+                "error": error_message
             }
+        return response
+    
+    def send_command(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Send a command to Unreal Engine and get the response."""
+        with self._lock:
+            if not self._ensure_connected():
+                logger.error("Failed to connect to Unreal Engine for command")
+                return None
             
-            command_json = json.dumps(command_obj)
-            logger.info(f"Sending command: {command_json}")
-            self.socket.sendall(command_json.encode('utf-8'))
-            
-            response_data = self.receive_full_response(self.socket)
-            response = json.loads(response_data.decode('utf-8'))
-            
-            logger.info(f"Complete response from Unreal: {response}")
-            
-            # Handle error responses
-            if response.get("status") == "error":
-                error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (status=error): {error_message}")
-                if "error" not in response:
-                    response["error"] = error_message
-            elif response.get("success") is False:
-                error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (success=false): {error_message}")
-                response = {
+            try:
+                response = self._check_response(_decode_response(self._exchange(command, params, self._wire_msgpack(command))))
+                
+                if not self.keepalive:
+                    self.disconnect()
+                
+                return response
+                
+            except Exception as e:
+                logger.error(f"Error sending command: {e}")
+                self.disconnect()
+                return {
                     "status": "error",
-                    "error": error_message
+                    "error": str(e)
                 }
-            
-            # Always close the connection after command
+    
+    def _pipeline(self, commands: List[Tuple[str, Dict[str, Any]]], formats: List[bool],
+                  responses: List[Optional[Dict[str, Any]]]) -> None:
+        """Send commands with up to PIPELINE_DEPTH in flight, appending each response as it arrives.
+        
+        Must be called with the lock held and a live connection. _FrameNotSent is only raised while
+        every command sent so far has been answered, so the caller can resume from the next one.
+        """
+        # Bound once: this loop runs per command for batches of thousands
+        sock = self.socket
+        frame = self._frame
+        receive = self.receive_full_response
+        check = self._check_response
+        append = responses.append
+        in_flight = 0
+        for (command, params), use_msgpack in zip(commands, formats):
+            if in_flight == PIPELINE_DEPTH:
+                # Decode before the next receive reuses the buffer
+                append(check(_decode_response(receive(sock))))
+                in_flight -= 1
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            self.connected = False
+                _send_frame(sock, frame(command, params, use_msgpack))
+            except _FrameNotSent as e:
+                if in_flight:
+                    # Commands already sent may have run without their replies reaching us
+                    raise ConnectionError(f"{e} ({in_flight} commands in flight)") from e
+                raise
+            in_flight += 1
+        while in_flight:
+            append(check(_decode_response(receive(sock))))
+            in_flight -= 1
+    
+    def send_commands(self, commands: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Send several commands and return their responses in order.
+        
+        Up to PIPELINE_DEPTH commands are in flight at once: the next command is already queued
+        in Unreal's socket while the previous response travels back, so the plugin never sits
+        idle waiting for Python. Unreal still runs them one at a time, in order.
+        """
+        if not self.framed:
+            # Bare JSON messages can't be queued back to back
+            return [self.send_command(command, params) for command, params in commands]
+        
+        responses = []
+        with self._lock:
+            if not self._ensure_connected():
+                logger.error("Failed to connect to Unreal Engine for command")
+                return [None] * len(commands)
             
-            return response
+            try:
+                # Settle the wire format (which may probe the plugin) before anything is in flight
+                formats = [self._wire_msgpack(command) for command, _ in commands]
+                try:
+                    self._pipeline(commands, formats, responses)
+                except _FrameNotSent as e:
+                    # The socket died with nothing unanswered: the commands that have replies are done
+                    # and the rest never reached Unreal, so reconnect once and continue with those.
+                    # Any other connection error leaves commands whose outcome is unknown, and they
+                    # are reported as errors below rather than replayed
+                    logger.warning(f"Connection lost before sending command ({e}), resuming once")
+                    self.disconnect()
+                    if not self.connect():
+                        raise
+                    done = len(responses)
+                    self._pipeline(commands[done:], formats[done:], responses)
+                
+                if not self.keepalive:
+                    self.disconnect()
+                
+            except Exception as e:
+                logger.error(f"Error sending pipelined commands: {e}")
+                self.disconnect()
+                responses.extend({"status": "error", "error": str(e)} for _ in range(len(commands) - len(responses)))
+        
+        return responses
+    
+    def send_command_raw(self, command: str, params: Dict[str, Any] = None) -> Optional[str]:
+        """Send a command and return Unreal's JSON response text without parsing it.
+        
+        For pass-through tools whose result goes straight back to the MCP client: returning
+        the text avoids decoding the response only for FastMCP to serialize it again.
+        Always uses JSON on the wire, whatever the configured wire format.
+        """
+        with self._lock:
+            if not self._ensure_connected():
+                logger.error("Failed to connect to Unreal Engine for command")
+                return None
             
-        except Exception as e:
-            logger.error(f"Error sending command: {e}")
-            self.connected = False
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            return {
-                "status": "error",
-                "error": str(e)
-            }
+                response_text = str(self._exchange(command, params, False), 'utf-8')
+                
+                if not self.keepalive:
+                    self.disconnect()
+                
+                return response_text
+                
+            except Exception as e:
+                logger.error(f"Error sending command: {e}")
+                self.disconnect()
+                return json.dumps({
+                    "status": "error",
+                    "error": str(e)
+                })
 
 # Global connection state
 _unreal_connection: UnrealConnection = None
+_unreal_connection_lock = threading.Lock()
+
+# Connection resolved for the tool call running in this context. Outside a tool call it stays
+# None; threaded_tool marks each call with _UNRESOLVED and the first lookup fills it in, so the
+# helpers a tool calls into reuse that connection instead of re-checking it.
+_UNRESOLVED = object()
+_tool_connection = contextvars.ContextVar("unreal_tool_connection", default=None)
 
 def get_unreal_connection() -> Optional[UnrealConnection]:
-    """Get the connection to Unreal Engine."""
+    """Get the shared connection to Unreal Engine.
+    
+    One instance is created for the life of the server and reused as-is; liveness is checked
+    lazily by send_command, so repeated calls are just a cached lookup. If Unreal is not
+    reachable the instance is kept (with its receive buffer and wire-format probe result) and
+    the next call reconnects it. Within a tool call the first result is reused for the rest of
+    the call; send_command still reconnects if the socket drops partway through.
+    """
     global _unreal_connection
+    cached = _tool_connection.get()
+    if cached is not None and cached is not _UNRESOLVED:
+        return cached
+    
+    connection = _unreal_connection
+    if connection is not None and connection.connected:
+        if cached is _UNRESOLVED:
+            _tool_connection.set(connection)
+        return connection
+    
+    with _unreal_connection_lock:
+        try:
+            if _unreal_connection is None:
+                _unreal_connection = UnrealConnection()
+            connection = _unreal_connection
+            if connection.connected or connection.connect():
+                if cached is _UNRESOLVED:
+                    _tool_connection.set(connection)
+                return connection
+            logger.warning("Could not connect to Unreal Engine")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting Unreal connection: {e}")
+            return None
+
+@contextmanager
+def _viewport_realtime_paused(unreal: UnrealConnection):
+    """Stop realtime redraws of the level viewports while a large structure is spawned.
+    
+    Each spawn otherwise invalidates every realtime viewport; the viewports' own settings are
+    restored afterwards, even if the build fails.
+    """
+    unreal.send_command("set_viewport_realtime", {"enabled": False})
     try:
-        if _unreal_connection is None:
-            _unreal_connection = UnrealConnection()
-            if not _unreal_connection.connect():
-                logger.warning("Could not connect to Unreal Engine")
-                _unreal_connection = None
-        return _unreal_connection
-    except Exception as e:
-        logger.error(f"Error getting Unreal connection: {e}")
-        return None
+        yield
+    finally:
+        unreal.send_command("set_viewport_realtime", {"enabled": True})
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -237,14 +664,12 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     global _unreal_connection
     logger.info("UnrealMCP Advanced server starting up")
     try:
-        _unreal_connection = get_unreal_connection()
-        if _unreal_connection:
+        if get_unreal_connection():
             logger.info("Connected to Unreal Engine on startup")
         else:
             logger.warning("Could not connect to Unreal Engine on startup")
     except Exception as e:
         logger.error(f"Error connecting to Unreal Engine on startup: {e}")
-        _unreal_connection = None
     
     try:
         yield {}
@@ -261,38 +686,71 @@ mcp = FastMCP(
     lifespan=server_lifespan
 )
 
+def threaded_tool(*tool_args, **tool_kwargs):
+    """Register a blocking tool with FastMCP as an async tool that runs in a worker thread.
+    
+    Socket IO to Unreal would otherwise block the event loop for the whole call. The
+    undecorated function is returned so tools can still call each other directly.
+    """
+    def decorator(func):
+        def run_in_call_scope(*args, **kwargs):
+            # to_thread runs this in a copy of the caller's context, so the cached
+            # connection ends with the call
+            _tool_connection.set(_UNRESOLVED)
+            return func(*args, **kwargs)
+        
+        @functools.wraps(func)
+        async def async_tool(*args, **kwargs):
+            return await asyncio.to_thread(run_in_call_scope, *args, **kwargs)
+        mcp.tool(*tool_args, **tool_kwargs)(async_tool)
+        return func
+    return decorator
+
+def unreal_command(command: str, raw: bool = False):
+    """Make a tool from a function that only builds the params for one Unreal command.
+    
+    The tool sends the command on the shared connection and returns Unreal's response, or the
+    usual {"success": False, "message": ...} when there is no connection, no response or an
+    error. With raw, the response is passed through as Unreal's JSON text (see send_command_raw).
+    Put it below @threaded_tool().
+    """
+    def decorator(build_params):
+        @functools.wraps(build_params)
+        def tool(*args, **kwargs):
+            unreal = get_unreal_connection()
+            if not unreal:
+                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            
+            try:
+                params = build_params(*args, **kwargs)
+                if raw:
+                    response = unreal.send_command_raw(command, params)
+                else:
+                    response = unreal.send_command(command, params)
+                return response or {"success": False, "message": "No response from Unreal"}
+            except Exception as e:
+                logger.error(f"{command} error: {e}")
+                return {"success": False, "message": str(e)}
+        return tool
+    return decorator
+
 # Essential Actor Management Tools
-@mcp.tool()
-def get_actors_in_level(random_string: str = "") -> Dict[str, Any]:
+@threaded_tool()
+@unreal_command("get_actors_in_level", raw=True)
+def get_actors_in_level(random_string: str = "") -> Union[str, Dict[str, Any]]:
     """Get a list of all actors in the current level."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        response = unreal.send_command("get_actors_in_level", {})
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"get_actors_in_level error: {e}")
-        return {"success": False, "message": str(e)}
+    # Large listings are passed through as Unreal's JSON text instead of being re-serialized
+    return {}
 
-@mcp.tool()
-def find_actors_by_name(pattern: str) -> Dict[str, Any]:
+@threaded_tool()
+@unreal_command("find_actors_by_name", raw=True)
+def find_actors_by_name(pattern: str) -> Union[str, Dict[str, Any]]:
     """Find actors by name pattern."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        response = unreal.send_command("find_actors_by_name", {"pattern": pattern})
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"find_actors_by_name error: {e}")
-        return {"success": False, "message": str(e)}
+    return {"pattern": pattern}
 
 
 
-@mcp.tool()
+@threaded_tool()
 def delete_actor(name: str) -> Dict[str, Any]:
     """Delete an actor by name."""
     unreal = get_unreal_connection()
@@ -307,7 +765,8 @@ def delete_actor(name: str) -> Dict[str, Any]:
         logger.error(f"delete_actor error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
+@unreal_command("set_actor_transform")
 def set_actor_transform(
     name: str,
     location: List[float] = None,
@@ -315,45 +774,27 @@ def set_actor_transform(
     scale: List[float] = None
 ) -> Dict[str, Any]:
     """Set the transform of an actor."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {"name": name}
-        if location is not None:
-            params["location"] = location
-        if rotation is not None:
-            params["rotation"] = rotation
-        if scale is not None:
-            params["scale"] = scale
-            
-        response = unreal.send_command("set_actor_transform", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"set_actor_transform error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {"name": name}
+    if location is not None:
+        params["location"] = location
+    if rotation is not None:
+        params["rotation"] = rotation
+    if scale is not None:
+        params["scale"] = scale
+    return params
 
 # Essential Blueprint Tools for Physics Actors
-@mcp.tool()
+@threaded_tool()
+@unreal_command("create_blueprint")
 def create_blueprint(name: str, parent_class: str) -> Dict[str, Any]:
     """Create a new Blueprint class."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "name": name,
-            "parent_class": parent_class
-        }
-        response = unreal.send_command("create_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"create_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
+    return {
+        "name": name,
+        "parent_class": parent_class
+    }
 
-@mcp.tool()
+@threaded_tool()
+@unreal_command("add_component_to_blueprint")
 def add_component_to_blueprint(
     blueprint_name: str,
     component_type: str,
@@ -364,50 +805,32 @@ def add_component_to_blueprint(
     component_properties: Dict[str, Any] = {}
 ) -> Dict[str, Any]:
     """Add a component to a Blueprint."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_type": component_type,
-            "component_name": component_name,
-            "location": location,
-            "rotation": rotation,
-            "scale": scale,
-            "component_properties": component_properties
-        }
-        response = unreal.send_command("add_component_to_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"add_component_to_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
-
-@mcp.tool()
+    return {
+        "blueprint_name": blueprint_name,
+        "component_type": component_type,
+        "component_name": component_name,
+        "location": location,
+        "rotation": rotation,
+        "scale": scale,
+        "component_properties": component_properties
+    }
+
+@threaded_tool()
+@unreal_command("set_static_mesh_properties")
 def set_static_mesh_properties(
     blueprint_name: str,
     component_name: str,
     static_mesh: str = "/Engine/BasicShapes/Cube.Cube"
 ) -> Dict[str, Any]:
     """Set static mesh properties on a StaticMeshComponent."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "static_mesh": static_mesh
-        }
-        response = unreal.send_command("set_static_mesh_properties", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"set_static_mesh_properties error: {e}")
-        return {"success": False, "message": str(e)}
-
-@mcp.tool()
+    return {
+        "blueprint_name": blueprint_name,
+        "component_name": component_name,
+        "static_mesh": static_mesh
+    }
+
+@threaded_tool()
+@unreal_command("set_physics_properties")
 def set_physics_properties(
     blueprint_name: str,
     component_name: str,
@@ -418,85 +841,90 @@ def set_physics_properties(
     angular_damping: float = 0
 ) -> Dict[str, Any]:
     """Set physics properties on a component."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "simulate_physics": simulate_physics,
-            "gravity_enabled": gravity_enabled,
-            "mass": mass,
-            "linear_damping": linear_damping,
-            "angular_damping": angular_damping
-        }
-        response = unreal.send_command("set_physics_properties", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"set_physics_properties error: {e}")
-        return {"success": False, "message": str(e)}
-
-@mcp.tool()
+    return {
+        "blueprint_name": blueprint_name,
+        "component_name": component_name,
+        "simulate_physics": simulate_physics,
+        "gravity_enabled": gravity_enabled,
+        "mass": mass,
+        "linear_damping": linear_damping,
+        "angular_damping": angular_damping
+    }
+
+@threaded_tool()
+@unreal_command("compile_blueprint")
 def compile_blueprint(blueprint_name: str) -> Dict[str, Any]:
     """Compile a Blueprint."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {"blueprint_name": blueprint_name}
-        response = unreal.send_command("compile_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"compile_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
+    return {"blueprint_name": blueprint_name}
 
 
 
 # Advanced Composition Tools
-@mcp.tool()
+def _spawn_summary(responses: List[Dict[str, Any]], specs: List[Dict[str, Any]],
+                   verbose: bool) -> Dict[str, Any]:
+    """Result of a batch-spawning builder: the spawned count and the names that failed.
+    
+    The per-actor responses are only included when verbose is set - for large structures they
+    are most of the reply sent back to the MCP client.
+    """
+    failed = [spec["name"] for spec, resp in zip(specs, responses) if resp.get("status") != "success"]
+    result = {"success": True, "spawned": len(responses) - len(failed), "failed": failed}
+    if verbose:
+        result["actors"] = [resp for resp in responses if resp.get("status") == "success"]
+    return result
+
+def _pyramid_coords(base_size: int, block_size: float,
+                    location: List[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Grid indices and an (N, 3) array of world locations for every pyramid block, bottom level first."""
+    counts = base_size - np.arange(max(base_size, 0))
+    level_sizes = counts * counts
+    levels = np.repeat(np.arange(len(counts)), level_sizes)
+    count = counts[levels]
+    # Index of each block within its level, row-major over (x, y)
+    local = np.arange(levels.size) - np.repeat(np.cumsum(level_sizes) - level_sizes, level_sizes)
+    xs, ys = np.divmod(local, np.maximum(count, 1))
+    half = (count - 1) / 2
+    locs = np.stack([
+        location[0] + (xs - half) * block_size,
+        location[1] + (ys - half) * block_size,
+        location[2] + levels * block_size
+    ], axis=-1).astype(np.float64)
+    return levels, xs, ys, locs
+
+@threaded_tool()
 def create_pyramid(
     base_size: int = 3,
     block_size: float = 100.0,
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "PyramidBlock",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = "/Engine/BasicShapes/Cube.Cube",
+    verbose: bool = False
 ) -> Dict[str, Any]:
     """Spawn a pyramid made of cube actors."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
         scale = block_size / 100.0
-        for level in range(base_size):
+        locs = _pyramid_coords(base_size, block_size, location)[-1].tolist()
+        # Names are a level prefix plus an "x_y" suffix. Each level's suffixes are a corner of the
+        # base level's grid, so they are formatted once and sliced rather than built per block.
+        suffixes = [[f"{x}_{y}" for y in range(base_size)] for x in range(base_size)]
+        names = []
+        for level in range(max(base_size, 0)):
             count = base_size - level
-            for x in range(count):
-                for y in range(count):
-                    actor_name = f"{name_prefix}_{level}_{x}_{y}"
-                    loc = [
-                        location[0] + (x - (count - 1)/2) * block_size,
-                        location[1] + (y - (count - 1)/2) * block_size,
-                        location[2] + level * block_size
-                    ]
-                    params = {
-                        "name": actor_name,
-                        "type": "StaticMeshActor",
-                        "location": loc,
-                        "scale": [scale, scale, scale],
-                        "static_mesh": mesh
-                    }
-                    resp = safe_spawn_actor(unreal, params)
-                    if resp and resp.get("status") == "success":
-                        spawned.append(resp)
-        return {"success": True, "actors": spawned}
+            level_prefix = f"{name_prefix}_{level}_"
+            names += [level_prefix + suffix for row in suffixes[:count] for suffix in row[:count]]
+        # Shared fields go out once as batch defaults
+        template = {"type": "StaticMeshActor", "scale": (scale, scale, scale), "static_mesh": mesh}
+        specs = [{"name": actor_name, "location": loc} for actor_name, loc in zip(names, locs)]
+        responses = safe_spawn_actors_batch(unreal, specs, defaults=template)
+        return _spawn_summary(responses, specs, verbose)
     except Exception as e:
         logger.error(f"create_pyramid error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_wall(
     length: int = 5,
     height: int = 2,
@@ -504,38 +932,60 @@ def create_wall(
     location: List[float] = [0.0, 0.0, 0.0],
     orientation: str = "x",
     name_prefix: str = "WallBlock",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = "/Engine/BasicShapes/Cube.Cube",
+    verbose: bool = False
 ) -> Dict[str, Any]:
     """Create a simple wall from cubes."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
         scale = block_size / 100.0
-        for h in range(height):
-            for i in range(length):
-                actor_name = f"{name_prefix}_{h}_{i}"
-                if orientation == "x":
-                    loc = [location[0] + i * block_size, location[1], location[2] + h * block_size]
-                else:
-                    loc = [location[0], location[1] + i * block_size, location[2] + h * block_size]
-                params = {
-                    "name": actor_name,
-                    "type": "StaticMeshActor",
-                    "location": loc,
-                    "scale": [scale, scale, scale],
-                    "static_mesh": mesh
-                }
-                resp = safe_spawn_actor(unreal, params)
-                if resp and resp.get("status") == "success":
-                    spawned.append(resp)
-        return {"success": True, "actors": spawned}
+        # Row-major (height, length) grid of block locations
+        hs, idx = np.meshgrid(np.arange(height), np.arange(length), indexing="ij")
+        along = idx * block_size
+        fixed = np.zeros(along.shape)
+        locs = np.stack([
+            location[0] + (along if orientation == "x" else fixed),
+            location[1] + (fixed if orientation == "x" else along),
+            location[2] + hs * block_size
+        ], axis=-1).reshape(-1, 3).tolist()
+        index_tags = [str(i) for i in range(length)]
+        names = [row_prefix + tag
+                 for row_prefix in [f"{name_prefix}_{h}_" for h in range(height)]
+                 for tag in index_tags]
+        # Shared fields go out once as batch defaults
+        template = {"type": "StaticMeshActor", "scale": (scale, scale, scale), "static_mesh": mesh}
+        specs = [{"name": actor_name, "location": loc} for actor_name, loc in zip(names, locs)]
+        responses = safe_spawn_actors_batch(unreal, specs, defaults=template)
+        return _spawn_summary(responses, specs, verbose)
     except Exception as e:
         logger.error(f"create_wall error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+# Walls of a square tower level in build order: name, then the (x, y) direction blocks run along
+# the wall, then the (x, y) direction from the tower's centre to the wall
+SQUARE_SIDES = (
+    ("front", (1, 0), (0, -1)),
+    ("right", (0, 1), (1, 0)),
+    ("back", (-1, 0), (0, 1)),
+    ("left", (0, -1), (-1, 0)),
+)
+_SIDE_ALONG = np.array([along for _, along, _ in SQUARE_SIDES], dtype=np.float64)[:, :, None]
+_SIDE_EDGE = np.array([edge for _, _, edge in SQUARE_SIDES], dtype=np.float64)[:, :, None]
+
+def _square_ring(size: int, block_size: float, location: List[float]) -> Tuple[List[List[float]], List[str]]:
+    """Block (x, y) positions and name suffixes for the four walls of a square tower level."""
+    half_size = size / 2
+    along = (np.arange(size) - half_size + 0.5) * block_size
+    # (side, axis, block) offsets from the centre, one row per entry of SQUARE_SIDES
+    offsets = _SIDE_ALONG * along + _SIDE_EDGE * (half_size * block_size)
+    xs = offsets[:, 0].ravel() + location[0]
+    ys = offsets[:, 1].ravel() + location[1]
+    suffixes = [f"{side}_{n}" for side, _, _ in SQUARE_SIDES for n in range(size)]
+    return np.stack([xs, ys], axis=-1).tolist(), suffixes
+
+@threaded_tool()
 def create_tower(
     height: int = 10,
     base_size: int = 4,
@@ -543,173 +993,106 @@ def create_tower(
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "TowerBlock",
     mesh: str = "/Engine/BasicShapes/Cube.Cube",
-    tower_style: str = "cylindrical"  # "cylindrical", "square", "tapered"
+    tower_style: str = "cylindrical",  # "cylindrical", "square", "tapered"
+    verbose: bool = False
 ) -> Dict[str, Any]:
     """Create a realistic tower with various architectural styles."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
+        specs = []
         scale = block_size / 100.0
+        # Shared fields go out once as batch defaults; decorative details override them
+        template = {"type": "StaticMeshActor", "scale": (scale, scale, scale), "static_mesh": mesh}
+        detail_scale = (scale * 0.7, scale * 0.7, scale * 0.7)
+        
+        if tower_style == "cylindrical":
+            # The ring is identical on every level - compute it once
+            radius = (base_size / 2) * block_size  # Convert to world units (centimeters)
+            circumference = 2 * math.pi * radius
+            num_blocks = max(8, int(circumference / block_size))
+            angles = np.linspace(0, 2 * math.pi, num_blocks, endpoint=False)
+            ring_xy = np.stack([
+                location[0] + radius * np.cos(angles),
+                location[1] + radius * np.sin(angles)
+            ], axis=-1).tolist()
+            ring_suffixes = [str(i) for i in range(num_blocks)]
+        # Square rings only depend on the level size, so tapered towers reuse them
+        square_rings = {}
+        
+        # Corner detail offsets (every few levels)
+        detail_radius = (base_size/2 + 0.5) * block_size
+        detail_xy = [
+            [location[0] + detail_radius * dx, location[1] + detail_radius * dy]
+            for dx, dy in CORNER_OFFSETS
+        ]
 
         for level in range(height):
             level_height = location[2] + level * block_size
+            # Names are the level prefix plus a precomputed suffix - no per-block formatting
+            level_prefix = f"{name_prefix}_{level}_"
             
             if tower_style == "cylindrical":
                 # Create circular tower
-                radius = (base_size / 2) * block_size  # Convert to world units (centimeters)
-                circumference = 2 * math.pi * radius
-                num_blocks = max(8, int(circumference / block_size))
-                
-                for i in range(num_blocks):
-                    angle = (2 * math.pi * i) / num_blocks
-                    x = location[0] + radius * math.cos(angle)
-                    y = location[1] + radius * math.sin(angle)
-                    
-                    actor_name = f"{name_prefix}_{level}_{i}"
-                    params = {
-                        "name": actor_name,
-                        "type": "StaticMeshActor",
-                        "location": [x, y, level_height],
-                        "scale": [scale, scale, scale],
-                        "static_mesh": mesh
-                    }
-                    resp = safe_spawn_actor(unreal, params)
-                    if resp and resp.get("status") == "success":
-                        spawned.append(resp)
+                for (x, y), actor_suffix in zip(ring_xy, ring_suffixes):
+                    specs.append({"name": level_prefix + actor_suffix, "location": [x, y, level_height]})
                         
-            elif tower_style == "tapered":
-                # Create tapering square tower
-                current_size = max(1, base_size - (level // 2))
-                half_size = current_size / 2
-                
-                # Create walls for current level
-                for side in range(4):
-                    for i in range(current_size):
-                        if side == 0:  # Front wall
-                            x = location[0] + (i - half_size + 0.5) * block_size
-                            y = location[1] - half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_front_{i}"
-                        elif side == 1:  # Right wall
-                            x = location[0] + half_size * block_size
-                            y = location[1] + (i - half_size + 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_right_{i}"
-                        elif side == 2:  # Back wall
-                            x = location[0] + (half_size - i - 0.5) * block_size
-                            y = location[1] + half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_back_{i}"
-                        else:  # Left wall
-                            x = location[0] - half_size * block_size
-                            y = location[1] + (half_size - i - 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_left_{i}"
-                            
-                        params = {
-                            "name": actor_name,
-                            "type": "StaticMeshActor",
-                            "location": [x, y, level_height],
-                            "scale": [scale, scale, scale],
-                            "static_mesh": mesh
-                        }
-                        resp = unreal.send_command("spawn_actor", params)
-                        if resp:
-                            spawned.append(resp)
-                            
-            else:  # square tower
-                # Create square tower walls
-                half_size = base_size / 2
-                
-                # Four walls
-                for side in range(4):
-                    for i in range(base_size):
-                        if side == 0:  # Front wall
-                            x = location[0] + (i - half_size + 0.5) * block_size
-                            y = location[1] - half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_front_{i}"
-                        elif side == 1:  # Right wall
-                            x = location[0] + half_size * block_size
-                            y = location[1] + (i - half_size + 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_right_{i}"
-                        elif side == 2:  # Back wall
-                            x = location[0] + (half_size - i - 0.5) * block_size
-                            y = location[1] + half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_back_{i}"
-                        else:  # Left wall
-                            x = location[0] - half_size * block_size
-                            y = location[1] + (half_size - i - 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_left_{i}"
-                            
-                        params = {
-                            "name": actor_name,
-                            "type": "StaticMeshActor",
-                            "location": [x, y, level_height],
-                            "scale": [scale, scale, scale],
-                            "static_mesh": mesh
-                        }
-                        resp = unreal.send_command("spawn_actor", params)
-                        if resp:
-                            spawned.append(resp)
+            else:
+                # Square walls; tapered towers shrink every two levels
+                current_size = max(1, base_size - (level // 2)) if tower_style == "tapered" else base_size
+                if current_size not in square_rings:
+                    square_rings[current_size] = _square_ring(current_size, block_size, location)
+                for (x, y), actor_suffix in zip(*square_rings[current_size]):
+                    specs.append({"name": level_prefix + actor_suffix, "location": [x, y, level_height]})
                             
             # Add decorative elements every few levels
             if level % 3 == 2 and level < height - 1:
                 # Add corner details
-                for corner in range(4):
-                    angle = corner * math.pi / 2
-                    detail_x = location[0] + (base_size/2 + 0.5) * block_size * math.cos(angle)
-                    detail_y = location[1] + (base_size/2 + 0.5) * block_size * math.sin(angle)
-                    
-                    actor_name = f"{name_prefix}_{level}_detail_{corner}"
-                    params = {
-                        "name": actor_name,
-                        "type": "StaticMeshActor",
+                for corner, (detail_x, detail_y) in enumerate(detail_xy):
+                    specs.append({
+                        "name": f"{level_prefix}detail_{corner}",
                         "location": [detail_x, detail_y, level_height],
-                        "scale": [scale * 0.7, scale * 0.7, scale * 0.7],
+                        "scale": detail_scale,
                         "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-                    }
-                    resp = safe_spawn_actor(unreal, params)
-                    if resp and resp.get("status") == "success":
-                        spawned.append(resp)
-                        
-        return {"success": True, "actors": spawned, "tower_style": tower_style}
+                    })
+        
+        responses = safe_spawn_actors_batch(unreal, specs, defaults=template)
+        return {**_spawn_summary(responses, specs, verbose), "tower_style": tower_style}
     except Exception as e:
         logger.error(f"create_tower error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_staircase(
     steps: int = 5,
     step_size: List[float] = [100.0, 100.0, 50.0],
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "Stair",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = "/Engine/BasicShapes/Cube.Cube",
+    verbose: bool = False
 ) -> Dict[str, Any]:
     """Create a staircase from cubes."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
         sx, sy, sz = step_size
-        for i in range(steps):
-            actor_name = f"{name_prefix}_{i}"
-            loc = [location[0] + i * sx, location[1], location[2] + i * sz]
-            scale = [sx/100.0, sy/100.0, sz/100.0]
-            params = {
-                "name": actor_name,
-                "type": "StaticMeshActor",
-                "location": loc,
-                "scale": scale,
-                "static_mesh": mesh
-            }
-            resp = safe_spawn_actor(unreal, params)
-            if resp and resp.get("status") == "success":
-                spawned.append(resp)
-        return {"success": True, "actors": spawned}
+        steps_idx = np.arange(steps)
+        locs = np.stack([
+            location[0] + steps_idx * sx,
+            np.full(steps, float(location[1])),
+            location[2] + steps_idx * sz
+        ], axis=-1).tolist()
+        template = {"type": "StaticMeshActor", "scale": (sx/100.0, sy/100.0, sz/100.0), "static_mesh": mesh}
+        specs = [{"name": f"{name_prefix}_{i}", "location": loc} for i, loc in enumerate(locs)]
+        responses = safe_spawn_actors_batch(unreal, specs, defaults=template)
+        return _spawn_summary(responses, specs, verbose)
     except Exception as e:
         logger.error(f"create_staircase error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def construct_house(
     width: int = 1200,
     depth: int = 1000,
@@ -717,7 +1100,8 @@ def construct_house(
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "House",
     mesh: str = "/Engine/BasicShapes/Cube.Cube",
-    house_style: str = "modern"  # "modern", "cottage"
+    house_style: str = "modern",  # "modern", "cottage"
+    verbose: bool = False
 ) -> Dict[str, Any]:
     """Construct a realistic house with architectural details and multiple rooms."""
     try:
@@ -726,7 +1110,11 @@ def construct_house(
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
 
         # Use the helper function to build the house
-        return build_house(unreal, width, depth, height, location, name_prefix, mesh, house_style)
+        result = build_house(unreal, width, depth, height, location, name_prefix, mesh, house_style)
+        if result.get("success") and not verbose:
+            # total_actors already carries the count
+            del result["actors"]
+        return result
 
     except Exception as e:
         logger.error(f"construct_house error: {e}")
@@ -734,7 +1122,7 @@ def construct_house(
 
 
 
-@mcp.tool()
+@threaded_tool()
 def construct_mansion(
     mansion_scale: str = "large",  # "small", "large", "epic", "legendary"
     location: List[float] = [0.0, 0.0, 0.0],
@@ -788,43 +1176,40 @@ def construct_mansion(
         logger.error(f"construct_mansion error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_arch(
     radius: float = 300.0,
     segments: int = 6,
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "ArchBlock",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = "/Engine/BasicShapes/Cube.Cube",
+    verbose: bool = False
 ) -> Dict[str, Any]:
     """Create a simple arch using cubes in a semicircle."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
-        angle_step = math.pi / segments
         scale = radius / 300.0 / 2
-        for i in range(segments + 1):
-            theta = angle_step * i
-            x = radius * math.cos(theta)
-            z = radius * math.sin(theta)
-            actor_name = f"{name_prefix}_{i}"
-            params = {
-                "name": actor_name,
-                "type": "StaticMeshActor",
-                "location": [location[0] + x, location[1], location[2] + z],
-                "scale": [scale, scale, scale],
-                "static_mesh": mesh
-            }
-            resp = safe_spawn_actor(unreal, params)
-            if resp and resp.get("status") == "success":
-                spawned.append(resp)
-        return {"success": True, "actors": spawned}
+        thetas = np.linspace(0, math.pi, segments + 1)
+        locs = np.stack([
+            location[0] + radius * np.cos(thetas),
+            np.full(thetas.shape, float(location[1])),
+            location[2] + radius * np.sin(thetas)
+        ], axis=-1).tolist()
+        specs = [{"name": f"{name_prefix}_{i}", "location": loc} for i, loc in enumerate(locs)]
+        template = {"type": "StaticMeshActor", "scale": [scale, scale, scale], "static_mesh": mesh}
+        responses = safe_spawn_actors_batch(unreal, specs, defaults=template)
+        return _spawn_summary(responses, specs, verbose)
     except Exception as e:
         logger.error(f"create_arch error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+# Blueprints spawn_physics_blueprint_actor has set up this session, with the (mesh, scale, physics, color)
+# they were set up with; a repeat call with the same settings goes straight to spawning
+_physics_blueprints: Dict[str, Tuple[Any, ...]] = {}
+
+@threaded_tool()
 def spawn_physics_blueprint_actor (
     name: str,
     mesh_path: str = "/Engine/BasicShapes/Cube.Cube",
@@ -848,145 +1233,286 @@ def spawn_physics_blueprint_actor (
                If [R, G, B] is provided, alpha will be set to 1.0 automatically.
     """
     try:
+        # One connection lookup, shared by every step below
+        unreal = get_unreal_connection()
+        if not unreal:
+            return {"success": False, "message": "Failed to connect to Unreal Engine"}
         bp_name = f"{name}_BP"
-        create_blueprint(bp_name, "Actor")
-        add_component_to_blueprint(bp_name, "StaticMeshComponent", "Mesh", scale=scale)
-        set_static_mesh_properties(bp_name, "Mesh", mesh_path)
-        set_physics_properties(bp_name, "Mesh", simulate_physics, gravity_enabled, mass)
 
-        # Set color if provided
+        # Convert 3-value color [R,G,B] to 4-value [R,G,B,A] if needed
         if color is not None:
-            # Convert 3-value color [R,G,B] to 4-value [R,G,B,A] if needed
             if len(color) == 3:
                 color = color + [1.0]  # Add alpha=1.0
             elif len(color) != 4:
                 logger.warning(f"Invalid color format: {color}. Expected [R,G,B] or [R,G,B,A]. Skipping color.")
                 color = None
 
-            if color is not None:
-                color_result = set_mesh_material_color(bp_name, "Mesh", color)
-                if not color_result.get("success", False):
-                    logger.warning(f"Failed to set color {color} for {bp_name}: {color_result.get('message', 'Unknown error')}")
-
-        compile_blueprint(bp_name)
-        result = spawn_blueprint_actor(bp_name, name, location)
+        settings = (mesh_path, tuple(scale), simulate_physics, gravity_enabled, mass,
+                    tuple(color) if color is not None else None)
+        if _physics_blueprints.get(bp_name) == settings:
+            response = spawn_blueprint_actor(unreal, bp_name, name, location)
+            if not (response and "Blueprint not found" in str(response.get("error", ""))):
+                return response
+            # Deleted in the editor since it was set up - build it again below
+            del _physics_blueprints[bp_name]
+
+        # Blueprint, mesh component and physics set up in one round trip; when a color
+        # follows, compiling waits until the material is set
+        bp_result = unreal.send_command("create_physics_blueprint", {
+            "name": bp_name,
+            "component_name": "Mesh",
+            "static_mesh": mesh_path,
+            "scale": scale,
+            "simulate_physics": simulate_physics,
+            "gravity_enabled": gravity_enabled,
+            "mass": mass,
+            "linear_damping": 0.01,
+            "angular_damping": 0,
+            "defer_compile": color is not None
+        })
+        # The plugin reuses a blueprint left by an earlier call and applies this call's settings to it
+        created = bool(bp_result and bp_result.get("status") == "success")
+        followups = []
+        if not created:
+            error = bp_result.get("error", "No response") if bp_result else "No response from Unreal"
+            if "already exists" not in error:
+                # There is no blueprint to color, compile or spawn
+                logger.warning(f"create_physics_blueprint failed for {bp_name}: {error}")
+                return {"success": False, "message": f"Failed to create blueprint {bp_name}: {error}"}
+            # Older plugin builds stop at an existing blueprint: apply this call's mesh and physics
+            # to it with the separate commands. Its Mesh component keeps the scale it was made with
+            logger.warning(f"Blueprint {bp_name} already exists; reapplying mesh and physics, but not scale")
+            followups += [
+                ("set_static_mesh_properties", {
+                    "blueprint_name": bp_name,
+                    "component_name": "Mesh",
+                    "static_mesh": mesh_path
+                }),
+                ("set_physics_properties", {
+                    "blueprint_name": bp_name,
+                    "component_name": "Mesh",
+                    "simulate_physics": simulate_physics,
+                    "gravity_enabled": gravity_enabled,
+                    "mass": mass,
+                    "linear_damping": 0.01,
+                    "angular_damping": 0
+                })
+            ]
+
+        # Set color if provided, then compile - pipelined, Unreal runs them in order
+        if color is not None:
+            followups.append(("set_mesh_material_color", _mesh_color_params(bp_name, "Mesh", color)))
+        if followups:
+            followups.append(("compile_blueprint", {"blueprint_name": bp_name}))
+            for (command, _), response in zip(followups, unreal.send_commands(followups)):
+                if not response or response.get("status") != "success":
+                    logger.warning(f"{command} failed for {bp_name}: {response}")
+        if created:
+            # Only a blueprint built entirely with this call's settings can be reused as is
+            _physics_blueprints[bp_name] = settings
         
-        # Spawn the blueprint actor using helper function
-        unreal = get_unreal_connection()
-        result = spawn_blueprint_actor(unreal, bp_name, name, location)
-
-        # Ensure proper scale is set on the spawned actor
-        if result.get("success", False):
-            spawned_name = result.get("result", {}).get("name", name)
-            set_actor_transform(spawned_name, scale=scale)
-
-        return result
+        # Spawn the blueprint actor using helper function. The scale already lives on the
+        # Mesh component, so the actor itself keeps unit scale - no follow-up transform call
+        return spawn_blueprint_actor(unreal, bp_name, name, location)
     except Exception as e:
         logger.error(f"spawn_physics_blueprint_actor  error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+def _carve_maze_kernel(maze: np.ndarray, rows: int, cols: int, seed: int) -> None:
+    """Carve a perfect maze in place into a (rows*2+1, cols*2+1) uint8 grid of walls (1).
+    
+    Randomized depth-first backtracking with an explicit stack, written so Numba can compile it.
+    """
+    np.random.seed(seed)
+    directions = np.array([[0, 1], [1, 0], [0, -1], [-1, 0]], dtype=np.int32)
+    stack = np.empty((rows * cols, 2), dtype=np.int32)
+    candidates = np.empty(4, dtype=np.int32)
+    stack[0, 0] = 0
+    stack[0, 1] = 0
+    size = 1
+    maze[1, 1] = 0
+    while size > 0:
+        row = stack[size - 1, 0]
+        col = stack[size - 1, 1]
+        count = 0
+        for k in range(4):
+            new_row = row + directions[k, 0]
+            new_col = col + directions[k, 1]
+            if 0 <= new_row < rows and 0 <= new_col < cols and maze[new_row * 2 + 1, new_col * 2 + 1]:
+                candidates[count] = k
+                count += 1
+        if count == 0:
+            size -= 1
+            continue
+        k = candidates[np.random.randint(count)]
+        new_row = row + directions[k, 0]
+        new_col = col + directions[k, 1]
+        # Carve the wall between the cells, then the new cell itself
+        maze[row * 2 + 1 + directions[k, 0], col * 2 + 1 + directions[k, 1]] = 0
+        maze[new_row * 2 + 1, new_col * 2 + 1] = 0
+        stack[size, 0] = new_row
+        stack[size, 1] = new_col
+        size += 1
+
+# (row, col) steps to the four neighbouring maze cells
+MAZE_DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Every visiting order of the four neighbours, so the Python carver picks one instead of shuffling
+_MAZE_DIRECTION_ORDERS = tuple(itertools.permutations(MAZE_DIRECTIONS))
+
+# Compiled when Numba is installed; otherwise create_maze uses its pure-Python generator
+_carve_maze_jit = njit(cache=True)(_carve_maze_kernel) if njit is not None else None
+
+@threaded_tool()
 def create_maze(
     rows: int = 8,
     cols: int = 8,
     cell_size: float = 300.0,
     wall_height: int = 3,
-    location: List[float] = [0.0, 0.0, 0.0]
+    location: List[float] = [0.0, 0.0, 0.0],
+    cull_hidden_walls: bool = False,
+    verbose: bool = False,
+    use_instancing: bool = False
 ) -> Dict[str, Any]:
-    """Create a proper solvable maze with entrance, exit, and guaranteed path using recursive backtracking algorithm."""
+    """Create a proper solvable maze with entrance, exit, and guaranteed path using recursive backtracking algorithm.
+    
+    With cull_hidden_walls, wall cells whose four neighbours are all walls are skipped. Their sides can't
+    be seen from inside the maze, which saves actors at the cost of small gaps in the wall tops.
+    
+    With use_instancing=True every wall block is added as an instance of one hierarchical instanced
+    static mesh actor instead of being an actor of its own; the entrance and exit markers stay actors.
+    """
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-        import random
-        spawned = []
-        
-        # Initialize maze grid - True means wall, False means open
-        maze = [[True for _ in range(cols * 2 + 1)] for _ in range(rows * 2 + 1)]
+        # Initialize maze grid as a flat row-major buffer - 1 means wall, 0 means open
+        maze_height = rows * 2 + 1
+        maze_width = cols * 2 + 1
+        maze = bytearray(b"\x01") * (maze_height * maze_width)
+        grid = np.frombuffer(maze, dtype=np.uint8).reshape(maze_height, maze_width)  # 2D view, no copy
         
-        # Recursive backtracking maze generation
-        def carve_path(row, col):
-            # Mark current cell as path
-            maze[row * 2 + 1][col * 2 + 1] = False
-            
-            # Random directions
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            random.shuffle(directions)
+        if _carve_maze_jit is not None and rows > 0 and cols > 0:
+            # Compiled generator, seeded from the random module so seeding it still reproduces a maze
+            _carve_maze_jit(grid, rows, cols, random.getrandbits(32))
+        else:
+            # Flat-index step to the wall between neighbouring cells; the neighbour cell is twice that
+            steps = [(dr * maze_width + dc, dr * (cols + 2) + dc) for dr, dc in MAZE_DIRECTIONS]
+            step_of = dict(zip(MAZE_DIRECTIONS, steps))
+            direction_orders = [tuple(step_of[direction] for direction in order) for order in _MAZE_DIRECTION_ORDERS]
+            # One flag per cell inside a border of already-visited cells, so a step off the edge of
+            # the maze fails the visited check and needs no separate bounds test
+            unvisited = bytearray(cols + 2)
+            for _ in range(rows):
+                unvisited += b"\x00" + b"\x01" * cols + b"\x00"
+            unvisited += bytearray(cols + 2)
             
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                
-                # Check bounds
-                if (0 <= new_row < rows and 0 <= new_col < cols and 
-                    maze[new_row * 2 + 1][new_col * 2 + 1]):
-                    
-                    # Carve wall between current and new cell
-                    maze[row * 2 + 1 + dr][col * 2 + 1 + dc] = False
-                    carve_path(new_row, new_col)
+            def carve(index, cell):
+                # Mark current cell as path, return its neighbour steps in a random order
+                maze[index] = 0
+                unvisited[cell] = 0
+                return iter(random.choice(direction_orders))
         
-        # Start carving from top-left corner
-        carve_path(0, 0)
+            # Backtracking maze generation with an explicit stack (no recursion limit on large mazes).
+            # Each entry resumes its cell's remaining directions, so cells are visited in the same
+            # order as the recursive formulation.
+            start = maze_width + 1
+            stack = [(start, cols + 3, carve(start, cols + 3))]  # Start carving from top-left corner
+            while stack:
+                index, cell, directions = stack[-1]
+                for wall_step, cell_step in directions:
+                    new_cell = cell + cell_step
+                    if unvisited[new_cell]:
+                        # Carve wall between current and new cell
+                        wall = index + wall_step
+                        maze[wall] = 0
+                        new_index = wall + wall_step
+                        stack.append((new_index, new_cell, carve(new_index, new_cell)))
+                        break
+                else:
+                    stack.pop()
         
         # Create entrance and exit
-        maze[1][0] = False  # Entrance on left side
-        maze[rows * 2 - 1][cols * 2] = False  # Exit on right side
+        maze[1 * maze_width + 0] = 0  # Entrance on left side
+        maze[(rows * 2 - 1) * maze_width + cols * 2] = 0  # Exit on right side
         
-        # Build the actual maze in Unreal
-        maze_height = rows * 2 + 1
-        maze_width = cols * 2 + 1
+        # Build the actual maze in Unreal - walls and markers go out in one batch.
+        # Wall cells in row-major order, each stacked wall_height blocks high. The grid only holds
+        # 0 and 1, so it is read as booleans in place rather than copied
+        walls = grid.view(np.bool_)
+        if cull_hidden_walls:
+            # Cells outside the grid count as open, so the outer boundary is always kept
+            padded = np.pad(walls, 1, constant_values=False)
+            walls &= ~(padded[:-2, 1:-1] & padded[2:, 1:-1] & padded[1:-1, :-2] & padded[1:-1, 2:])
+        rr, cc = np.nonzero(walls)
         
-        for r in range(maze_height):
-            for c in range(maze_width):
-                if maze[r][c]:  # If this is a wall
-                    # Stack blocks to create wall height
-                    for h in range(wall_height):
-                        x_pos = location[0] + (c - maze_width/2) * cell_size
-                        y_pos = location[1] + (r - maze_height/2) * cell_size
-                        z_pos = location[2] + h * cell_size
-                        
-                        actor_name = f"Maze_Wall_{r}_{c}_{h}"
-                        params = {
-                            "name": actor_name,
-                            "type": "StaticMeshActor",
-                            "location": [x_pos, y_pos, z_pos],
-                            "scale": [cell_size/100.0, cell_size/100.0, cell_size/100.0],
-                            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-                        }
-                        resp = safe_spawn_actor(unreal, params)
-                        if resp and resp.get("status") == "success":
-                            spawned.append(resp)
+        # Coordinates depend only on the column, row or level, so each axis is computed once and
+        # broadcast into one (cell, level, xyz) table
+        half_w = maze_width / 2
+        half_h = maze_height / 2
+        levels = max(wall_height, 0)
+        xs = location[0] + (np.arange(maze_width) - half_w) * cell_size
+        ys = location[1] + (np.arange(maze_height) - half_h) * cell_size
+        zs = location[2] + np.arange(levels) * cell_size
+        positions = np.empty((len(rr), levels, 3))
+        positions[..., 0] = xs[cc][:, None]
+        positions[..., 1] = ys[rr][:, None]
+        positions[..., 2] = zs
+        # Each wall cell's name prefix is formatted once and shared by its stacked blocks
+        level_tags = [str(h) for h in range(levels)]
+        names = [cell_prefix + tag
+                 for cell_prefix in [f"Maze_Wall_{r}_{c}_" for r, c in zip(rr.tolist(), cc.tolist())]
+                 for tag in level_tags]
+        specs = [{"name": name, "location": position}
+                 for name, position in zip(names, positions.reshape(-1, 3).tolist())]
+        wall_total = len(specs)
         
         # Add entrance and exit markers
-        entrance_marker = safe_spawn_actor(unreal, {
+        specs.append({
             "name": "Maze_Entrance",
-            "type": "StaticMeshActor",
-            "location": [location[0] - maze_width/2 * cell_size - cell_size, 
-                       location[1] + (-maze_height/2 + 1) * cell_size, 
+            "location": [location[0] - half_w * cell_size - cell_size, 
+                       location[1] + (-half_h + 1) * cell_size, 
                        location[2] + cell_size],
             "scale": [0.5, 0.5, 0.5],
             "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
         })
-        if entrance_marker and entrance_marker.get("status") == "success":
-            spawned.append(entrance_marker)
-            
-        exit_marker = safe_spawn_actor(unreal, {
+        specs.append({
             "name": "Maze_Exit",
-            "type": "StaticMeshActor", 
-            "location": [location[0] + maze_width/2 * cell_size + cell_size,
-                       location[1] + (-maze_height/2 + rows * 2 - 1) * cell_size,
+            "location": [location[0] + half_w * cell_size + cell_size,
+                       location[1] + (-half_h + rows * 2 - 1) * cell_size,
                        location[2] + cell_size],
             "scale": [0.5, 0.5, 0.5],
             "static_mesh": "/Engine/BasicShapes/Sphere.Sphere"
         })
-        if exit_marker and exit_marker.get("status") == "success":
-            spawned.append(exit_marker)
+        
+        # Shared wall fields go out once as batch defaults; the markers override them
+        wall_scale = cell_size / 100.0
+        template = {"type": "StaticMeshActor", "scale": [wall_scale, wall_scale, wall_scale],
+                    "static_mesh": "/Engine/BasicShapes/Cube.Cube"}
+        if use_instancing:
+            spawn_buffer = SpawnBuffer(unreal)
+            for spec in specs[:wall_total]:
+                spawn_buffer.add({**template, **spec})
+            holders, failed_walls = spawn_buffer.flush_instanced("Maze")
+            marker_specs = specs[wall_total:]
+            summary = _spawn_summary(safe_spawn_actors_batch(unreal, marker_specs, defaults=template),
+                                     marker_specs, verbose)
+            summary["spawned"] += len(holders)
+            summary["failed"] = [wall["name"] for wall in failed_walls] + summary["failed"]
+            if verbose:
+                summary["actors"] = holders + summary["actors"]
+            wall_count = wall_total - len(failed_walls)
+        else:
+            responses = safe_spawn_actors_batch(unreal, specs, defaults=template)
+            summary = _spawn_summary(responses, specs, verbose)
+            # Wall blocks come first in specs, ahead of the two markers
+            wall_count = sum(1 for resp in responses[:wall_total] if resp.get("status") == "success")
         
         return {
-            "success": True, 
-            "actors": spawned, 
+            **summary,
             "maze_size": f"{rows}x{cols}",
-            "wall_count": len([block for block in spawned if "Wall" in block.get("name", "")]),
+            "wall_count": wall_count,
             "entrance": "Left side (cylinder marker)",
             "exit": "Right side (sphere marker)"
         }
@@ -994,12 +1520,22 @@ def create_maze(
         logger.error(f"create_maze error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+# Material listings keyed by (search_path, include_engine_materials) -> (fetched_at, response).
+# The asset registry rarely changes mid-session, so repeated lookups reuse the last listing.
+MATERIALS_CACHE_TTL = 30.0
+_materials_cache: Dict[Tuple[str, bool], Tuple[float, Dict[str, Any]]] = {}
+
+@threaded_tool()
 def get_available_materials(
     search_path: str = "/Game/",
     include_engine_materials: bool = True
 ) -> Dict[str, Any]:
     """Get a list of available materials in the project that can be applied to objects."""
+    key = (search_path, include_engine_materials)
+    cached = _materials_cache.get(key)
+    if cached and time.monotonic() - cached[0] < MATERIALS_CACHE_TTL:
+        return cached[1]
+    
     unreal = get_unreal_connection()
     if not unreal:
         return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -1010,35 +1546,38 @@ def get_available_materials(
             "include_engine_materials": include_engine_materials
         }
         response = unreal.send_command("get_available_materials", params)
-        return response or {"success": False, "message": "No response from Unreal"}
+        if not response:
+            return {"success": False, "message": "No response from Unreal"}
+        if response.get("status") == "success":
+            _materials_cache[key] = (time.monotonic(), response)
+        return response
     except Exception as e:
         logger.error(f"get_available_materials error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
+def refresh_materials_cache() -> Dict[str, Any]:
+    """Clear cached material listings so the next get_available_materials call queries Unreal again."""
+    cleared = len(_materials_cache)
+    _materials_cache.clear()
+    return {"success": True, "message": f"Cleared {cleared} cached material listing(s)"}
+
+@threaded_tool()
+@unreal_command("apply_material_to_actor")
 def apply_material_to_actor(
     actor_name: str,
     material_path: str,
     material_slot: int = 0
 ) -> Dict[str, Any]:
     """Apply a specific material to an actor in the level."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "actor_name": actor_name,
-            "material_path": material_path,
-            "material_slot": material_slot
-        }
-        response = unreal.send_command("apply_material_to_actor", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"apply_material_to_actor error: {e}")
-        return {"success": False, "message": str(e)}
-
-@mcp.tool()
+    return {
+        "actor_name": actor_name,
+        "material_path": material_path,
+        "material_slot": material_slot
+    }
+
+@threaded_tool()
+@unreal_command("apply_material_to_blueprint")
 def apply_material_to_blueprint(
     blueprint_name: str,
     component_name: str,
@@ -1046,41 +1585,38 @@ def apply_material_to_blueprint(
     material_slot: int = 0
 ) -> Dict[str, Any]:
     """Apply a specific material to a component in a Blueprint."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "material_path": material_path,
-            "material_slot": material_slot
-        }
-        response = unreal.send_command("apply_material_to_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"apply_material_to_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
-
-@mcp.tool()
+    return {
+        "blueprint_name": blueprint_name,
+        "component_name": component_name,
+        "material_path": material_path,
+        "material_slot": material_slot
+    }
+
+@threaded_tool()
+@unreal_command("get_actor_material_info")
 def get_actor_material_info(
     actor_name: str
 ) -> Dict[str, Any]:
     """Get information about the materials currently applied to an actor."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {"actor_name": actor_name}
-        response = unreal.send_command("get_actor_material_info", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"get_actor_material_info error: {e}")
-        return {"success": False, "message": str(e)}
-
-@mcp.tool()
+    return {"actor_name": actor_name}
+
+def _mesh_color_params(blueprint_name: str, component_name: str, color: List[float],
+                       material_path: str = "/Engine/BasicShapes/BasicShapeMaterial",
+                       material_slot: int = 0) -> Dict[str, Any]:
+    """Params of the set_mesh_material_color command for a 4-value color."""
+    return {
+        "blueprint_name": blueprint_name,
+        "component_name": component_name,
+        # Ensure all color values are floats between 0 and 1
+        "color": [float(min(1.0, max(0.0, val))) for val in color],
+        "material_path": material_path,
+        # Set both BaseColor and Color (for maximum compatibility) on one material instance in one call
+        "parameter_name": "BaseColor",
+        "parameter_names": ["BaseColor", "Color"],
+        "material_slot": material_slot
+    }
+
+@threaded_tool()
 def set_mesh_material_color(
     blueprint_name: str,
     component_name: str,
@@ -1099,44 +1635,24 @@ def set_mesh_material_color(
         if not isinstance(color, list) or len(color) != 4:
             return {"success": False, "message": "Invalid color format. Must be a list of 4 float values [R, G, B, A]."}
         
-        # Ensure all color values are floats between 0 and 1
-        color = [float(min(1.0, max(0.0, val))) for val in color]
-        
-        # Set BaseColor parameter first
-        params_base = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "color": color,
-            "material_path": material_path,
-            "parameter_name": "BaseColor",
-            "material_slot": material_slot
-        }
-        response_base = unreal.send_command("set_mesh_material_color", params_base)
-        
-        # Set Color parameter second (for maximum compatibility)
-        params_color = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "color": color,
-            "material_path": material_path,
-            "parameter_name": "Color",
-            "material_slot": material_slot
-        }
-        response_color = unreal.send_command("set_mesh_material_color", params_color)
+        params = _mesh_color_params(blueprint_name, component_name, color, material_path, material_slot)
+        color = params["color"]
+        response = unreal.send_command("set_mesh_material_color", params)
         
-        # Return success if either parameter setting worked
-        if (response_base and response_base.get("status") == "success") or (response_color and response_color.get("status") == "success"):
+        if response and response.get("status") == "success":
             return {
                 "success": True, 
                 "message": f"Color applied successfully to slot {material_slot}: {color}",
-                "base_color_result": response_base,
-                "color_result": response_color,
+                "base_color_result": response,
+                "color_result": response,
+                # Which of the parameters the material exposes, e.g. {"BaseColor": True, "Color": False}
+                "parameters": response.get("result", {}).get("parameters", {}),
                 "material_slot": material_slot
             }
         else:
             return {
                 "success": False, 
-                "message": f"Failed to set color parameters on slot {material_slot}. BaseColor: {response_base}, Color: {response_color}"
+                "message": f"Failed to set color parameters on slot {material_slot}: {response}"
             }
             
     except Exception as e:
@@ -1144,7 +1660,21 @@ def set_mesh_material_color(
         return {"success": False, "message": str(e)}
 
 # Advanced Town Generation System
-@mcp.tool()
+TownParams = namedtuple("TownParams", "blocks block_size max_building_height population skyscraper_chance")
+
+# Town parameters based on size
+_TOWN_PARAMS = {
+    "small": TownParams(blocks=3, block_size=1500, max_building_height=5, population=20, skyscraper_chance=0.1),
+    "medium": TownParams(blocks=5, block_size=2000, max_building_height=10, population=50, skyscraper_chance=0.3),
+    "large": TownParams(blocks=7, block_size=2500, max_building_height=20, population=100, skyscraper_chance=0.5),
+    "metropolis": TownParams(blocks=10, block_size=3000, max_building_height=40, population=200, skyscraper_chance=0.7)
+}
+
+_DOWNTOWN_BUILDING_TYPES = ("skyscraper", "office_tower", "apartment_complex", "shopping_mall", "parking_garage", "hotel")
+_CENTRAL_BUILDING_TYPES = ("skyscraper", "office_tower", "apartment_complex", "hotel", "shopping_mall")
+_SUBURBAN_BUILDING_TYPES = ("house", "tower", "mansion", "commercial", "apartment_building", "restaurant", "store")
+
+@threaded_tool()
 def create_town(
     town_size: str = "medium",  # "small", "medium", "large", "metropolis"
     building_density: float = 0.7,  # 0.0 to 1.0
@@ -1155,7 +1685,6 @@ def create_town(
 ) -> Dict[str, Any]:
     """Create a full dynamic town with buildings, streets, infrastructure, and vehicles."""
     try:
-        import random
         random.seed()  # Use different seed each time for variety
         
         unreal = get_unreal_connection()
@@ -1164,20 +1693,12 @@ def create_town(
         
         logger.info(f"Creating {town_size} town with {building_density} density at {location}")
         
-        # Define town parameters based on size
-        town_params = {
-            "small": {"blocks": 3, "block_size": 1500, "max_building_height": 5, "population": 20, "skyscraper_chance": 0.1},
-            "medium": {"blocks": 5, "block_size": 2000, "max_building_height": 10, "population": 50, "skyscraper_chance": 0.3},
-            "large": {"blocks": 7, "block_size": 2500, "max_building_height": 20, "population": 100, "skyscraper_chance": 0.5},
-            "metropolis": {"blocks": 10, "block_size": 3000, "max_building_height": 40, "population": 200, "skyscraper_chance": 0.7}
-        }
-        
-        params = town_params.get(town_size, town_params["medium"])
-        blocks = params["blocks"]
-        block_size = params["block_size"]
-        max_height = params["max_building_height"]
-        target_population = int(params["population"] * building_density)
-        skyscraper_chance = params["skyscraper_chance"]
+        p = _TOWN_PARAMS.get(town_size, _TOWN_PARAMS["medium"])
+        blocks = p.blocks
+        block_size = p.block_size
+        max_height = p.max_building_height
+        target_population = int(p.population * building_density)
+        skyscraper_chance = p.skyscraper_chance
         
         all_spawned = []
         street_width = block_size * 0.3
@@ -1190,47 +1711,50 @@ def create_town(
         
         # Create buildings in each block
         logger.info("Placing buildings...")
+        # Fixed per style; "mixed" picks between the central and suburban sets per block
+        if architectural_style in ("downtown", "futuristic"):
+            building_types = _DOWNTOWN_BUILDING_TYPES
+        else:
+            building_types = (architectural_style,) * 3 + ("commercial", "restaurant", "store")
+        # Draw every block's dice up front: density check, skyscraper roll and building-type pick
+        rng = np.random.default_rng()
+        density_rolls, skyscraper_rolls, type_rolls = rng.random((3, blocks, blocks)).tolist()
         building_count = 0
-        for block_x in range(blocks):
-            for block_y in range(blocks):
-                if building_count >= target_population:
-                    break
-                    
-                # Skip some blocks randomly for variety
-                if random.random() > building_density:
-                    continue
-                
-                block_center_x = location[0] + (block_x - blocks/2) * block_size
-                block_center_y = location[1] + (block_y - blocks/2) * block_size
+        for block_x, block_y in itertools.product(range(blocks), range(blocks)):
+            if building_count >= target_population:
+                break
                 
-                # Randomly choose building type based on style and location
-                if architectural_style == "downtown" or architectural_style == "futuristic":
-                    building_types = ["skyscraper", "office_tower", "apartment_complex", "shopping_mall", "parking_garage", "hotel"]
-                elif architectural_style == "mixed":
-                    # Central blocks get taller buildings
-                    is_central = abs(block_x - blocks//2) <= 1 and abs(block_y - blocks//2) <= 1
-                    if is_central and random.random() < skyscraper_chance:
-                        building_types = ["skyscraper", "office_tower", "apartment_complex", "hotel", "shopping_mall"]
-                    else:
-                        building_types = ["house", "tower", "mansion", "commercial", "apartment_building", "restaurant", "store"]
+            # Skip some blocks randomly for variety
+            if density_rolls[block_x][block_y] > building_density:
+                continue
+            
+            block_center_x = location[0] + (block_x - blocks/2) * block_size
+            block_center_y = location[1] + (block_y - blocks/2) * block_size
+            
+            # Randomly choose building type based on style and location
+            if architectural_style == "mixed":
+                # Central blocks get taller buildings
+                is_central = abs(block_x - blocks//2) <= 1 and abs(block_y - blocks//2) <= 1
+                if is_central and skyscraper_rolls[block_x][block_y] < skyscraper_chance:
+                    building_types = _CENTRAL_BUILDING_TYPES
                 else:
-                    building_types = [architectural_style] * 3 + ["commercial", "restaurant", "store"]
-                
-                building_type = random.choice(building_types)
-                
-                # Create building with variety
-                building_result = _create_town_building(
-                    building_type, 
-                    [block_center_x, block_center_y, location[2]],
-                    building_area,
-                    max_height,
-                    f"{name_prefix}_Building_{block_x}_{block_y}",
-                    building_count
-                )
-                
-                if building_result.get("status") == "success":
-                    all_spawned.extend(building_result.get("actors", []))
-                    building_count += 1
+                    building_types = _SUBURBAN_BUILDING_TYPES
+            
+            building_type = building_types[int(type_rolls[block_x][block_y] * len(building_types))]
+            
+            # Create building with variety
+            building_result = _create_town_building(
+                building_type, 
+                [block_center_x, block_center_y, location[2]],
+                building_area,
+                max_height,
+                f"{name_prefix}_Building_{block_x}_{block_y}",
+                building_count
+            )
+            
+            if building_result.get("status") == "success":
+                all_spawned.extend(building_result.get("actors", []))
+                building_count += 1
         
         # Add infrastructure if requested
         infrastructure_count = 0
@@ -1307,77 +1831,206 @@ def create_town(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+# Streamed castle builds keyed by job id; only the most recent MAX_CASTLE_JOBS are kept
+MAX_CASTLE_JOBS = 16
+_castle_jobs: Dict[str, Dict[str, Any]] = {}
+_castle_jobs_lock = threading.Lock()
+
+def _castle_stages(
+    castle_size: str,
+    include_siege_weapons: bool,
+    include_village: bool,
+    architectural_style: str
+) -> List[Tuple[str, Any, Tuple[Any, ...]]]:
+    """Castle builder helpers in build order, as (stage name, builder, extra builder args)."""
+    stages = [
+        ("outer_walls", build_outer_bailey_walls, ()),
+        ("inner_walls", build_inner_bailey_walls, ()),
+        ("gate_complex", build_gate_complex, ()),
+        ("corner_towers", build_corner_towers, (architectural_style,)),
+        ("inner_corner_towers", build_inner_corner_towers, ()),
+        ("intermediate_towers", build_intermediate_towers, ()),
+        ("central_keep", build_central_keep, ()),
+        ("courtyard", build_courtyard_complex, ()),
+        ("bailey_annexes", build_bailey_annexes, ())
+    ]
+    
+    # Add optional components
+    if include_siege_weapons:
+        stages.append(("siege_weapons", build_siege_weapons, ()))
+    
+    if include_village:
+        stages.append(("village", build_village_settlement, (castle_size,)))
+    
+    # Add final touches
+    stages.append(("drawbridge_and_moat", build_drawbridge_and_moat, ()))
+    stages.append(("flags", add_decorative_flags, ()))
+    return stages
+
+def _flush_castle_buffer(spawn_buffer: SpawnBuffer, castle_actors: List[Dict[str, Any]],
+                         instance_prefix: Optional[str]) -> Tuple[List[Dict[str, Any]], int]:
+    """Spawn a castle spawn buffer; returns the actors now in the level and the number of failed parts.
+    
+    With an instance_prefix, parts sharing a mesh become instances of one actor per mesh.
+    """
+    if instance_prefix is None:
+        failed = {id(actor) for actor in spawn_buffer.flush()}
+        return [actor for actor in castle_actors if id(actor) not in failed], len(failed)
+    holders, failed_parts = spawn_buffer.flush_instanced(instance_prefix)
+    failed = {id(actor) for actor in failed_parts}
+    standalone = [actor for actor in castle_actors if id(actor) not in failed and "instanced_in" not in actor]
+    return [holder["result"] for holder in holders] + standalone, len(failed)
+
+def _run_castle_job(unreal: UnrealConnection, job: Dict[str, Any],
+                    layouts: List[Tuple[str, SpawnBuffer, List[Dict[str, Any]]]],
+                    instance_prefix: Optional[str] = None) -> None:
+    """Spawn a laid-out castle one stage per batch, recording progress in the job as each lands."""
+    try:
+        with _viewport_realtime_paused(unreal):
+            for stage, spawn_buffer, stage_actors in layouts:
+                spawned, failed = _flush_castle_buffer(
+                    spawn_buffer, stage_actors, instance_prefix and f"{instance_prefix}_{stage}")
+                with _castle_jobs_lock:
+                    job["actors"].extend(spawned)
+                    job["failed"] += failed
+                    job["stages_done"] += 1
+                    job["progress"] = f"{stage}_done"
+        with _castle_jobs_lock:
+            job["status"] = "complete"
+        logger.info("Castle job %s complete: %d actors", job["job_id"], len(job["actors"]))
+    except Exception as e:
+        logger.error(f"Castle job {job['job_id']} error: {e}")
+        with _castle_jobs_lock:
+            job["status"] = "error"
+            job["message"] = str(e)
+
+@threaded_tool()
 def create_castle_fortress(
     castle_size: str = "large",  # "small", "medium", "large", "epic"
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "Castle",
     include_siege_weapons: bool = True,
     include_village: bool = True,
-    architectural_style: str = "medieval"  # "medieval", "fantasy", "gothic"
+    architectural_style: str = "medieval",  # "medieval", "fantasy", "gothic"
+    stream: bool = False,
+    use_instancing: bool = False
 ) -> Dict[str, Any]:
     """
     Create a massive castle fortress with walls, towers, courtyards, throne room,
     and surrounding village. Perfect for dramatic TikTok reveals showing
     the scale and detail of a complete medieval fortress.
+    
+    With stream=True the castle is spawned in the background one section at a time
+    (walls first, flags last) and a job_id is returned right away; poll castle_status
+    for progress and the actors spawned so far.
+    
+    With use_instancing=True all parts sharing a mesh are added as instances of one
+    hierarchical instanced static mesh actor per mesh, instead of one actor per part:
+    far fewer actors and draw calls, but parts can't be selected or moved individually.
     """
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
         
-        logger.info(f"Creating {castle_size} {architectural_style} castle fortress")
+        logger.info("Creating %s %s castle fortress", castle_size, architectural_style)
         all_actors = []
         
         # Get size parameters and calculate scaled dimensions
         params = get_castle_size_params(castle_size)
         dimensions = calculate_scaled_dimensions(params, scale_factor=2.0)
         
-        # Build castle components using helper functions
-        build_outer_bailey_walls(unreal, name_prefix, location, dimensions, all_actors)
-        build_inner_bailey_walls(unreal, name_prefix, location, dimensions, all_actors)
-        build_gate_complex(unreal, name_prefix, location, dimensions, all_actors)
-        build_corner_towers(unreal, name_prefix, location, dimensions, architectural_style, all_actors)
-        build_inner_corner_towers(unreal, name_prefix, location, dimensions, all_actors)
-        build_intermediate_towers(unreal, name_prefix, location, dimensions, all_actors)
-        build_central_keep(unreal, name_prefix, location, dimensions, all_actors)
-        build_courtyard_complex(unreal, name_prefix, location, dimensions, all_actors)
-        build_bailey_annexes(unreal, name_prefix, location, dimensions, all_actors)
+        wall_sections = (int(dimensions["outer_width"]/200) + int(dimensions["outer_depth"]/200)) * 2
+        stats = {
+            "size": castle_size,
+            "style": architectural_style,
+            "wall_sections": wall_sections,
+            "towers": dimensions["tower_count"],
+            "has_village": include_village,
+            "has_siege_weapons": include_siege_weapons
+        }
+        stages = _castle_stages(castle_size, include_siege_weapons, include_village, architectural_style)
+        
+        if stream:
+            # Lay out each stage in its own spawn buffer, so each can be flushed as soon as it is reached
+            layouts = []
+            for stage, builder, extra_args in stages:
+                spawn_buffer = SpawnBuffer(unreal)
+                stage_actors = []
+                builder(spawn_buffer, name_prefix, location, dimensions, *extra_args, stage_actors)
+                layouts.append((stage, spawn_buffer, stage_actors))
+            
+            job_id = uuid.uuid4().hex
+            job = {
+                "job_id": job_id,
+                "status": "running",
+                "progress": "started",
+                "stages": [stage for stage, _, _ in stages],
+                "stages_done": 0,
+                "expected_actors": sum(len(stage_actors) for _, _, stage_actors in layouts),
+                "failed": 0,
+                "actors": [],
+                "stats": stats
+            }
+            with _castle_jobs_lock:
+                _castle_jobs[job_id] = job
+                while len(_castle_jobs) > MAX_CASTLE_JOBS:
+                    del _castle_jobs[next(iter(_castle_jobs))]
+            instance_prefix = name_prefix if use_instancing else None
+            threading.Thread(target=_run_castle_job, args=(unreal, job, layouts, instance_prefix), daemon=True).start()
+            
+            return {
+                "success": True,
+                "message": f"Building {castle_size} {architectural_style} castle fortress in the background",
+                "job_id": job_id,
+                "progress": "started",
+                "stages": job["stages"],
+                "expected_actors": job["expected_actors"]
+            }
         
-        # Add optional components
-        if include_siege_weapons:
-            build_siege_weapons(unreal, name_prefix, location, dimensions, all_actors)
+        # Build castle components using helper functions. They queue their actors in a
+        # spawn buffer, which is flushed as batch commands once the whole castle is laid out.
+        spawn_buffer = SpawnBuffer(unreal)
+        for _, builder, extra_args in stages:
+            builder(spawn_buffer, name_prefix, location, dimensions, *extra_args, all_actors)
         
-        if include_village:
-            build_village_settlement(unreal, name_prefix, location, dimensions, castle_size, all_actors)
+        part_count = len(all_actors)
+        with _viewport_realtime_paused(unreal):
+            all_actors, failed = _flush_castle_buffer(spawn_buffer, all_actors, name_prefix if use_instancing else None)
+        if failed:
+            logger.warning(f"{failed} castle actors failed to spawn")
         
-        # Add final touches
-        build_drawbridge_and_moat(unreal, name_prefix, location, dimensions, all_actors)
-        add_decorative_flags(unreal, name_prefix, location, dimensions, all_actors)
+        logger.info("Castle fortress creation complete! Created %d actors", len(all_actors))
         
-        logger.info(f"Castle fortress creation complete! Created {len(all_actors)} actors")
-
+        stats["total_actors"] = len(all_actors)
+        if use_instancing:
+            stats["parts"] = part_count - failed
         
         return {
             "success": True,
             "message": f"Epic {castle_size} {architectural_style} castle fortress created with {len(all_actors)} elements!",
             "actors": all_actors,
-            "stats": {
-                "size": castle_size,
-                "style": architectural_style,
-                "wall_sections": int(dimensions["outer_width"]/200) * 2 + int(dimensions["outer_depth"]/200) * 2,
-                "towers": dimensions["tower_count"],
-                "has_village": include_village,
-                "has_siege_weapons": include_siege_weapons,
-                "total_actors": len(all_actors)
-            }
+            "stats": stats
         }
         
     except Exception as e:
         logger.error(f"create_castle_fortress error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
+def castle_status(job_id: str) -> Dict[str, Any]:
+    """Report the progress of a castle started with create_castle_fortress(stream=True),
+    including the actors spawned so far."""
+    with _castle_jobs_lock:
+        job = _castle_jobs.get(job_id)
+        if job is None:
+            return {"success": False, "message": f"Unknown castle job: {job_id}"}
+        status = {**job, "actors": list(job["actors"])}
+    status["success"] = status["status"] != "error"
+    status["stats"] = {**job["stats"], "total_actors": len(status["actors"])}
+    return status
+
+@threaded_tool()
 def create_suspension_bridge(
     span_length: float = 6000.0,
     deck_width: float = 800.0,
@@ -1419,31 +2072,27 @@ def create_suspension_bridge(
         Dictionary with success status, spawned actors, and performance metrics
     """
     try:
-        import time
         start_time = time.perf_counter()
         
-        unreal = get_unreal_connection()
-        if not unreal:
-            return {"success": False, "message": "Failed to connect to Unreal Engine"}
+        if module_size <= 0:
+            return {"success": False, "message": "module_size must be positive"}
         
-        logger.info(f"Creating suspension bridge: span={span_length}, width={deck_width}, height={tower_height}")
+        # Expected actor counts, for the dry run and the MAX_ACTORS check (no connection needed)
+        segment_counts = _counts_suspension(span_length, deck_width, module_size)
+        expected_towers = 10  # 2 towers with main, base, top, and 2 attachment points each
+        expected_deck = segment_counts.deck_x * segment_counts.deck_y
+        expected_cables = 2 * segment_counts.cable_segments  # 2 main cables
+        expected_suspenders = 2 * segment_counts.suspenders
+        expected_total = expected_towers + expected_deck + expected_cables + expected_suspenders
         
-        all_actors = []
-        
-        # Calculate expected actor counts for dry run
         if dry_run:
-            expected_towers = 10  # 2 towers with main, base, top, and 2 attachment points each
-            expected_deck = max(1, int(span_length / module_size)) * max(1, int(deck_width / module_size))
-            expected_cables = 2 * max(1, int(span_length / module_size))  # 2 main cables
-            expected_suspenders = 2 * max(1, int(span_length / (module_size * 3)))  # Every 3 modules
-            
             elapsed_ms = int((time.perf_counter() - start_time) * 1000)
             
             return {
                 "success": True,
                 "dry_run": True,
                 "metrics": {
-                    "total_actors": expected_towers + expected_deck + expected_cables + expected_suspenders,
+                    "total_actors": expected_total,
                     "deck_segments": expected_deck,
                     "cable_segments": expected_cables,
                     "suspender_count": expected_suspenders,
@@ -1455,29 +2104,45 @@ def create_suspension_bridge(
                 }
             }
         
+        if expected_total > MAX_ACTORS:
+            return {
+                "success": False,
+                "message": f"Would spawn {expected_total} actors, more than MAX_ACTORS ({MAX_ACTORS}). "
+                           f"Increase module_size or reduce span_length/deck_width."
+            }
+        
+        unreal = get_unreal_connection()
+        if not unreal:
+            return {"success": False, "message": "Failed to connect to Unreal Engine"}
+        
+        logger.info("Creating suspension bridge: span=%s, width=%s, height=%s", span_length, deck_width, tower_height)
+        
+        all_actors = []
+        
         # Build the bridge structure
-        counts = build_suspension_bridge_structure(
-            unreal,
-            span_length,
-            deck_width,
-            tower_height,
-            cable_sag_ratio,
-            module_size,
-            location,
-            orientation,
-            name_prefix,
-            deck_mesh,
-            tower_mesh,
-            cable_mesh,
-            suspender_mesh,
-            all_actors
-        )
+        with _viewport_realtime_paused(unreal):
+            counts = build_suspension_bridge_structure(
+                unreal,
+                span_length,
+                deck_width,
+                tower_height,
+                cable_sag_ratio,
+                module_size,
+                location,
+                orientation,
+                name_prefix,
+                deck_mesh,
+                tower_mesh,
+                cable_mesh,
+                suspender_mesh,
+                all_actors
+            )
         
         # Calculate metrics
         elapsed_ms = int((time.perf_counter() - start_time) * 1000)
         total_actors = sum(counts.values())
         
-        logger.info(f"Bridge construction complete: {total_actors} actors in {elapsed_ms}ms")
+        logger.info("Bridge construction complete: %d actors in %dms", total_actors, elapsed_ms)
         
         return {
             "success": True,
@@ -1500,7 +2165,7 @@ def create_suspension_bridge(
         logger.error(f"create_suspension_bridge error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_aqueduct(
     arches: int = 18,
     arch_radius: float = 600.0,
@@ -1542,43 +2207,34 @@ def create_aqueduct(
         Dictionary with success status, spawned actors, and performance metrics
     """
     try:
-        import time
         start_time = time.perf_counter()
         
-        unreal = get_unreal_connection()
-        if not unreal:
-            return {"success": False, "message": "Failed to connect to Unreal Engine"}
+        if module_size <= 0:
+            return {"success": False, "message": "module_size must be positive"}
         
-        logger.info(f"Creating aqueduct: {arches} arches, {tiers} tiers, radius={arch_radius}")
+        # Calculate dimensions
+        geometry = _aqueduct_geometry(arches, arch_radius, pier_width, deck_width, module_size)
+        total_length = geometry.total_length
         
-        all_actors = []
+        # Expected actor counts, for the dry run and the MAX_ACTORS check (no connection needed)
+        expected_arch_segments = tiers * arches * geometry.arch_segments
         
-        # Calculate dimensions
-        total_length = arches * (2 * arch_radius + pier_width) + pier_width
+        # Piers: (arches + 1) per tier
+        expected_piers = tiers * len(geometry.pier_offsets)
+        
+        # Deck segments including side walls
+        expected_deck = geometry.deck_length * geometry.deck_width
+        expected_deck += 2 * geometry.deck_length  # Side walls
+        expected_total = expected_arch_segments + expected_piers + expected_deck
         
-        # Calculate expected actor counts for dry run
         if dry_run:
-            # Arch segments per arch based on semicircle circumference
-            arch_circumference = math.pi * arch_radius
-            segments_per_arch = max(4, int(arch_circumference / module_size))
-            expected_arch_segments = tiers * arches * segments_per_arch
-            
-            # Piers: (arches + 1) per tier
-            expected_piers = tiers * (arches + 1)
-            
-            # Deck segments including side walls
-            deck_length_segments = max(1, int(total_length / module_size))
-            deck_width_segments = max(1, int(deck_width / module_size))
-            expected_deck = deck_length_segments * deck_width_segments
-            expected_deck += 2 * deck_length_segments  # Side walls
-            
             elapsed_ms = int((time.perf_counter() - start_time) * 1000)
             
             return {
                 "success": True,
                 "dry_run": True,
                 "metrics": {
-                    "total_actors": expected_arch_segments + expected_piers + expected_deck,
+                    "total_actors": expected_total,
                     "arch_segments": expected_arch_segments,
                     "pier_count": expected_piers,
                     "tiers": tiers,
@@ -1589,29 +2245,45 @@ def create_aqueduct(
                 }
             }
         
+        if expected_total > MAX_ACTORS:
+            return {
+                "success": False,
+                "message": f"Would spawn {expected_total} actors, more than MAX_ACTORS ({MAX_ACTORS}). "
+                           f"Increase module_size or reduce arches/tiers/arch_radius."
+            }
+        
+        unreal = get_unreal_connection()
+        if not unreal:
+            return {"success": False, "message": "Failed to connect to Unreal Engine"}
+        
+        logger.info("Creating aqueduct: %s arches, %s tiers, radius=%s", arches, tiers, arch_radius)
+        
+        all_actors = []
+        
         # Build the aqueduct structure
-        counts = build_aqueduct_structure(
-            unreal,
-            arches,
-            arch_radius,
-            pier_width,
-            tiers,
-            deck_width,
-            module_size,
-            location,
-            orientation,
-            name_prefix,
-            arch_mesh,
-            pier_mesh,
-            deck_mesh,
-            all_actors
-        )
+        with _viewport_realtime_paused(unreal):
+            counts = build_aqueduct_structure(
+                unreal,
+                arches,
+                arch_radius,
+                pier_width,
+                tiers,
+                deck_width,
+                module_size,
+                location,
+                orientation,
+                name_prefix,
+                arch_mesh,
+                pier_mesh,
+                deck_mesh,
+                all_actors
+            )
         
         # Calculate metrics
         elapsed_ms = int((time.perf_counter() - start_time) * 1000)
         total_actors = sum(counts.values())
         
-        logger.info(f"Aqueduct construction complete: {total_actors} actors in {elapsed_ms}ms")
+        logger.info("Aqueduct construction complete: %d actors in %dms", total_actors, elapsed_ms)
         
         return {
             "success": True,
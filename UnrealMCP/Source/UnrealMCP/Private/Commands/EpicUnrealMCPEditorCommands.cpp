@@ -16,11 +16,13 @@
 #include "Engine/SpotLight.h"
 #include "Camera/CameraActor.h"
 #include "Components/StaticMeshComponent.h"
+#include "Components/HierarchicalInstancedStaticMeshComponent.h"
 #include "EditorSubsystem.h"
 #include "Subsystems/EditorActorSubsystem.h"
 #include "Engine/Blueprint.h"
 #include "Engine/BlueprintGeneratedClass.h"
 #include "EditorAssetLibrary.h"
+#include "Misc/Base64.h"
 #include "Commands/EpicUnrealMCPBlueprintCommands.h"
 
 FEpicUnrealMCPEditorCommands::FEpicUnrealMCPEditorCommands()
@@ -42,6 +44,14 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleCommand(const FStrin
     {
         return HandleSpawnActor(Params);
     }
+    else if (CommandType == TEXT("spawn_actors_batch"))
+    {
+        return HandleSpawnActorsBatch(Params);
+    }
+    else if (CommandType == TEXT("batch_spawn_instances"))
+    {
+        return HandleBatchSpawnInstances(Params);
+    }
     else if (CommandType == TEXT("delete_actor"))
     {
         return HandleDeleteActor(Params);
@@ -55,6 +65,11 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleCommand(const FStrin
     {
         return HandleSpawnBlueprintActor(Params);
     }
+    // Viewport control
+    else if (CommandType == TEXT("set_viewport_realtime"))
+    {
+        return HandleSetViewportRealtime(Params);
+    }
     
     return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Unknown editor command: %s"), *CommandType));
 }
@@ -107,13 +122,6 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleFindActorsByName(con
 
 TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnActor(const TSharedPtr<FJsonObject>& Params)
 {
-    // Get required parameters
-    FString ActorType;
-    if (!Params->TryGetStringField(TEXT("type"), ActorType))
-    {
-        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'type' parameter"));
-    }
-
     // Get actor name (required parameter)
     FString ActorName;
     if (!Params->TryGetStringField(TEXT("name"), ActorName))
@@ -121,97 +129,384 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnActor(const TSh
         return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'name' parameter"));
     }
 
-    // Get optional transform parameters
-    FVector Location(0.0f, 0.0f, 0.0f);
-    FRotator Rotation(0.0f, 0.0f, 0.0f);
-    FVector Scale(1.0f, 1.0f, 1.0f);
+    UWorld* World = GEditor->GetEditorWorldContext().World();
+    if (!World)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
+    }
 
-    if (Params->HasField(TEXT("location")))
+    // Check if an actor with this name already exists
+    TArray<AActor*> AllActors;
+    UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
+    for (AActor* Actor : AllActors)
     {
-        Location = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("location"));
+        if (Actor && Actor->GetName() == ActorName)
+        {
+            return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
+        }
     }
-    if (Params->HasField(TEXT("rotation")))
+
+    return SpawnActorFromParams(World, Params, ActorName);
+}
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnActorsBatch(const TSharedPtr<FJsonObject>& Params)
+{
+    // Specs arrive either as an array of objects ("actors") or column-wise ("columns": one array per
+    // field, null where an actor leaves the field unset), which keeps field names out of every row
+    const TArray<TSharedPtr<FJsonValue>>* ActorSpecs = nullptr;
+    TArray<TSharedPtr<FJsonValue>> ColumnSpecs;
+    const TSharedPtr<FJsonObject>* Columns = nullptr;
+    if (Params->TryGetObjectField(TEXT("columns"), Columns) && (*Columns).IsValid())
     {
-        Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(Params, TEXT("rotation"));
+        for (const TPair<FString, TSharedPtr<FJsonValue>>& Column : (*Columns)->Values)
+        {
+            const TArray<TSharedPtr<FJsonValue>>* ColumnValues = nullptr;
+            if (!Column.Value.IsValid() || !Column.Value->TryGetArray(ColumnValues))
+            {
+                return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Column '%s' must be an array"), *Column.Key));
+            }
+            while (ColumnSpecs.Num() < ColumnValues->Num())
+            {
+                ColumnSpecs.Add(MakeShared<FJsonValueObject>(MakeShared<FJsonObject>()));
+            }
+            for (int32 Index = 0; Index < ColumnValues->Num(); ++Index)
+            {
+                const TSharedPtr<FJsonValue>& Value = (*ColumnValues)[Index];
+                if (Value.IsValid() && !Value->IsNull())
+                {
+                    ColumnSpecs[Index]->AsObject()->Values.Add(Column.Key, Value);
+                }
+            }
+        }
+        ActorSpecs = &ColumnSpecs;
     }
-    if (Params->HasField(TEXT("scale")))
+    else if (!Params->TryGetArrayField(TEXT("actors"), ActorSpecs))
     {
-        Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("scale"));
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'actors' or 'columns' parameter"));
     }
 
-    // Create the actor based on type
-    AActor* NewActor = nullptr;
-    UWorld* World = GEditor->GetEditorWorldContext().World();
+    // When set, name collisions get a numeric suffix instead of failing
+    bool bUniqueNames = false;
+    Params->TryGetBoolField(TEXT("unique_names"), bUniqueNames);
 
+    // Optional fields shared by every spec (e.g. type, scale, static_mesh); specs override them
+    const TSharedPtr<FJsonObject>* Defaults = nullptr;
+    Params->TryGetObjectField(TEXT("defaults"), Defaults);
+
+    // Optional prefix common to every name in the batch, sent once instead of in each spec
+    FString NamePrefix;
+    Params->TryGetStringField(TEXT("name_prefix"), NamePrefix);
+
+    UWorld* World = GEditor->GetEditorWorldContext().World();
     if (!World)
     {
         return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
     }
 
-    // Check if an actor with this name already exists
+    // Collect existing names once instead of scanning the level for every actor
+    TSet<FString> ExistingNames;
     TArray<AActor*> AllActors;
     UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
     for (AActor* Actor : AllActors)
     {
-        if (Actor && Actor->GetName() == ActorName)
+        if (Actor)
         {
-            return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
+            ExistingNames.Add(Actor->GetName());
         }
     }
 
-    FActorSpawnParameters SpawnParams;
-    SpawnParams.Name = *ActorName;
-
-    if (ActorType == TEXT("StaticMeshActor"))
+    TArray<TSharedPtr<FJsonValue>> Results;
+    Results.Reserve(ActorSpecs->Num());
+    // A batch usually repeats a handful of meshes, so each is loaded once for the whole batch
+    TMap<FString, UStaticMesh*> MeshCache;
+    int32 SpawnedCount = 0;
+    for (const TSharedPtr<FJsonValue>& SpecValue : *ActorSpecs)
     {
-        AStaticMeshActor* NewMeshActor = World->SpawnActor<AStaticMeshActor>(AStaticMeshActor::StaticClass(), Location, Rotation, SpawnParams);
-        if (NewMeshActor)
+        const TSharedPtr<FJsonObject>* SpecObject = nullptr;
+        if (!SpecValue.IsValid() || !SpecValue->TryGetObject(SpecObject))
+        {
+            Results.Add(MakeShared<FJsonValueObject>(FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Actor spec must be an object"))));
+            continue;
+        }
+        // Defaults fill in the fields the spec leaves unset. The specs belong to this request, so
+        // they are completed in place rather than copied into a merged object for every actor
+        const TSharedPtr<FJsonObject>& Spec = *SpecObject;
+        if (Defaults && (*Defaults).IsValid())
         {
-            // Check for an optional static_mesh parameter to assign a mesh
-            FString MeshPath;
-            if (Params->TryGetStringField(TEXT("static_mesh"), MeshPath))
+            for (const TPair<FString, TSharedPtr<FJsonValue>>& Field : (*Defaults)->Values)
             {
-                UStaticMesh* Mesh = Cast<UStaticMesh>(UEditorAssetLibrary::LoadAsset(MeshPath));
-                if (Mesh)
+                if (!Spec->Values.Contains(Field.Key))
                 {
-                    NewMeshActor->GetStaticMeshComponent()->SetStaticMesh(Mesh);
-                }
-                else
-                {
-                    UE_LOG(LogTemp, Warning, TEXT("Could not find static mesh at path: %s"), *MeshPath);
+                    Spec->Values.Add(Field.Key, Field.Value);
                 }
             }
         }
-        NewActor = NewMeshActor;
+
+        FString ActorName;
+        if (!Spec->TryGetStringField(TEXT("name"), ActorName))
+        {
+            Results.Add(MakeShared<FJsonValueObject>(FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'name' parameter"))));
+            continue;
+        }
+        ActorName = NamePrefix + ActorName;
+
+        if (ExistingNames.Contains(ActorName))
+        {
+            if (!bUniqueNames)
+            {
+                TSharedPtr<FJsonObject> ErrorObj = FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
+                ErrorObj->SetStringField(TEXT("name"), ActorName);
+                Results.Add(MakeShared<FJsonValueObject>(ErrorObj));
+                continue;
+            }
+
+            const FString BaseName = ActorName;
+            int32 Suffix = 1;
+            do
+            {
+                ActorName = FString::Printf(TEXT("%s_%d"), *BaseName, Suffix++);
+            } while (ExistingNames.Contains(ActorName));
+        }
+
+        TSharedPtr<FJsonObject> Result = SpawnActorFromParams(World, Spec, ActorName, &MeshCache);
+        bool bSuccess = true;
+        if (Result->TryGetBoolField(TEXT("success"), bSuccess) && !bSuccess)
+        {
+            Result->SetStringField(TEXT("name"), ActorName);
+        }
+        else
+        {
+            ExistingNames.Add(ActorName);
+            SpawnedCount++;
+        }
+        Results.Add(MakeShared<FJsonValueObject>(Result));
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetArrayField(TEXT("actors"), Results);
+    ResultObj->SetNumberField(TEXT("spawned"), SpawnedCount);
+    ResultObj->SetNumberField(TEXT("failed"), Results.Num() - SpawnedCount);
+    return ResultObj;
+}
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleBatchSpawnInstances(const TSharedPtr<FJsonObject>& Params)
+{
+    FString ActorName;
+    if (!Params->TryGetStringField(TEXT("name"), ActorName))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'name' parameter"));
+    }
+
+    FString MeshPath;
+    if (!Params->TryGetStringField(TEXT("static_mesh"), MeshPath))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'static_mesh' parameter"));
+    }
+
+    // One [x, y, z, pitch, yaw, roll, scale_x, scale_y, scale_z] row per instance, in world space, either as
+    // "transforms" rows or as "transforms_packed": the same nine values per instance as base64 little-endian float32
+    const TArray<TSharedPtr<FJsonValue>>* TransformRows = nullptr;
+    FString PackedTransforms;
+    const bool bPacked = Params->TryGetStringField(TEXT("transforms_packed"), PackedTransforms);
+    if (!bPacked && !Params->TryGetArrayField(TEXT("transforms"), TransformRows))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'transforms' parameter"));
+    }
+
+    bool bUniqueNames = false;
+    Params->TryGetBoolField(TEXT("unique_names"), bUniqueNames);
+
+    UWorld* World = GEditor->GetEditorWorldContext().World();
+    if (!World)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
+    }
+
+    UStaticMesh* Mesh = Cast<UStaticMesh>(UEditorAssetLibrary::LoadAsset(MeshPath));
+    if (!Mesh)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Could not find static mesh at path: %s"), *MeshPath));
+    }
+
+    TArray<FTransform> Transforms;
+    if (bPacked)
+    {
+        constexpr int32 RowBytes = 9 * sizeof(float);
+        TArray<uint8> Bytes;
+        if (!FBase64::Decode(PackedTransforms, Bytes) || Bytes.Num() % RowBytes != 0)
+        {
+            return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("'transforms_packed' must be base64 of 9 float32 values per instance"));
+        }
+        Transforms.Reserve(Bytes.Num() / RowBytes);
+        for (int32 Offset = 0; Offset < Bytes.Num(); Offset += RowBytes)
+        {
+            float Row[9];
+            FMemory::Memcpy(Row, Bytes.GetData() + Offset, RowBytes);
+            Transforms.Add(FTransform(FRotator(Row[3], Row[4], Row[5]), FVector(Row[0], Row[1], Row[2]), FVector(Row[6], Row[7], Row[8])));
+        }
+    }
+    else
+    {
+        Transforms.Reserve(TransformRows->Num());
+        for (const TSharedPtr<FJsonValue>& RowValue : *TransformRows)
+        {
+            const TArray<TSharedPtr<FJsonValue>>* Row = nullptr;
+            if (!RowValue.IsValid() || !RowValue->TryGetArray(Row) || Row->Num() != 9)
+            {
+                return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Each transform must be 9 numbers: location, rotation, scale"));
+            }
+            const FVector Location((*Row)[0]->AsNumber(), (*Row)[1]->AsNumber(), (*Row)[2]->AsNumber());
+            const FRotator Rotation((*Row)[3]->AsNumber(), (*Row)[4]->AsNumber(), (*Row)[5]->AsNumber());
+            const FVector Scale((*Row)[6]->AsNumber(), (*Row)[7]->AsNumber(), (*Row)[8]->AsNumber());
+            Transforms.Add(FTransform(Rotation, Location, Scale));
+        }
+    }
+
+    TSet<FString> ExistingNames;
+    TArray<AActor*> AllActors;
+    UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
+    for (AActor* Actor : AllActors)
+    {
+        if (Actor)
+        {
+            ExistingNames.Add(Actor->GetName());
+        }
+    }
+    if (ExistingNames.Contains(ActorName))
+    {
+        if (!bUniqueNames)
+        {
+            return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
+        }
+        const FString BaseName = ActorName;
+        int32 Suffix = 1;
+        do
+        {
+            ActorName = FString::Printf(TEXT("%s_%d"), *BaseName, Suffix++);
+        } while (ExistingNames.Contains(ActorName));
+    }
+
+    // A plain actor at the origin holding every instance in one hierarchical instanced component,
+    // so N identical meshes cost one actor and are drawn with instancing
+    FActorSpawnParameters SpawnParams;
+    SpawnParams.Name = *ActorName;
+    AActor* NewActor = World->SpawnActor<AActor>(AActor::StaticClass(), FTransform::Identity, SpawnParams);
+    if (!NewActor)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to create actor"));
+    }
+
+    UHierarchicalInstancedStaticMeshComponent* Instances = NewObject<UHierarchicalInstancedStaticMeshComponent>(NewActor, TEXT("Instances"));
+    Instances->SetMobility(EComponentMobility::Static);
+    Instances->SetStaticMesh(Mesh);
+    NewActor->SetRootComponent(Instances);
+    NewActor->AddInstanceComponent(Instances);
+    Instances->RegisterComponent();
+    Instances->AddInstances(Transforms, false, true);
+    NewActor->SetActorLabel(ActorName);
+
+    TSharedPtr<FJsonObject> ResultObj = FEpicUnrealMCPCommonUtils::ActorToJsonObject(NewActor, true);
+    ResultObj->SetStringField(TEXT("static_mesh"), MeshPath);
+    ResultObj->SetNumberField(TEXT("instances"), Transforms.Num());
+    return ResultObj;
+}
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::SpawnActorFromParams(UWorld* World, const TSharedPtr<FJsonObject>& Params, const FString& ActorName,
+                                                                          TMap<FString, UStaticMesh*>* MeshCache)
+{
+    // Get required parameters
+    FString ActorType;
+    if (!Params->TryGetStringField(TEXT("type"), ActorType))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'type' parameter"));
+    }
+
+    // Get optional transform parameters
+    FVector Location(0.0f, 0.0f, 0.0f);
+    FRotator Rotation(0.0f, 0.0f, 0.0f);
+    FVector Scale(1.0f, 1.0f, 1.0f);
+
+    if (Params->HasField(TEXT("location")))
+    {
+        Location = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("location"));
+    }
+    if (Params->HasField(TEXT("rotation")))
+    {
+        Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(Params, TEXT("rotation"));
+    }
+    if (Params->HasField(TEXT("scale")))
+    {
+        Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("scale"));
+    }
+
+    // Pick the class to spawn based on type
+    UClass* ActorClass = nullptr;
+    if (ActorType == TEXT("StaticMeshActor"))
+    {
+        ActorClass = AStaticMeshActor::StaticClass();
     }
     else if (ActorType == TEXT("PointLight"))
     {
-        NewActor = World->SpawnActor<APointLight>(APointLight::StaticClass(), Location, Rotation, SpawnParams);
+        ActorClass = APointLight::StaticClass();
     }
     else if (ActorType == TEXT("SpotLight"))
     {
-        NewActor = World->SpawnActor<ASpotLight>(ASpotLight::StaticClass(), Location, Rotation, SpawnParams);
+        ActorClass = ASpotLight::StaticClass();
     }
     else if (ActorType == TEXT("DirectionalLight"))
     {
-        NewActor = World->SpawnActor<ADirectionalLight>(ADirectionalLight::StaticClass(), Location, Rotation, SpawnParams);
+        ActorClass = ADirectionalLight::StaticClass();
     }
     else if (ActorType == TEXT("CameraActor"))
     {
-        NewActor = World->SpawnActor<ACameraActor>(ACameraActor::StaticClass(), Location, Rotation, SpawnParams);
+        ActorClass = ACameraActor::StaticClass();
     }
     else
     {
         return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Unknown actor type: %s"), *ActorType));
     }
 
-    if (NewActor)
+    FActorSpawnParameters SpawnParams;
+    SpawnParams.Name = *ActorName;
+
+    // Spawn with the full transform, scale included, so the components are placed once
+    const FTransform SpawnTransform(Rotation, Location, Scale);
+    AActor* NewActor = World->SpawnActor(ActorClass, &SpawnTransform, SpawnParams);
+
+    if (AStaticMeshActor* NewMeshActor = Cast<AStaticMeshActor>(NewActor))
     {
-        // Set scale (since SpawnActor only takes location and rotation)
-        FTransform Transform = NewActor->GetTransform();
-        Transform.SetScale3D(Scale);
-        NewActor->SetActorTransform(Transform);
+        // Check for an optional static_mesh parameter to assign a mesh
+        FString MeshPath;
+        if (Params->TryGetStringField(TEXT("static_mesh"), MeshPath))
+        {
+            UStaticMesh* Mesh = nullptr;
+            UStaticMesh** CachedMesh = MeshCache ? MeshCache->Find(MeshPath) : nullptr;
+            if (CachedMesh)
+            {
+                Mesh = *CachedMesh;
+            }
+            else
+            {
+                Mesh = Cast<UStaticMesh>(UEditorAssetLibrary::LoadAsset(MeshPath));
+                if (MeshCache)
+                {
+                    MeshCache->Add(MeshPath, Mesh);
+                }
+            }
+
+            if (Mesh)
+            {
+                NewMeshActor->GetStaticMeshComponent()->SetStaticMesh(Mesh);
+            }
+            else
+            {
+                UE_LOG(LogTemp, Warning, TEXT("Could not find static mesh at path: %s"), *MeshPath);
+            }
+        }
+    }
 
+    if (NewActor)
+    {
         // Return the created actor's details
         return FEpicUnrealMCPCommonUtils::ActorToJsonObject(NewActor, true);
     }
@@ -306,3 +601,42 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnBlueprintActor(
     FEpicUnrealMCPBlueprintCommands BlueprintCommands;
     return BlueprintCommands.HandleCommand(TEXT("spawn_blueprint_actor"), Params);
 }
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSetViewportRealtime(const TSharedPtr<FJsonObject>& Params)
+{
+    bool bEnabled = true;
+    Params->TryGetBoolField(TEXT("enabled"), bEnabled);
+
+    if (!GEditor)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Editor is not available"));
+    }
+
+    // Disabling pushes a realtime override on every level viewport; enabling pops it again,
+    // so each viewport returns to whatever realtime setting the user had before
+    const FText OverrideName = FText::FromString(TEXT("UnrealMCP Bulk Build"));
+    int32 ViewportCount = 0;
+    for (FLevelEditorViewportClient* ViewportClient : GEditor->GetLevelViewportClients())
+    {
+        if (!ViewportClient)
+        {
+            continue;
+        }
+
+        if (bEnabled)
+        {
+            ViewportClient->RemoveRealtimeOverride(OverrideName, false);
+        }
+        else
+        {
+            ViewportClient->AddRealtimeOverride(false, OverrideName);
+        }
+        ViewportClient->Invalidate();
+        ++ViewportCount;
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetBoolField(TEXT("enabled"), bEnabled);
+    ResultObj->SetNumberField(TEXT("viewports"), ViewportCount);
+    return ResultObj;
+}
@@ -193,12 +193,23 @@ void UEpicUnrealMCPBridge::StopServer()
 
 // Execute a command received from a client
 FString UEpicUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params)
+{
+    TSharedPtr<FJsonObject> ResponseJson = ExecuteCommandJson(CommandType, Params);
+
+    FString ResultString;
+    TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
+    FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
+    return ResultString;
+}
+
+// Execute a command and return the response object (serialized by the caller in the client's wire format)
+TSharedPtr<FJsonObject> UEpicUnrealMCPBridge::ExecuteCommandJson(const FString& CommandType, const TSharedPtr<FJsonObject>& Params)
 {
     UE_LOG(LogTemp, Display, TEXT("EpicUnrealMCPBridge: Executing command: %s"), *CommandType);
     
     // Create a promise to wait for the result
-    TPromise<FString> Promise;
-    TFuture<FString> Future = Promise.GetFuture();
+    TPromise<TSharedPtr<FJsonObject>> Promise;
+    TFuture<TSharedPtr<FJsonObject>> Future = Promise.GetFuture();
     
     // Queue execution on Game Thread
     AsyncTask(ENamedThreads::GameThread, [this, CommandType, Params, Promise = MoveTemp(Promise)]() mutable
@@ -218,9 +229,12 @@ FString UEpicUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const T
             else if (CommandType == TEXT("get_actors_in_level") || 
                      CommandType == TEXT("find_actors_by_name") ||
                      CommandType == TEXT("spawn_actor") ||
+                     CommandType == TEXT("spawn_actors_batch") ||
+                     CommandType == TEXT("batch_spawn_instances") ||
                      CommandType == TEXT("delete_actor") || 
                      CommandType == TEXT("set_actor_transform") ||
-                     CommandType == TEXT("spawn_blueprint_actor"))
+                     CommandType == TEXT("spawn_blueprint_actor") ||
+                     CommandType == TEXT("set_viewport_realtime"))
             {
                 ResultJson = EditorCommands->HandleCommand(CommandType, Params);
             }
@@ -231,6 +245,7 @@ FString UEpicUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const T
                      CommandType == TEXT("compile_blueprint") ||
                      CommandType == TEXT("set_static_mesh_properties") ||
                      CommandType == TEXT("set_mesh_material_color") ||
+                     CommandType == TEXT("create_physics_blueprint") ||
                      CommandType == TEXT("get_available_materials") ||
                      CommandType == TEXT("apply_material_to_actor") ||
                      CommandType == TEXT("apply_material_to_blueprint") ||
@@ -244,11 +259,7 @@ FString UEpicUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const T
             {
                 ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
                 ResponseJson->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown command: %s"), *CommandType));
-                
-                FString ResultString;
-                TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-                FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-                Promise.SetValue(ResultString);
+                Promise.SetValue(ResponseJson);
                 return;
             }
             
@@ -284,10 +295,7 @@ FString UEpicUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const T
             ResponseJson->SetStringField(TEXT("error"), UTF8_TO_TCHAR(e.what()));
         }
         
-        FString ResultString;
-        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-        Promise.SetValue(ResultString);
+        Promise.SetValue(ResponseJson);
     });
     
     return Future.Get();
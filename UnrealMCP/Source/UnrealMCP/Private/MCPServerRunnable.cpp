@@ -1,5 +1,6 @@
 #include "MCPServerRunnable.h"
 #include "EpicUnrealMCPBridge.h"
+#include "MCPMsgPack.h"
 #include "Sockets.h"
 #include "SocketSubsystem.h"
 #include "Interfaces/IPv4/IPv4Address.h"
@@ -49,92 +50,95 @@ uint32 FMCPServerRunnable::Run()
                 
                 // Set socket options to improve connection stability
                 ClientSocket->SetNoDelay(true);
-                int32 SocketBufferSize = 65536;  // 64KB buffer
+                int32 SocketBufferSize = 4 * 1024 * 1024;  // 4MB buffer for large batch payloads
                 ClientSocket->SetSendBufferSize(SocketBufferSize, SocketBufferSize);
                 ClientSocket->SetReceiveBufferSize(SocketBufferSize, SocketBufferSize);
                 
-                uint8 Buffer[8192];
                 while (bRunning)
                 {
-                    int32 BytesRead = 0;
-                    if (ClientSocket->Recv(Buffer, sizeof(Buffer) - 1, BytesRead))
+                    // Each message is a 4-byte big-endian length prefix followed by a JSON or MessagePack payload
+                    TArray<uint8> Payload;
+                    if (!ReceiveMessage(ClientSocket, Payload))
                     {
-                        if (BytesRead == 0)
-                        {
-                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected (zero bytes)"));
-                            break;
-                        }
+                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected"));
+                        break;
+                    }
+
+                    // Replies use the same wire format as the request
+                    const bool bMsgPack = FMCPMsgPack::IsMsgPackPayload(Payload.GetData(), Payload.Num());
+
+                    // Parse command
+                    TSharedPtr<FJsonObject> JsonObject;
+                    bool bParsed = false;
+                    if (bMsgPack)
+                    {
+                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received MessagePack command (%d bytes)"), Payload.Num());
+                        bParsed = FMCPMsgPack::Decode(Payload.GetData(), Payload.Num(), JsonObject);
+                    }
+                    else
+                    {
+                        FUTF8ToTCHAR Converter(reinterpret_cast<const ANSICHAR*>(Payload.GetData()), Payload.Num());
+                        FString ReceivedText(Converter.Length(), Converter.Get());
+                        // Batch commands run to megabytes, so the full text is only logged at Verbose
+                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received JSON command (%d bytes)"), Payload.Num());
+                        UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
 
-                        // Convert received data to string
-                        Buffer[BytesRead] = '\0';
-                        FString ReceivedText = UTF8_TO_TCHAR(Buffer);
-                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
+                        // The reader takes the text over rather than copying it
+                        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(MoveTemp(ReceivedText));
+                        bParsed = FJsonSerializer::Deserialize(Reader, JsonObject) && JsonObject.IsValid();
+                    }
 
-                        // Parse JSON
-                        TSharedPtr<FJsonObject> JsonObject;
-                        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
-                        
-                        if (FJsonSerializer::Deserialize(Reader, JsonObject))
+                    TSharedPtr<FJsonObject> ResponseJson;
+                    if (bParsed)
+                    {
+                        // Get command type
+                        FString CommandType;
+                        if (JsonObject->TryGetStringField(TEXT("type"), CommandType))
                         {
-                            // Get command type
-                            FString CommandType;
-                            if (JsonObject->TryGetStringField(TEXT("type"), CommandType))
-                            {
-                                // Execute command
-                                FString Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
-                                
-                                // Log response for debugging
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
-                                
-                                // Send response
-                                int32 BytesSent = 0;
-                                if (!ClientSocket->Send((uint8*)TCHAR_TO_UTF8(*Response), Response.Len(), BytesSent))
-                                {
-                                    UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to send response"));
-                                }
-                                else {
-                                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully, bytes: %d"), BytesSent);
-                                }
-                            }
-                            else
-                            {
-                                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command"));
-                            }
+                            // Execute command
+                            const TSharedPtr<FJsonObject>* ParamsObject = nullptr;
+                            TSharedPtr<FJsonObject> Params = JsonObject->TryGetObjectField(TEXT("params"), ParamsObject)
+                                ? *ParamsObject : MakeShareable(new FJsonObject());
+                            ResponseJson = Bridge->ExecuteCommandJson(CommandType, Params);
                         }
                         else
                         {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to parse JSON from: %s"), *ReceivedText);
+                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command"));
+                            ResponseJson = MakeErrorResponse(TEXT("Missing 'type' field in command"));
                         }
                     }
                     else
                     {
-                        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
-                        // Don't break the connection for WouldBlock error, which is normal for non-blocking sockets
-                        bool bShouldBreak = true;
-                        
-                        // Check for "would block" error which isn't a real error for non-blocking sockets
-                        if (LastError == SE_EWOULDBLOCK) 
-                        {
-                            UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Socket would block, continuing..."));
-                            bShouldBreak = false;
-                            // Small sleep to prevent tight loop when no data
-                            FPlatformProcess::Sleep(0.01f);
-                        }
-                        // Check for other transient errors we might want to tolerate
-                        else if (LastError == SE_EINTR) // Interrupted system call
-                        {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Socket read interrupted, continuing..."));
-                            bShouldBreak = false;
-                        }
-                        else 
-                        {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
-                        }
-                        
-                        if (bShouldBreak)
-                        {
-                            break;
-                        }
+                        UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to parse command (%d bytes)"), Payload.Num());
+                        ResponseJson = MakeErrorResponse(TEXT("Failed to parse command"));
+                    }
+
+                    // Send response (always, so the client never waits on a dropped message). The payload is
+                    // written after room for the length prefix, so the frame is sent without copying it
+                    TArray<uint8> ResponsePayload;
+                    ResponsePayload.AddUninitialized(FrameHeaderSize);
+                    if (bMsgPack)
+                    {
+                        FMCPMsgPack::Encode(ResponseJson, ResponsePayload);
+                    }
+                    else
+                    {
+                        FString Response;
+                        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&Response);
+                        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
+
+                        // Log response for debugging
+                        UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
+
+                        // Length is the UTF-8 byte count, not the character count
+                        FTCHARToUTF8 ResponseUtf8(*Response);
+                        ResponsePayload.Append(reinterpret_cast<const uint8*>(ResponseUtf8.Get()), ResponseUtf8.Length());
+                    }
+
+                    if (!SendMessage(ClientSocket, ResponsePayload))
+                    {
+                        UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to send response"));
+                        break;
                     }
                 }
             }
@@ -161,6 +165,103 @@ void FMCPServerRunnable::Exit()
 {
 }
 
+TSharedPtr<FJsonObject> FMCPServerRunnable::MakeErrorResponse(const FString& ErrorMessage)
+{
+    TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+    ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+    ResponseJson->SetStringField(TEXT("error"), ErrorMessage);
+    return ResponseJson;
+}
+
+bool FMCPServerRunnable::ReceiveExact(TSharedPtr<FSocket> Socket, uint8* Data, int32 Length)
+{
+    int32 Offset = 0;
+    while (Offset < Length && bRunning)
+    {
+        int32 BytesRead = 0;
+        if (Socket->Recv(Data + Offset, Length - Offset, BytesRead))
+        {
+            if (BytesRead == 0)
+            {
+                // Peer closed the connection
+                return false;
+            }
+            Offset += BytesRead;
+            continue;
+        }
+
+        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+        // "Would block" isn't a real error for non-blocking sockets
+        if (LastError == SE_EWOULDBLOCK)
+        {
+            // Small sleep to prevent tight loop when no data
+            FPlatformProcess::Sleep(0.001f);
+        }
+        else if (LastError != SE_EINTR) // Interrupted system call is transient
+        {
+            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
+            return false;
+        }
+    }
+    return Offset == Length;
+}
+
+bool FMCPServerRunnable::SendAll(TSharedPtr<FSocket> Socket, const uint8* Data, int32 Length)
+{
+    int32 Offset = 0;
+    while (Offset < Length && bRunning)
+    {
+        int32 BytesSent = 0;
+        if (Socket->Send(Data + Offset, Length - Offset, BytesSent))
+        {
+            Offset += BytesSent;
+            continue;
+        }
+
+        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+        if (LastError == SE_EWOULDBLOCK)
+        {
+            FPlatformProcess::Sleep(0.001f);
+        }
+        else if (LastError != SE_EINTR)
+        {
+            return false;
+        }
+    }
+    return Offset == Length;
+}
+
+bool FMCPServerRunnable::ReceiveMessage(TSharedPtr<FSocket> Socket, TArray<uint8>& OutPayload)
+{
+    uint8 Header[FrameHeaderSize];
+    if (!ReceiveExact(Socket, Header, FrameHeaderSize))
+    {
+        return false;
+    }
+
+    const uint32 Length = ((uint32)Header[0] << 24) | ((uint32)Header[1] << 16) | ((uint32)Header[2] << 8) | (uint32)Header[3];
+    if (Length > (uint32)MaxMessageSize)
+    {
+        UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Message length %u exceeds limit, dropping client"), Length);
+        return false;
+    }
+
+    OutPayload.SetNumUninitialized(Length);
+    return Length == 0 || ReceiveExact(Socket, OutPayload.GetData(), Length);
+}
+
+bool FMCPServerRunnable::SendMessage(TSharedPtr<FSocket> Socket, TArray<uint8>& Frame)
+{
+    const uint32 Length = (uint32)(Frame.Num() - FrameHeaderSize);
+
+    Frame[0] = (Length >> 24) & 0xFF;
+    Frame[1] = (Length >> 16) & 0xFF;
+    Frame[2] = (Length >> 8) & 0xFF;
+    Frame[3] = Length & 0xFF;
+
+    return SendAll(Socket, Frame.GetData(), Frame.Num());
+}
+
 void FMCPServerRunnable::HandleClientConnection(TSharedPtr<FSocket> InClientSocket)
 {
     if (!InClientSocket.IsValid())